@@ -42,23 +42,23 @@ def _make_service(config_dir: Path, data_dir: Path = DEFAULT_DATA) -> GenesisSer
 
 
 def cmd_status(args: argparse.Namespace) -> int:
-    service = _make_service(args.config)
-    status = service.status()
+    with _make_service(args.config, args.data) as service:
+        status = service.status()
     print(json.dumps(status, indent=2))
     return 0
 
 
 def cmd_register_actor(args: argparse.Namespace) -> int:
-    service = _make_service(args.config)
-    result = service.register_actor(
-        actor_id=args.id,
-        actor_kind=ActorKind(args.kind),
-        region=args.region,
-        organization=args.org,
-        model_family=args.family or ("human_reviewer" if args.kind == "human" else "unknown"),
-        method_type=args.method or ("human_reviewer" if args.kind == "human" else "unknown"),
-        initial_trust=args.trust,
-    )
+    with _make_service(args.config, args.data) as service:
+        result = service.register_actor(
+            actor_id=args.id,
+            actor_kind=ActorKind(args.kind),
+            region=args.region,
+            organization=args.org,
+            model_family=args.family or ("human_reviewer" if args.kind == "human" else "unknown"),
+            method_type=args.method or ("human_reviewer" if args.kind == "human" else "unknown"),
+            initial_trust=args.trust,
+        )
     if result.success:
         print(f"Registered actor: {result.data['actor_id']}")
         return 0
@@ -67,14 +67,14 @@ def cmd_register_actor(args: argparse.Namespace) -> int:
 
 
 def cmd_create_mission(args: argparse.Namespace) -> int:
-    service = _make_service(args.config)
-    result = service.create_mission(
-        mission_id=args.id,
-        title=args.title,
-        mission_class=MissionClass(args.mission_class),
-        domain_type=DomainType(args.domain),
-        worker_id=args.worker,
-    )
+    with _make_service(args.config, args.data) as service:
+        result = service.create_mission(
+            mission_id=args.id,
+            title=args.title,
+            mission_class=MissionClass(args.mission_class),
+            domain_type=DomainType(args.domain),
+            worker_id=args.worker,
+        )
     if result.success:
         print(f"Created mission: {result.data['mission_id']} (tier: {result.data['risk_tier']})")
         return 0
@@ -102,6 +102,12 @@ def build_parser() -> argparse.ArgumentParser:
         default=DEFAULT_CONFIG,
         help="Path to config directory (default: config/)",
     )
+    parser.add_argument(
+        "--data",
+        type=Path,
+        default=DEFAULT_DATA,
+        help="Path to data directory (default: data/)",
+    )
     sub = parser.add_subparsers(dest="command")
 
     # status
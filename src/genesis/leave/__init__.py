@@ -1,5 +1,5 @@
 """Protected leave subsystem — quorum-adjudicated trust freeze for life events."""
 
-from genesis.leave.engine import LeaveAdjudicationEngine
+from genesis.leave.engine import ActorLeaveIndex, LeaveAdjudicationEngine
 
-__all__ = ["LeaveAdjudicationEngine"]
+__all__ = ["ActorLeaveIndex", "LeaveAdjudicationEngine"]
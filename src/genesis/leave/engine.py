@@ -14,9 +14,12 @@ Constitutional invariants:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta, timezone
-from typing import Optional
+import sys
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Iterable, Mapping, Optional, Sequence, Union
 
 from genesis.models.leave import (
     AdjudicationVerdict,
@@ -28,17 +31,76 @@ from genesis.models.leave import (
 from genesis.models.trust import ActorKind, TrustRecord
 from genesis.models.domain_trust import DomainTrustScore
 from genesis.review.roster import ActorStatus, RosterEntry
-from genesis.policy.resolver import PolicyResolver
+from genesis.policy.resolver import LeaveAdjudicationPolicy, PolicyResolver
+
+# Leave states whose end starts the cooldown before another request.
+_COOLDOWN_STATES: frozenset[LeaveState] = frozenset({
+    LeaveState.RETURNED, LeaveState.MEMORIALISED,
+    LeaveState.ACTIVE, LeaveState.APPROVED,
+})
+
+# Window for the max-leaves-per-year check, in seconds.
+_ONE_YEAR_SECONDS = 365 * 86400.0
 
 
 @dataclass(frozen=True)
 class AdjudicatorEligibility:
-    """Result of checking adjudicator eligibility."""
+    """Result of checking adjudicator eligibility.
+
+    Frozen and tuple-valued, so eligible results are shared per
+    qualifying domain rather than built per check.
+    """
     eligible: bool
-    errors: list[str] = field(default_factory=list)
+    errors: tuple[str, ...] = ()
     qualifying_domain: str = ""
 
 
+# Shared eligible results, one per qualifying domain.
+_ELIGIBLE_BY_DOMAIN: dict[str, AdjudicatorEligibility] = {}
+
+
+def _eligible(qualifying_domain: str) -> AdjudicatorEligibility:
+    """Return the shared eligible result for a qualifying domain."""
+    result = _ELIGIBLE_BY_DOMAIN.get(qualifying_domain)
+    if result is None:
+        result = _ELIGIBLE_BY_DOMAIN.setdefault(
+            qualifying_domain,
+            AdjudicatorEligibility(
+                eligible=True, qualifying_domain=qualifying_domain,
+            ),
+        )
+    return result
+
+
+def _ineligible(error: str) -> AdjudicatorEligibility:
+    """Build a failed eligibility result carrying a single error."""
+    return AdjudicatorEligibility(eligible=False, errors=(error,))
+
+
+def _shared_diversity_bits(entries: Iterable[RosterEntry]) -> bool:
+    """True if every entry is registered with one and the same roster."""
+    shared = None
+    for e in entries:
+        bits = e.diversity_bits
+        if bits is None or (shared is not None and bits is not shared):
+            return False
+        shared = bits
+    return shared is not None
+
+
+def _gil_disabled() -> bool:
+    """True on free-threaded interpreters running without the GIL."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+@dataclass(frozen=True)
+class QuorumThresholds:
+    """The two integer bounds a leave vote is judged against."""
+    min_quorum: int
+    min_approve_to_grant: int
+
+
 @dataclass(frozen=True)
 class QuorumResult:
     """Result of evaluating whether quorum is reached and leave outcome."""
@@ -52,6 +114,57 @@ class QuorumResult:
     required_approvals: int
 
 
+def _epoch_seconds(dt: datetime) -> float:
+    """Convert an aware datetime to POSIX epoch seconds.
+
+    Raises TypeError for a naive datetime, which .timestamp() would
+    otherwise read as local time.
+    """
+    if dt.tzinfo is None or dt.utcoffset() is None:
+        raise TypeError(f"Leave timestamps must be timezone-aware, got {dt!r}")
+    return dt.timestamp()
+
+
+@dataclass(frozen=True)
+class ActorLeaveIndex:
+    """Sorted summary of one actor's leave history for anti-gaming checks.
+
+    Times are POSIX epoch seconds so window tests are float compares.
+
+    end_times: when each cooldown-relevant leave ended (returned_utc, or
+        approved_utc if not yet returned), ascending.
+    requested_times: requested_utc of every non-denied leave, ascending.
+    end_times_in_order: end_times in record order, so cooldown
+        violations are reported in the order the leaves were given.
+    """
+    end_times: tuple[float, ...] = ()
+    requested_times: tuple[float, ...] = ()
+    end_times_in_order: tuple[float, ...] = ()
+
+    @classmethod
+    def from_leaves(cls, leaves: Iterable[LeaveRecord]) -> ActorLeaveIndex:
+        """Build the index from an actor's leave records.
+
+        Raises TypeError if a relevant timestamp is naive.
+        """
+        end_times: list[float] = []
+        requested_times: list[float] = []
+        cooldown_states = _COOLDOWN_STATES
+        denied = LeaveState.DENIED
+        for leave in leaves:
+            state = leave.state
+            if state in cooldown_states:
+                end_time = leave.returned_utc or leave.approved_utc
+                if end_time:
+                    end_times.append(_epoch_seconds(end_time))
+            if leave.requested_utc and state is not denied:
+                requested_times.append(_epoch_seconds(leave.requested_utc))
+        in_order = tuple(end_times)
+        end_times.sort()
+        requested_times.sort()
+        return cls(tuple(end_times), tuple(requested_times), in_order)
+
+
 class LeaveAdjudicationEngine:
     """Validates eligibility and computes leave adjudication outcomes.
 
@@ -61,6 +174,29 @@ class LeaveAdjudicationEngine:
 
     def __init__(self, resolver: PolicyResolver) -> None:
         self._resolver = resolver
+        self._policy: Optional[LeaveAdjudicationPolicy] = None
+        self._quorum_thresholds = QuorumThresholds(0, 0)
+
+    def _leave_policy(self) -> LeaveAdjudicationPolicy:
+        """Return the resolver's compiled leave policy, fetched once.
+
+        Adjudicator fan-out costs one compilation rather than one config
+        walk per candidate.
+        """
+        policy = self._policy
+        if policy is None:
+            policy = self._resolver.leave_adjudication_policy()
+            self._policy = policy
+            self._quorum_thresholds = QuorumThresholds(
+                min_quorum=policy.min_quorum,
+                min_approve_to_grant=policy.min_approve_to_grant,
+            )
+        return policy
+
+    def _quorum(self) -> QuorumThresholds:
+        """Return quorum thresholds from the compiled leave policy."""
+        self._leave_policy()
+        return self._quorum_thresholds
 
     def check_adjudicator_eligibility(
         self,
@@ -79,65 +215,86 @@ class LeaveAdjudicationEngine:
         5. Must have domain trust >= min_domain_trust in a required domain
            for the leave category
         """
-        config = self._resolver.leave_adjudication_config()
-        errors: list[str] = []
+        policy = self._leave_policy()
 
         # 1. Self-adjudication blocked
         if adjudicator_entry.actor_id == applicant_id:
-            errors.append("Cannot adjudicate own leave request")
-            return AdjudicatorEligibility(eligible=False, errors=errors)
+            return _ineligible("Cannot adjudicate own leave request")
 
         # 2. Must be human
         if adjudicator_entry.actor_kind != ActorKind.HUMAN:
-            errors.append("Only humans can adjudicate leave requests")
-            return AdjudicatorEligibility(eligible=False, errors=errors)
+            return _ineligible("Only humans can adjudicate leave requests")
 
         # 3. Must be active
         if not adjudicator_entry.is_available():
-            errors.append(
+            return _ineligible(
                 f"Adjudicator status is {adjudicator_entry.status.value}; "
                 f"must be active or probation"
             )
-            return AdjudicatorEligibility(eligible=False, errors=errors)
 
         # 4. Global trust threshold
-        min_trust = config.get("min_adjudicator_trust", 0.40)
+        min_trust = policy.min_adjudicator_trust
         if adjudicator_trust.score < min_trust:
-            errors.append(
+            return _ineligible(
                 f"Global trust {adjudicator_trust.score:.3f} "
                 f"< required {min_trust:.3f}"
             )
-            return AdjudicatorEligibility(eligible=False, errors=errors)
 
         # 5. Domain trust in required professional field
-        min_domain_trust = config.get("min_domain_trust", 0.30)
-        cat_config = self._resolver.leave_category_config(
-            leave_category.value,
-        )
-        required_domains = cat_config.get(
-            "required_adjudicator_domains", ["healthcare"],
-        )
-
+        min_domain_trust = policy.min_domain_trust
+        required_domains = policy.required_domains.get(leave_category)
+        if required_domains is None:
+            # Not compiled: defer to the resolver, which raises for
+            # categories it does not know.
+            required_domains = self._resolver.leave_category_config(
+                leave_category.value,
+            ).get("required_adjudicator_domains", ("healthcare",))
+
+        # First qualifying domain in policy order wins — the order is
+        # significant because it is recorded on the adjudication.
         qualifying_domain = ""
+        score_for = adjudicator_trust.domain_scores.get
         for domain in required_domains:
-            ds = adjudicator_trust.domain_scores.get(domain)
-            if ds is not None and isinstance(ds, DomainTrustScore):
-                if ds.score >= min_domain_trust:
-                    qualifying_domain = domain
-                    break
+            ds = score_for(domain)
+            if isinstance(ds, DomainTrustScore) and ds.score >= min_domain_trust:
+                qualifying_domain = domain
+                break
 
         if not qualifying_domain:
-            errors.append(
+            return _ineligible(
                 f"No qualifying domain trust >= {min_domain_trust:.3f} "
-                f"in required domains: {required_domains}"
+                f"in required domains: {list(required_domains)}"
             )
-            return AdjudicatorEligibility(eligible=False, errors=errors)
 
-        return AdjudicatorEligibility(
-            eligible=True,
-            errors=[],
-            qualifying_domain=qualifying_domain,
-        )
+        return _eligible(qualifying_domain)
+
+    def check_many_eligibility(
+        self,
+        candidates: Sequence[tuple[RosterEntry, TrustRecord]],
+        leave_category: LeaveCategory,
+        applicant_id: str,
+        max_workers: Optional[int] = None,
+    ) -> list[AdjudicatorEligibility]:
+        """Check eligibility for many candidate adjudicators.
+
+        Results are in candidate order. Each check is independent, so when
+        max_workers > 1 and the interpreter runs without the GIL
+        (free-threaded builds), candidates are checked on a thread pool.
+        Otherwise threads would only add overhead and checks run serially.
+        """
+        # Resolve the policy up front so workers only read shared state.
+        self._leave_policy()
+        check = self.check_adjudicator_eligibility
+        if max_workers is not None and max_workers > 1 and _gil_disabled():
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                return list(pool.map(
+                    lambda c: check(c[0], c[1], leave_category, applicant_id),
+                    candidates,
+                ))
+        return [
+            check(entry, trust, leave_category, applicant_id)
+            for entry, trust in candidates
+        ]
 
     def evaluate_quorum(self, record: LeaveRecord) -> QuorumResult:
         """Evaluate whether a leave request has reached quorum and the outcome.
@@ -145,18 +302,11 @@ class LeaveAdjudicationEngine:
         Quorum is reached when the number of non-abstain votes >= min_quorum.
         Leave is approved if approve_count >= min_approve_to_grant.
         """
-        config = self._resolver.leave_adjudication_config()
-        min_quorum = config.get("min_quorum", 3)
-        min_approvals = config.get("min_approve_to_grant", 2)
-
-        approve = record.approve_count()
-        deny = record.deny_count()
-        abstain = record.abstain_count()
-        total = len(record.adjudications)
-        non_abstain = approve + deny
+        qt = self._quorum()
+        approve, deny, abstain = record._tally()
 
-        quorum_reached = non_abstain >= min_quorum
-        approved = quorum_reached and approve >= min_approvals
+        quorum_reached = approve + deny >= qt.min_quorum
+        approved = quorum_reached and approve >= qt.min_approve_to_grant
 
         return QuorumResult(
             quorum_reached=quorum_reached,
@@ -164,9 +314,9 @@ class LeaveAdjudicationEngine:
             approve_count=approve,
             deny_count=deny,
             abstain_count=abstain,
-            total_adjudicators=total,
-            required_quorum=min_quorum,
-            required_approvals=min_approvals,
+            total_adjudicators=len(record.adjudications),
+            required_quorum=qt.min_quorum,
+            required_approvals=qt.min_approve_to_grant,
         )
 
     def check_adjudicator_diversity(
@@ -181,74 +331,207 @@ class LeaveAdjudicationEngine:
         - min_organizations: minimum distinct organisations among adjudicators
         - min_regions: minimum distinct regions among adjudicators
         """
-        config = self._resolver.leave_adjudication_config()
-        diversity = config.get("adjudicator_diversity", {})
-        min_orgs = diversity.get("min_organizations", 2)
-        min_regions = diversity.get("min_regions", 2)
+        policy = self._leave_policy()
+        min_orgs = policy.min_organizations
+        min_regions = policy.min_regions
 
         violations: list[str] = []
         if not adjudicator_entries:
             return violations
 
-        orgs = {e.organization for e in adjudicator_entries.values()}
-        regions = {e.region for e in adjudicator_entries.values()}
-
-        if len(orgs) < min_orgs:
+        # Fast path: OR together roster-assigned diversity bits and
+        # popcount. Bits are only comparable within one roster, so
+        # entries that are unregistered or from different rosters fall
+        # back to counting distinct strings.
+        entries = adjudicator_entries.values()
+        if _shared_diversity_bits(entries):
+            org_mask = 0
+            region_mask = 0
+            for e in entries:
+                org_mask |= e.organization_bit
+                region_mask |= e.region_bit
+            org_count = org_mask.bit_count()
+            region_count = region_mask.bit_count()
+        else:
+            org_count = len({e.organization for e in entries})
+            region_count = len({e.region for e in entries})
+
+        if org_count < min_orgs:
             violations.append(
-                f"Adjudicator diversity: {len(orgs)} distinct organisation(s), "
+                f"Adjudicator diversity: {org_count} distinct organisation(s), "
                 f"minimum required is {min_orgs}"
             )
-        if len(regions) < min_regions:
+        if region_count < min_regions:
             violations.append(
-                f"Adjudicator diversity: {len(regions)} distinct region(s), "
+                f"Adjudicator diversity: {region_count} distinct region(s), "
                 f"minimum required is {min_regions}"
             )
 
         return violations
 
+    def build_quorum(
+        self,
+        candidates: Sequence[tuple[RosterEntry, TrustRecord]],
+        leave_category: LeaveCategory,
+        applicant_id: str,
+        size: Optional[int] = None,
+    ) -> list[RosterEntry]:
+        """Greedily pick a diverse, eligible adjudicator panel.
+
+        Walks candidates by descending global trust. A candidate is
+        skipped without an eligibility check if taking them would leave
+        too few seats to reach min_organizations / min_regions. The panel
+        always satisfies check_adjudicator_diversity. Returns an empty
+        list if no such panel of ``size`` (default min_quorum) exists
+        along the greedy walk.
+
+        Raises:
+            ValueError: If size exceeds the configured max_adjudicators.
+        """
+        policy = self._leave_policy()
+        if size is None:
+            size = policy.min_quorum
+        if policy.max_adjudicators is not None and size > policy.max_adjudicators:
+            raise ValueError(
+                f"Quorum size {size} exceeds max_adjudicators "
+                f"{policy.max_adjudicators}"
+            )
+        min_orgs = policy.min_organizations
+        min_regions = policy.min_regions
+
+        # Roster-assigned bits when every candidate shares one roster;
+        # otherwise number organisations and regions locally for this walk.
+        if _shared_diversity_bits([e for e, _ in candidates]):
+            def bits(e: RosterEntry) -> tuple[int, int]:
+                return e.organization_bit, e.region_bit
+        else:
+            org_bits: dict[str, int] = {}
+            region_bits: dict[str, int] = {}
+
+            def bits(e: RosterEntry) -> tuple[int, int]:
+                return (
+                    org_bits.setdefault(e.organization, 1 << len(org_bits)),
+                    region_bits.setdefault(e.region, 1 << len(region_bits)),
+                )
+
+        ranked = sorted(
+            candidates, key=lambda c: (-c[1].score, c[0].actor_id),
+        )
+        panel: list[RosterEntry] = []
+        org_mask = 0
+        region_mask = 0
+        for entry, trust in ranked:
+            org_bit, region_bit = bits(entry)
+            seats_after = size - len(panel) - 1
+            orgs_short = min_orgs - (org_mask | org_bit).bit_count()
+            regions_short = min_regions - (region_mask | region_bit).bit_count()
+            if orgs_short > seats_after or regions_short > seats_after:
+                continue
+            if not self.check_adjudicator_eligibility(
+                entry, trust, leave_category, applicant_id,
+            ).eligible:
+                continue
+            panel.append(entry)
+            org_mask |= org_bit
+            region_mask |= region_bit
+            if len(panel) == size:
+                return panel
+        return []
+
     def check_anti_gaming(
         self,
         actor_id: str,
-        existing_leaves: list[LeaveRecord],
+        existing_leaves: Union[list[LeaveRecord], ActorLeaveIndex],
         now: Optional[datetime] = None,
     ) -> list[str]:
         """Check anti-gaming constraints. Returns list of violations.
 
+        existing_leaves is the actor's leave history, either as records
+        or as a prebuilt ActorLeaveIndex.
+
         Checks:
         1. Cooldown between leaves (default 30 days)
         2. Max leaves per year (default 4)
+
+        Raises TypeError if now or a leave timestamp is naive.
+        """
+        now = now or datetime.now(timezone.utc)
+        policy = self._leave_policy()
+        if isinstance(existing_leaves, ActorLeaveIndex):
+            index = existing_leaves
+        else:
+            index = ActorLeaveIndex.from_leaves(existing_leaves)
+        now_ts = _epoch_seconds(now)
+        return self._anti_gaming_violations(
+            index, now_ts, policy,
+            now_ts - policy.cooldown_days_between_leaves * 86400.0,
+            now_ts - _ONE_YEAR_SECONDS,
+        )
+
+    def check_anti_gaming_batch(
+        self,
+        histories: Mapping[str, Union[list[LeaveRecord], ActorLeaveIndex]],
+        now: Optional[datetime] = None,
+    ) -> dict[str, list[str]]:
+        """Check anti-gaming constraints for many actors in one sweep.
+
+        histories maps actor_id to that actor's leave history (records or
+        a prebuilt ActorLeaveIndex). The clock, policy, and window cutoffs
+        are resolved once for the whole sweep. Returns violations keyed by
+        actor_id, including actors with none.
         """
         now = now or datetime.now(timezone.utc)
-        config = self._resolver.leave_anti_gaming_config()
+        policy = self._leave_policy()
+        now_ts = _epoch_seconds(now)
+        cooldown_start = now_ts - policy.cooldown_days_between_leaves * 86400.0
+        one_year_ago = now_ts - _ONE_YEAR_SECONDS
+        results: dict[str, list[str]] = {}
+        for actor_id, history in histories.items():
+            if isinstance(history, ActorLeaveIndex):
+                index = history
+            else:
+                index = ActorLeaveIndex.from_leaves(history)
+            results[actor_id] = self._anti_gaming_violations(
+                index, now_ts, policy, cooldown_start, one_year_ago,
+            )
+        return results
+
+    @staticmethod
+    def _anti_gaming_violations(
+        index: ActorLeaveIndex,
+        now_ts: float,
+        policy: LeaveAdjudicationPolicy,
+        cooldown_start: float,
+        one_year_ago: float,
+    ) -> list[str]:
+        """Evaluate cooldown and yearly-limit rules against one index.
+
+        All times are epoch seconds, matching ActorLeaveIndex.
+        """
         violations: list[str] = []
 
-        # Cooldown between leaves
-        cooldown_days = config.get("cooldown_days_between_leaves", 30)
-        for leave in existing_leaves:
-            if leave.state in (
-                LeaveState.RETURNED, LeaveState.MEMORIALISED,
-                LeaveState.ACTIVE, LeaveState.APPROVED,
-            ):
-                end_time = leave.returned_utc or leave.approved_utc
-                if end_time:
-                    days_since = (now - end_time).total_seconds() / 86400.0
-                    if days_since < cooldown_days:
-                        violations.append(
-                            f"Cooldown: {days_since:.0f} days since last "
-                            f"leave, minimum is {cooldown_days}"
-                        )
+        # Cooldown between leaves: every leave that ended inside the window
+        cooldown_days = policy.cooldown_days_between_leaves
+        end_times = index.end_times
+        if bisect_right(end_times, cooldown_start) < len(end_times):
+            # Cold path: report in record order, as the scan always has
+            for end_time in index.end_times_in_order:
+                if end_time > cooldown_start:
+                    days_since = (now_ts - end_time) / 86400.0
+                    violations.append(
+                        f"Cooldown: {days_since:.0f} days since last "
+                        f"leave, minimum is {cooldown_days}"
+                    )
 
         # Max leaves per year
-        max_per_year = config.get("max_leaves_per_year", 4)
-        one_year_ago = now - timedelta(days=365)
-        recent_leaves = [
-            leave for leave in existing_leaves
-            if leave.requested_utc and leave.requested_utc > one_year_ago
-            and leave.state != LeaveState.DENIED
-        ]
-        if len(recent_leaves) >= max_per_year:
+        max_per_year = policy.max_leaves_per_year
+        requested_times = index.requested_times
+        recent_count = (
+            len(requested_times) - bisect_right(requested_times, one_year_ago)
+        )
+        if recent_count >= max_per_year:
             violations.append(
-                f"Max leaves per year: {len(recent_leaves)} "
+                f"Max leaves per year: {recent_count} "
                 f"of {max_per_year} used"
             )
 
@@ -281,12 +564,8 @@ class LeaveAdjudicationEngine:
 
         Returns None for unlimited categories.
         """
-        duration_config = self._resolver.leave_duration_config()
-        overrides = duration_config.get("category_overrides", {})
-        default_max = duration_config.get("default_max_days")
-
-        max_days = overrides.get(category.value, default_max)
-        if max_days is None:
+        delta = self._leave_policy().expires_delta_by_category.get(category)
+        if delta is None:
             return None
 
-        return approved_utc + timedelta(days=max_days)
+        return approved_utc + delta
@@ -26,12 +26,17 @@ Death/memorialisation:
 from __future__ import annotations
 
 import enum
-from dataclasses import dataclass, field
+from dataclasses import FrozenInstanceError, dataclass, field
 from datetime import datetime
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
+# The leave enums are plain (not str-mixin) enums: members compare by
+# identity on the engine's hot paths. The persisted form is ``.value``
+# and members are rebuilt with ``Enum(value)`` on load.
 
-class LeaveCategory(str, enum.Enum):
+
+class LeaveCategory(enum.Enum):
     """Categories of protected life events.
 
     Each category maps to required adjudicator domains — the professional
@@ -48,20 +53,20 @@ class LeaveCategory(str, enum.Enum):
 
 
 # Default mapping from category to required adjudicator domains.
-# Policy config can override this.
-CATEGORY_REQUIRED_DOMAINS: dict[str, list[str]] = {
-    "illness": ["healthcare"],
-    "bereavement": ["social_services", "mental_health"],
-    "disability": ["healthcare", "social_services"],
-    "mental_health": ["mental_health", "healthcare"],
-    "caregiver": ["social_services"],
-    "pregnancy": ["healthcare"],
-    "child_care": ["social_services"],
-    "death": ["healthcare", "social_services"],
-}
-
-
-class LeaveState(str, enum.Enum):
+# Policy config can override this. Read-only: shared by every resolver.
+CATEGORY_REQUIRED_DOMAINS: Mapping[str, tuple[str, ...]] = MappingProxyType({
+    "illness": ("healthcare",),
+    "bereavement": ("social_services", "mental_health"),
+    "disability": ("healthcare", "social_services"),
+    "mental_health": ("mental_health", "healthcare"),
+    "caregiver": ("social_services",),
+    "pregnancy": ("healthcare",),
+    "child_care": ("social_services",),
+    "death": ("healthcare", "social_services"),
+})
+
+
+class LeaveState(enum.Enum):
     """Lifecycle states for a leave request.
 
     PENDING → APPROVED/DENIED (after quorum)
@@ -81,14 +86,32 @@ class LeaveState(str, enum.Enum):
     MEMORIALISED = "memorialised"
 
 
-class AdjudicationVerdict(str, enum.Enum):
-    """Individual adjudicator's verdict on a leave request."""
-    APPROVE = "approve"
-    DENY = "deny"
-    ABSTAIN = "abstain"
+# States a leave record never leaves — such records can be sealed.
+TERMINAL_LEAVE_STATES: frozenset[LeaveState] = frozenset({
+    LeaveState.DENIED, LeaveState.RETURNED, LeaveState.MEMORIALISED,
+})
+
+
+class AdjudicationVerdict(enum.Enum):
+    """Individual adjudicator's verdict on a leave request.
+
+    ``value`` is the persisted string; ``idx`` is a dense integer used
+    to index tally counters without comparing verdicts.
+    """
+    APPROVE = ("approve", 0)
+    DENY = ("deny", 1)
+    ABSTAIN = ("abstain", 2)
+
+    idx: int
+
+    def __new__(cls, value: str, idx: int) -> AdjudicationVerdict:
+        member = object.__new__(cls)
+        member._value_ = value
+        member.idx = idx
+        return member
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LeaveAdjudication:
     """A single adjudicator's verdict on a leave request.
 
@@ -105,7 +128,7 @@ class LeaveAdjudication:
     timestamp_utc: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LeaveRecord:
     """A protected leave record for an actor.
 
@@ -122,6 +145,10 @@ class LeaveRecord:
     - granted_duration_days: maximum days of leave (None = unlimited)
     - expires_utc: computed at approval time from grant + duration
     - Extensions require a new adjudication (same quorum process)
+
+    Sealing:
+    - seal() freezes a terminal-state record for audit: adjudications
+      become a tuple and public fields reject further assignment.
     """
     leave_id: str
     actor_id: str
@@ -132,6 +159,7 @@ class LeaveRecord:
 
     # Adjudication
     adjudications: list[LeaveAdjudication] = field(default_factory=list)
+    # A tuple once the record is sealed.
 
     # Freeze snapshot (populated on approval)
     trust_score_at_freeze: Optional[float] = None
@@ -154,25 +182,62 @@ class LeaveRecord:
     returned_utc: Optional[datetime] = None
     memorialised_utc: Optional[datetime] = None
 
+    _sealed: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if name[0] != "_" and getattr(self, "_sealed", False):
+            raise FrozenInstanceError(
+                f"cannot assign to field {name!r}: "
+                f"leave record {self.leave_id} is sealed"
+            )
+        object.__setattr__(self, name, value)
+
+    @property
+    def sealed(self) -> bool:
+        """Whether the record has been frozen by seal()."""
+        return self._sealed
+
+    def seal(self) -> None:
+        """Freeze a terminal-state record (DENIED, RETURNED, MEMORIALISED).
+
+        Converts adjudications to a tuple and rejects later assignment
+        to public fields. Idempotent. Raises ValueError for records that
+        can still change state.
+        """
+        if self._sealed:
+            return
+        if self.state not in TERMINAL_LEAVE_STATES:
+            raise ValueError(
+                f"Cannot seal leave record {self.leave_id} in state "
+                f"{self.state.value}"
+            )
+        self.adjudications = tuple(self.adjudications)  # type: ignore[assignment]
+        self._sealed = True
+
+    def _tally(self) -> tuple[int, int, int]:
+        """Count (approve, deny, abstain) verdicts in a single pass."""
+        counts = [0, 0, 0]
+        # Indexed by AdjudicationVerdict.idx: APPROVE, DENY, ABSTAIN
+        for a in self.adjudications:
+            counts[a.verdict.idx] += 1
+        return counts[0], counts[1], counts[2]
+
     def approve_count(self) -> int:
         """Count adjudicators who voted APPROVE."""
-        return sum(1 for a in self.adjudications
-                   if a.verdict == AdjudicationVerdict.APPROVE)
+        return self._tally()[0]
 
     def deny_count(self) -> int:
         """Count adjudicators who voted DENY."""
-        return sum(1 for a in self.adjudications
-                   if a.verdict == AdjudicationVerdict.DENY)
+        return self._tally()[1]
 
     def abstain_count(self) -> int:
         """Count adjudicators who voted ABSTAIN."""
-        return sum(1 for a in self.adjudications
-                   if a.verdict == AdjudicationVerdict.ABSTAIN)
+        return self._tally()[2]
 
     def has_quorum(self, min_quorum: int) -> bool:
         """Check if enough adjudicators have voted (approve or deny).
 
         Abstentions do not count toward quorum.
         """
-        non_abstain = self.approve_count() + self.deny_count()
-        return non_abstain >= min_quorum
+        approve, deny, _ = self._tally()
+        return approve + deny >= min_quorum
@@ -9,7 +9,7 @@ from __future__ import annotations
 import enum
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 
 # ---------------------------------------------------------------------------
@@ -73,7 +73,36 @@ class ReviewDecisionVerdict(str, enum.Enum):
 # Data classes
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+# Cached lookup index: (source list, key -> position of first item).
+_Index = tuple[list, dict[str, int]]
+
+
+def _indexed(
+    cached: Optional[_Index], items: list, key: str, value: str,
+) -> tuple[_Index, Any]:
+    """Return (index, first item whose attribute ``key`` equals value).
+
+    A hit is checked against the list as it is now, so an item that was
+    popped, removed or replaced since the index was built is never
+    returned. A miss or a mismatch rebuilds the index in one
+    front-to-back pass, where the first item for a key wins. IDs are
+    unique in practice; if an in-place edit puts a duplicate ahead of an
+    indexed item, the indexed one is returned until the next rebuild.
+    """
+    if cached is not None and cached[0] is items:
+        pos = cached[1].get(value)
+        if pos is not None and pos < len(items):
+            item = items[pos]
+            if getattr(item, key) == value:
+                return cached, item
+    positions: dict[str, int] = {}
+    for pos, item in enumerate(items):
+        positions.setdefault(getattr(item, key), pos)
+    pos = positions.get(value)
+    return (items, positions), (None if pos is None else items[pos])
+
+
+@dataclass(frozen=True, slots=True)
 class Reviewer:
     """An assigned reviewer for a mission.
 
@@ -89,7 +118,7 @@ class Reviewer:
     organization: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewDecision:
     """A single reviewer's decision on a mission."""
     reviewer_id: str
@@ -98,7 +127,7 @@ class ReviewDecision:
     timestamp_utc: Optional[datetime] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EvidenceRecord:
     """Tamper-evident evidence artifact attached to a mission.
 
@@ -110,7 +139,7 @@ class EvidenceRecord:
     signature: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """A discrete unit of work within a mission."""
     task_id: str
@@ -122,7 +151,7 @@ class Task:
     completed_utc: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Mission:
     """Top-level mission — the fundamental unit of accountable work.
 
@@ -154,3 +183,36 @@ class Mission:
 
     created_utc: Optional[datetime] = None
     completed_utc: Optional[datetime] = None
+
+    # Lookup indexes — derived, built on first use, never persisted.
+    _task_index: Optional[_Index] = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+    _reviewer_index: Optional[_Index] = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+    _decision_index: Optional[_Index] = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+
+    def task(self, task_id: str) -> Optional[Task]:
+        """Look up a task by ID."""
+        self._task_index, task = _indexed(
+            self._task_index, self.tasks, "task_id", task_id,
+        )
+        return task
+
+    def reviewer(self, reviewer_id: str) -> Optional[Reviewer]:
+        """Look up an assigned reviewer by ID."""
+        self._reviewer_index, reviewer = _indexed(
+            self._reviewer_index, self.reviewers, "id", reviewer_id,
+        )
+        return reviewer
+
+    def decision_for(self, reviewer_id: str) -> Optional[ReviewDecision]:
+        """Return the first review decision submitted by a reviewer."""
+        self._decision_index, decision = _indexed(
+            self._decision_index, self.review_decisions, "reviewer_id",
+            reviewer_id,
+        )
+        return decision
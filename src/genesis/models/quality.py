@@ -16,7 +16,7 @@ from datetime import datetime
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WorkerQualityAssessment:
     """Quality assessment for the worker who completed a mission.
 
@@ -35,7 +35,7 @@ class WorkerQualityAssessment:
     domains: list[str] = field(default_factory=list)  # skill domains exercised
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewerQualityAssessment:
     """Quality assessment for a single reviewer on a single mission.
 
@@ -56,7 +56,7 @@ class ReviewerQualityAssessment:
     details: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MissionQualityReport:
     """Complete quality assessment output for a completed mission.
 
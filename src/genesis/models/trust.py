@@ -14,7 +14,9 @@ from __future__ import annotations
 import enum
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Optional
+from typing import Optional
+
+from genesis.models.domain_trust import DomainTrustScore
 
 
 class ActorKind(str, enum.Enum):
@@ -78,8 +80,7 @@ class TrustRecord:
 
     # Domain-specific trust scores (empty dict = pre-labour-market mode)
     # Keyed by domain name. Global 'score' is the aggregate.
-    domain_scores: dict[str, Any] = field(default_factory=dict)
-    # Type: dict[str, DomainTrustScore] — uses Any to avoid circular import.
+    domain_scores: dict[str, DomainTrustScore] = field(default_factory=dict)
     # Set via TrustEngine.apply_domain_update().
 
     def is_eligible_to_vote(self, tau_vote: float) -> bool:
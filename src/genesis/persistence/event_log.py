@@ -12,13 +12,147 @@ If yes, reject design." — This module ensures the answer is always no.
 
 from __future__ import annotations
 
+import copy
 import enum
 import hashlib
+import hmac
 import json
+import os
+import sys
+import time
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field, asdict
-from datetime import datetime, timezone
+from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, BinaryIO, Iterable, Optional, Sequence
+
+from genesis.crypto.merkle import MerkleTree
+
+# Canonical JSON form hashed into every event: sorted keys, raw UTF-8,
+# stdlib default separators. Any change here changes every event hash,
+# so one encoder is built once and shared by creation, persistence and
+# recovery (json.dumps with options builds a fresh encoder per call).
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, ensure_ascii=False)
+
+
+_HASH_PREFIX = "sha256:"
+# Sidecar next to the log (events.jsonl -> events.root.jsonl) holding
+# recovery checkpoints; see EventLog._write_checkpoint().
+_CHECKPOINT_SUFFIX = ".root.jsonl"
+# Checkpoints are keyed: a plain digest over the log bytes could be
+# recomputed by anyone able to edit the log.
+_CHECKPOINT_PREFIX = "hmac-sha256:"
+_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+_sha256 = hashlib.sha256
+
+
+def _canonical_bytes(
+    event_id: Any,
+    event_kind: Any,
+    timestamp_utc: Any,
+    actor_id: Any,
+    payload: Any,
+) -> bytes:
+    """Encode event fields in the canonical form used for event hashing.
+
+    The envelope keys are fixed, so they are laid out in sorted order
+    here and only the payload goes through the key-sorting encoder. The
+    output is byte-identical to encoding the whole envelope dict.
+    """
+    encode = _CANONICAL_ENCODER.encode
+    return "".join((
+        '{"actor_id": ', encode(actor_id),
+        ', "event_id": ', encode(event_id),
+        ', "event_kind": ', encode(event_kind),
+        ', "payload": ', encode(payload),
+        ', "timestamp_utc": ', encode(timestamp_utc),
+        "}",
+    )).encode("utf-8")
+
+
+# (epoch second, formatted timestamp) for the most recent "now".
+_now_cache: tuple[int, str] = (-1, "")
+
+
+def _utc_now_str() -> str:
+    """Current UTC time in the event timestamp format.
+
+    Formatted with C-level gmtime/strftime and reused for every event
+    created within the same second.
+    """
+    global _now_cache
+    second = int(time.time())
+    cached = _now_cache
+    if cached[0] != second:
+        cached = _now_cache = (
+            second, time.strftime(_TIMESTAMP_FORMAT, time.gmtime(second)),
+        )
+    return cached[1]
+
+
+def _event_hash(canonical: bytes) -> str:
+    """Return the prefixed SHA-256 hex digest of canonical bytes."""
+    return _HASH_PREFIX + _sha256(canonical).hexdigest()
+
+
+def _hash_chunk(messages: list[bytes]) -> list[str]:
+    """Hash one contiguous chunk of canonical messages."""
+    return list(map(_event_hash, messages))
+
+
+def _event_hashes(messages: list[bytes], workers: int = 1) -> list[str]:
+    """Hash many independent canonical messages, preserving order.
+
+    Recovery hashes through this single entry point. With workers > 1
+    the messages are split into that many contiguous chunks and hashed
+    on a thread pool: hashlib releases the GIL for large messages, and
+    free-threaded interpreters run the chunks fully in parallel.
+    """
+    if workers <= 1 or len(messages) < 2 * workers:
+        return _hash_chunk(messages)
+    size = -(-len(messages) // workers)
+    chunks = [messages[i:i + size] for i in range(0, len(messages), size)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return [h for chunk in pool.map(_hash_chunk, chunks) for h in chunk]
+
+
+def _readonly(self: Any, *args: Any, **kwargs: Any) -> None:
+    raise TypeError("Event payloads are read-only")
+
+
+class _FrozenPayload(dict):
+    """A dict that refuses mutation, used for logged event payloads.
+
+    Subclassing dict (rather than wrapping in MappingProxyType) keeps
+    payloads JSON-serializable and equal to plain dicts.
+    """
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    # copy and pickle rebuild dicts through the mutators above; rebuild
+    # from the items instead.
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (_FrozenPayload, (dict(self),))
+
+    def __copy__(self) -> _FrozenPayload:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> _FrozenPayload:
+        return _FrozenPayload(copy.deepcopy(dict(self), memo))
+
+
+def _freeze_payload(payload: dict[str, Any]) -> _FrozenPayload:
+    """Copy a payload into a read-only dict with interned string keys.
+
+    Payload keys repeat across many events; interning shares them.
+    """
+    intern = sys.intern
+    return _FrozenPayload(
+        (intern(k) if type(k) is str else k, v) for k, v in payload.items()
+    )
 
 
 class EventKind(str, enum.Enum):
@@ -56,7 +190,7 @@ class EventKind(str, enum.Enum):
     LEAVE_MEMORIALISED = "leave_memorialised"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventRecord:
     """A single immutable event in the governance log.
 
@@ -68,8 +202,13 @@ class EventRecord:
     event_kind: EventKind
     timestamp_utc: str
     actor_id: str
-    payload: dict[str, Any]
+    payload: dict[str, Any]  # Read-only once logged
     event_hash: str  # SHA-256 of canonical JSON
+    # Canonical bytes the hash was computed over, kept by create() so
+    # persisting the event does not serialize it again.
+    _canonical: Optional[bytes] = field(
+        default=None, init=False, repr=False, compare=False,
+    )
 
     @staticmethod
     def create(
@@ -80,31 +219,74 @@ class EventRecord:
         timestamp_utc: Optional[datetime] = None,
     ) -> EventRecord:
         """Create a new event record with computed hash."""
-        ts = timestamp_utc or datetime.now(timezone.utc)
-        ts_str = ts.strftime("%Y-%m-%dT%H:%M:%SZ")
+        # Actors repeat across many events; share one string per actor.
+        actor_id = sys.intern(actor_id)
+        if timestamp_utc is None:
+            ts_str = _utc_now_str()
+        else:
+            ts_str = timestamp_utc.strftime(_TIMESTAMP_FORMAT)
 
         # Compute canonical hash
-        canonical = json.dumps(
-            {
-                "event_id": event_id,
-                "event_kind": event_kind.value,
-                "timestamp_utc": ts_str,
-                "actor_id": actor_id,
-                "payload": payload,
-            },
-            sort_keys=True,
-            ensure_ascii=False,
-        ).encode("utf-8")
-        digest = hashlib.sha256(canonical).hexdigest()
-
-        return EventRecord(
+        canonical = _canonical_bytes(
+            event_id, event_kind.value, ts_str, actor_id, payload,
+        )
+        event = EventRecord(
             event_id=event_id,
             event_kind=event_kind,
             timestamp_utc=ts_str,
             actor_id=actor_id,
-            payload=payload,
-            event_hash=f"sha256:{digest}",
+            payload=_freeze_payload(payload),
+            event_hash=_event_hash(canonical),
         )
+        object.__setattr__(event, "_canonical", canonical)
+        return event
+
+
+_ACTOR_ID_KEY = b'{"actor_id": '
+
+
+def _file_line(event: EventRecord) -> bytes:
+    """Serialize an event as one UTF-8 JSONL line.
+
+    The line is the canonical hashed form plus event_hash. With sorted
+    keys, actor_id is always first and event_hash second, so for events
+    from create() the cached canonical bytes are spliced rather than
+    re-encoding the payload.
+    """
+    canonical = event._canonical
+    if canonical is not None:
+        split = len(_ACTOR_ID_KEY) + len(
+            _CANONICAL_ENCODER.encode(event.actor_id).encode("utf-8")
+        )
+        return b"".join((
+            canonical[:split],
+            b', "event_hash": "',
+            event.event_hash.encode("ascii"),
+            b'"',
+            canonical[split:],
+            b"\n",
+        ))
+    return (_CANONICAL_ENCODER.encode({
+        "event_id": event.event_id,
+        "event_kind": event.event_kind.value,
+        "timestamp_utc": event.timestamp_utc,
+        "actor_id": event.actor_id,
+        "payload": event.payload,
+        "event_hash": event.event_hash,
+    }) + "\n").encode("utf-8")
+
+
+def _strip_stored_hash(line: bytes, event_hash: Any) -> bytes:
+    """Remove the event_hash member _file_line() spliced into a line."""
+    if not isinstance(event_hash, str):
+        return line
+    marker = b', "event_hash": "' + event_hash.encode("utf-8") + b'"'
+    return line.replace(marker, b"", 1)
+
+
+def _timestamp_of(event: EventRecord) -> str:
+    """Bisect key for time-ordered event lists."""
+    return event.timestamp_utc
 
 
 class EventLog:
@@ -113,12 +295,80 @@ class EventLog:
     Events can only be appended, never modified or deleted.
     The log can be persisted to a JSONL file (one JSON object per line)
     and loaded back for recovery.
+
+    By default every append is written through to the OS. With
+    write_buffer_bytes > 0, appended lines are held and written in one
+    call once that many bytes are pending; flush() or close() must then
+    be called at commit points, as pending lines are not yet on disk.
+
+    recovery_workers > 1 verifies recovered event hashes on that many
+    threads.
+
+    With a checkpoint_key, each sealed epoch also appends a checkpoint
+    (an HMAC-SHA256 under that key over the file bytes it covers) to a
+    sidecar file, events.root.jsonl for events.jsonl. Recovery verifies
+    events covered by matching checkpoints with one MAC per epoch instead
+    of one hash per event. The key must not be stored alongside the log:
+    whoever holds it can vouch for arbitrary log bytes. Without a key no
+    checkpoints are written or trusted and every event is re-hashed.
     """
 
-    def __init__(self, storage_path: Optional[Path] = None) -> None:
+    def __init__(
+        self,
+        storage_path: Optional[Path] = None,
+        write_buffer_bytes: int = 0,
+        recovery_workers: int = 1,
+        checkpoint_key: Optional[bytes] = None,
+    ) -> None:
+        if write_buffer_bytes < 0:
+            raise ValueError("write_buffer_bytes must be >= 0")
+        if recovery_workers < 1:
+            raise ValueError("recovery_workers must be >= 1")
+        self._recovery_workers = recovery_workers
         self._events: list[EventRecord] = []
         self._storage_path = storage_path
         self._event_ids: set[str] = set()
+        # Timestamps parallel to _events. Bisectable while appends arrive
+        # in timestamp order; an explicit earlier timestamp clears
+        # _time_ordered and queries fall back to a scan.
+        self._timestamps: list[str] = []
+        self._time_ordered = True
+        # Merkle leaves in log order, plus per-kind buckets for
+        # kind-filtered queries.
+        self._all_hashes: list[str] = []
+        self._by_kind: dict[EventKind, list[EventRecord]] = {}
+        self._hashes_by_kind: dict[EventKind, list[str]] = {}
+        # End (exclusive) of each sealed epoch's span in _all_hashes. An
+        # epoch is sealed by its EPOCH_CLOSED event; append-only means
+        # its leaves and root never change, so both are memoized.
+        self._sealed_ends: list[int] = []
+        self._sealed_hashes: dict[int, tuple[str, ...]] = {}
+        self._sealed_roots: dict[int, str] = {}
+        # Opened on first append and kept for the log's lifetime.
+        # Unbuffered, so a failed write surfaces where it is made.
+        self._fh: Optional[BinaryIO] = None
+        # End offset of a partial write past _file_offset that could not
+        # be truncated away yet; None when there is none.
+        self._torn_end: Optional[int] = None
+        # Write-behind batching (disabled when write_buffer_bytes == 0)
+        self._write_buffer_bytes = write_buffer_bytes
+        self._pending: list[bytes] = []
+        self._pending_bytes = 0
+        # Indexes into _pending of lines that close an epoch.
+        self._pending_seals: list[int] = []
+        # Recovery checkpoints. Bytes written since the last checkpoint
+        # (file offsets [_segment_start, _file_offset)) are MACed as
+        # they go out; each sealed epoch records the MAC in the sidecar
+        # so a later load can trust those bytes without re-hashing every
+        # event in them. Disabled (no path, no MAC) without a key.
+        self._checkpoint_key = checkpoint_key
+        self._checkpoint_path = (
+            storage_path.with_suffix(_CHECKPOINT_SUFFIX)
+            if storage_path and checkpoint_key else None
+        )
+        self._file_offset = 0
+        self._segment_start = 0
+        self._segment_mac = self._new_segment_mac()
 
         if storage_path and storage_path.exists():
             self._load_from_file(storage_path)
@@ -133,15 +383,47 @@ class EventLog:
 
         self._events.append(event)
         self._event_ids.add(event.event_id)
+        self._index_event(event)
 
         if self._storage_path:
             self._append_to_file(event)
 
+    def extend(self, events: Iterable[EventRecord], fsync: bool = False) -> None:
+        """Append a batch of events with one duplicate pass and one write.
+
+        All-or-nothing: raises ValueError on the first event_id that is
+        already logged or repeated within the batch, before anything is
+        appended. With fsync=True the batch is forced to disk once.
+        """
+        batch = list(events)
+        new_ids: set[str] = set()
+        for event in batch:
+            event_id = event.event_id
+            if event_id in self._event_ids or event_id in new_ids:
+                raise ValueError(f"Duplicate event ID: {event_id}")
+            new_ids.add(event_id)
+        if not batch:
+            return
+
+        self._events.extend(batch)
+        self._event_ids.update(new_ids)
+        for event in batch:
+            self._index_event(event)
+
+        if self._storage_path:
+            base = len(self._pending)
+            self._pending.extend(map(_file_line, batch))
+            self._pending_seals.extend(
+                base + i for i, event in enumerate(batch)
+                if event.event_kind is EventKind.EPOCH_CLOSED
+            )
+            self.flush(fsync=fsync)
+
     def events(self, kind: Optional[EventKind] = None) -> list[EventRecord]:
         """Return events, optionally filtered by kind."""
         if kind is None:
             return list(self._events)
-        return [e for e in self._events if e.event_kind == kind]
+        return list(self._by_kind.get(kind, ()))
 
     def events_since(
         self,
@@ -149,14 +431,90 @@ class EventLog:
         kind: Optional[EventKind] = None,
     ) -> list[EventRecord]:
         """Return events after a timestamp, optionally filtered by kind."""
-        result = [e for e in self._events if e.timestamp_utc >= since_utc]
-        if kind is not None:
-            result = [e for e in result if e.event_kind == kind]
-        return result
+        if not self._time_ordered:
+            return [
+                e for e in self._events
+                if e.timestamp_utc >= since_utc
+                and (kind is None or e.event_kind is kind)
+            ]
+        if kind is None:
+            return self._events[bisect_left(self._timestamps, since_utc):]
+        bucket = self._by_kind.get(kind, [])
+        return bucket[bisect_left(bucket, since_utc, key=_timestamp_of):]
 
     def event_hashes(self, kind: Optional[EventKind] = None) -> list[str]:
-        """Return all event hashes for Merkle tree construction."""
-        return [e.event_hash for e in self.events(kind)]
+        """Return all event hashes for Merkle tree construction.
+
+        The result is a fresh list the caller may mutate.
+        """
+        if kind is None:
+            return self._all_hashes.copy()
+        return list(self._hashes_by_kind.get(kind, ()))
+
+    @property
+    def sealed_epoch_count(self) -> int:
+        """Number of epochs sealed by an EPOCH_CLOSED event."""
+        return len(self._sealed_ends)
+
+    def sealed_epoch_hashes(self, index: int) -> tuple[str, ...]:
+        """Event hashes of the index-th sealed epoch (0-based), cached.
+
+        The span runs from the event after the previous EPOCH_CLOSED up
+        to and including this epoch's EPOCH_CLOSED.
+        Raises IndexError for an epoch that is not sealed.
+        """
+        cached = self._sealed_hashes.get(index)
+        if cached is not None:
+            return cached
+        if not 0 <= index < len(self._sealed_ends):
+            raise IndexError(f"No sealed epoch at index {index}")
+        start = self._sealed_ends[index - 1] if index else 0
+        cached = tuple(self._all_hashes[start:self._sealed_ends[index]])
+        self._sealed_hashes[index] = cached
+        return cached
+
+    def sealed_epoch_root(self, index: int) -> str:
+        """Merkle root over a sealed epoch's event hashes, cached.
+
+        Computed on first read only.
+        Raises IndexError for an epoch that is not sealed.
+        """
+        root = self._sealed_roots.get(index)
+        if root is None:
+            tree = MerkleTree()
+            for leaf in self.sealed_epoch_hashes(index):
+                tree.add_leaf(leaf)
+            root = self._sealed_roots[index] = tree.compute_root()
+        return root
+
+    def flush(self, fsync: bool = False) -> None:
+        """Write pending events; with fsync=True, force them to disk.
+
+        Unbuffered appends already reach the OS, so there this matters
+        only for callers that need on-disk durability at a commit point.
+        """
+        self._write_pending()
+        if self._fh is None:
+            return
+        self._fh.flush()
+        if fsync:
+            os.fsync(self._fh.fileno())
+
+    def close(self) -> None:
+        """Write pending events and close the storage file.
+
+        A later append reopens it.
+        """
+        self._write_pending()
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def __enter__(self) -> EventLog:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     @property
     def count(self) -> int:
@@ -166,18 +524,197 @@ class EventLog:
     def last_event(self) -> Optional[EventRecord]:
         return self._events[-1] if self._events else None
 
+    def _index_event(self, event: EventRecord) -> None:
+        """Add a newly logged event to the time, hash and kind indexes.
+
+        Callers record the event ID themselves, in bulk where they can.
+        """
+        timestamp_utc = event.timestamp_utc
+        timestamps = self._timestamps
+        if self._time_ordered and timestamps and timestamp_utc < timestamps[-1]:
+            self._time_ordered = False
+        timestamps.append(timestamp_utc)
+
+        self._all_hashes.append(event.event_hash)
+
+        kind = event.event_kind
+        if kind is EventKind.EPOCH_CLOSED:
+            self._sealed_ends.append(len(self._all_hashes))
+        bucket = self._by_kind.get(kind)
+        if bucket is None:
+            bucket = self._by_kind[kind] = []
+            self._hashes_by_kind[kind] = []
+        bucket.append(event)
+        self._hashes_by_kind[kind].append(event.event_hash)
+
     def _append_to_file(self, event: EventRecord) -> None:
-        """Append a single event to the JSONL file."""
+        """Append a single event to the JSONL file.
+
+        Unbuffered, writes through the persistent handle and flushes to
+        the OS, so a crash never loses an acknowledged event and other
+        readers of the file see it immediately. Buffered, queues the line
+        until write_buffer_bytes are pending.
+        """
+        line = _file_line(event)
+        sealed = event.event_kind is EventKind.EPOCH_CLOSED
+        if not self._write_buffer_bytes:
+            self._write_lines([line], (0,) if sealed else ())
+            self._fh.flush()
+            return
+        if sealed:
+            self._pending_seals.append(len(self._pending))
+        self._pending.append(line)
+        self._pending_bytes += len(line)
+        if self._pending_bytes >= self._write_buffer_bytes:
+            self._write_pending()
+            self._fh.flush()
+
+    def _write_pending(self) -> None:
+        """Write all queued lines to the file in a single call.
+
+        If the write fails the lines stay queued and the error
+        propagates; the file is left at its pre-write length, so the
+        next flush retries them without duplicating any.
+        """
+        if not self._pending:
+            return
+        self._write_lines(self._pending, self._pending_seals)
+        self._pending.clear()
+        self._pending_seals.clear()
+        self._pending_bytes = 0
+
+    def _write_lines(self, lines: list[bytes], seals: Sequence[int]) -> None:
+        """Write lines in one call, checkpointing each epoch they seal.
+
+        seals holds the ascending indexes of EPOCH_CLOSED lines.
+        """
+        self._write_all(lines[0] if len(lines) == 1 else b"".join(lines))
+        start = 0
+        for seal in seals:
+            self._digest_lines(lines[start:seal + 1])
+            self._write_checkpoint()
+            start = seal + 1
+        self._digest_lines(lines[start:] if start else lines)
+
+    def _write_all(self, data: bytes) -> None:
+        """Append data to the file completely or not at all.
+
+        On a failed or short write (disk full) the bytes this write
+        produced are cut off again and the error is re-raised. If that
+        cut fails too, it is retried before the next write rather than
+        appending after a torn line.
+        """
+        fh = self._file_handle()
+        if self._torn_end is not None:
+            self._cut_partial_write(fh)
+        view = memoryview(data)
+        written = 0
+        try:
+            while written < len(view):
+                written += fh.write(view[written:])
+        except OSError:
+            if written:
+                self._torn_end = self._file_offset + written
+                try:
+                    self._cut_partial_write(fh)
+                except OSError:
+                    pass
+            raise
+
+    def _cut_partial_write(self, fh: BinaryIO) -> None:
+        """Truncate a partial write back to _file_offset.
+
+        Only when the file still ends where that write stopped: if it
+        has grown since (another writer appended), truncating would
+        delete their lines, so the torn bytes are left for the next load
+        to report.
+        """
+        if os.fstat(fh.fileno()).st_size == self._torn_end:
+            fh.truncate(self._file_offset)
+        self._torn_end = None
+
+    def _new_segment_mac(self) -> Optional[hmac.HMAC]:
+        """Start the MAC for a new checkpoint segment, if keyed."""
+        if self._checkpoint_path is None:
+            return None
+        return hmac.new(self._checkpoint_key, digestmod=_sha256)
+
+    def _digest_lines(self, lines: list[bytes]) -> None:
+        """Fold written lines into the current checkpoint segment."""
+        mac = self._segment_mac
+        for line in lines:
+            if mac is not None:
+                mac.update(line)
+            self._file_offset += len(line)
+
+    def _write_checkpoint(self) -> None:
+        """Record the current segment's MAC in the sidecar file.
+
+        The log file is flushed first so a checkpoint never describes
+        bytes the OS has not seen. A checkpoint that still fails to
+        match (crash, truncation, tampering) only costs a full
+        per-event verification on the next load. For the same reason a
+        failed sidecar write is swallowed: the event is already logged,
+        and the segment simply carries on to the next checkpoint.
+        """
+        if self._checkpoint_path is None:
+            return
+        self._fh.flush()
         record = {
-            "event_id": event.event_id,
-            "event_kind": event.event_kind.value,
-            "timestamp_utc": event.timestamp_utc,
-            "actor_id": event.actor_id,
-            "payload": event.payload,
-            "event_hash": event.event_hash,
+            "start": self._segment_start,
+            "end": self._file_offset,
+            "digest": _CHECKPOINT_PREFIX + self._segment_mac.hexdigest(),
         }
-        with self._storage_path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(record, sort_keys=True, ensure_ascii=False) + "\n")
+        try:
+            with self._checkpoint_path.open("ab") as f:
+                f.write((json.dumps(record, sort_keys=True) + "\n").encode("utf-8"))
+        except OSError:
+            return
+        self._segment_start = self._file_offset
+        self._segment_mac = self._new_segment_mac()
+
+    def _verified_prefix(self, data: bytes) -> int:
+        """Length of the leading bytes of data vouched for by checkpoints.
+
+        Checkpoints are chained from offset 0 in sidecar order; one that
+        does not start where the chain ends, or whose MAC does not
+        match under this log's key, is skipped.
+        """
+        path = self._checkpoint_path
+        if path is None:
+            return 0
+        try:
+            sidecar = path.read_bytes()
+        except OSError:
+            return 0  # Missing or unreadable: verify every event
+        view = memoryview(data)
+        verified = 0
+        for line in sidecar.splitlines():
+            try:
+                record = json.loads(line)
+                start, end = record["start"], record["end"]
+                if (
+                    start != verified
+                    or type(end) is not int
+                    or not verified < end <= len(data)
+                    or data[end - 1] != 0x0A  # ends on a line boundary
+                ):
+                    continue
+                digest = record["digest"]
+                if not isinstance(digest, str):
+                    continue
+            except (ValueError, KeyError, TypeError):
+                continue
+            mac = hmac.new(self._checkpoint_key, view[start:end], _sha256)
+            if hmac.compare_digest(_CHECKPOINT_PREFIX + mac.hexdigest(), digest):
+                verified = end
+        return verified
+
+    def _file_handle(self) -> BinaryIO:
+        """Return the storage file handle, opening it on first use."""
+        if self._fh is None:
+            self._fh = self._storage_path.open("ab", buffering=0)
+        return self._fh
 
     def _load_from_file(self, path: Path) -> None:
         """Load events from a JSONL file with integrity verification.
@@ -185,48 +722,102 @@ class EventLog:
         Fail-closed: rejects tampered records (hash mismatch) and
         duplicate event IDs (replay protection on recovery).
         """
-        with path.open("r", encoding="utf-8") as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
-                    continue
-                data = json.loads(line)
+        # Pass 1: parse. The file is read in binary mode, so lines are
+        # split without a text-decoding layer and json.loads decodes the
+        # UTF-8 itself. Hashing is then one batch over independent
+        # messages rather than interleaved with parsing.
+        raw = path.read_bytes()
+        parsed: list[tuple[int, bytes, dict[str, Any]]] = []
+        for line_num, line in enumerate(raw.split(b"\n"), 1):
+            line = line.strip()
+            if not line:
+                continue
+            parsed.append((line_num, line, json.loads(line)))
+
+        # Lines covered by checkpoints whose MAC matches under our key
+        # are byte-for-byte what this log wrote, so their stored hashes
+        # stand without re-hashing; one MAC per sealed epoch replaces
+        # one hash per event. Without a key nothing is trusted.
+        trusted_end = self._verified_prefix(raw)
+        trusted = bisect_left(
+            parsed, raw.count(b"\n", 0, trusted_end) + 1, key=itemgetter(0),
+        )
+
+        # Pass 2: hash the canonical bytes each remaining line carries.
+        # Lines this log wrote are the canonical form with event_hash
+        # spliced in, so removing it recovers exactly the hashed bytes
+        # without re-serializing. A match is conclusive: only the
+        # genuine canonical bytes hash to the stored value.
+        fast_hashes = [data["event_hash"] for _, _, data in parsed[:trusted]]
+        fast_hashes += _event_hashes(
+            [
+                _strip_stored_hash(line, data.get("event_hash"))
+                for _, line, data in parsed[trusted:]
+            ],
+            workers=self._recovery_workers,
+        )
 
-                event_id = data["event_id"]
+        # Duplicate prefilter: one C-level pass over all IDs settles the
+        # overwhelmingly common case (no duplicates), so the per-line
+        # replay check only runs when there is something to find.
+        event_ids = [data["event_id"] for _, _, data in parsed]
+        check_duplicates = (
+            len(set(event_ids)) != len(event_ids)
+            or not self._event_ids.isdisjoint(event_ids)
+        )
+
+        seen: set[str] = set(self._event_ids) if check_duplicates else set()
+
+        # Pass 3: verify in file order, so the first bad line is reported
+        for (line_num, _, data), fast_hash in zip(parsed, fast_hashes):
+            event_id = data["event_id"]
 
-                # Replay protection: reject duplicate IDs on load
-                if event_id in self._event_ids:
+            # Replay protection: reject duplicate IDs on load
+            if check_duplicates:
+                if event_id in seen:
                     raise ValueError(
                         f"Duplicate event ID on recovery (line {line_num}): {event_id}"
                     )
-
-                # Recompute canonical hash to verify integrity
-                canonical = json.dumps(
-                    {
-                        "event_id": data["event_id"],
-                        "event_kind": data["event_kind"],
-                        "timestamp_utc": data["timestamp_utc"],
-                        "actor_id": data["actor_id"],
-                        "payload": data["payload"],
-                    },
-                    sort_keys=True,
-                    ensure_ascii=False,
-                ).encode("utf-8")
-                expected_hash = f"sha256:{hashlib.sha256(canonical).hexdigest()}"
-
+                seen.add(event_id)
+
+            if data["event_hash"] != fast_hash:
+                # Not in our own layout (e.g. re-formatted): recompute
+                # the canonical form from the parsed fields.
+                expected_hash = _event_hash(_canonical_bytes(
+                    data["event_id"],
+                    data["event_kind"],
+                    data["timestamp_utc"],
+                    data["actor_id"],
+                    data["payload"],
+                ))
                 if data["event_hash"] != expected_hash:
                     raise ValueError(
                         f"Integrity check failed (line {line_num}): event {event_id} "
                         f"stored hash {data['event_hash']} != computed {expected_hash}"
                     )
 
-                event = EventRecord(
-                    event_id=data["event_id"],
-                    event_kind=EventKind(data["event_kind"]),
-                    timestamp_utc=data["timestamp_utc"],
-                    actor_id=data["actor_id"],
-                    payload=data["payload"],
-                    event_hash=data["event_hash"],
-                )
-                self._events.append(event)
-                self._event_ids.add(event.event_id)
+        # Every line verified: materialize the records in one sized pass
+        # and register their IDs with a single set update.
+        recovered = [
+            EventRecord(
+                event_id=data["event_id"],
+                event_kind=EventKind(data["event_kind"]),
+                timestamp_utc=data["timestamp_utc"],
+                actor_id=sys.intern(data["actor_id"]),
+                payload=_freeze_payload(data["payload"]),
+                event_hash=data["event_hash"],
+            )
+            for _, _, data in parsed
+        ]
+        self._events.extend(recovered)
+        self._event_ids.update(event_ids)
+        for event in recovered:
+            self._index_event(event)
+
+        # Everything past the checkpoint chain was verified above, so the
+        # next checkpoint covers it and re-extends the chain.
+        self._file_offset = len(raw)
+        self._segment_start = trusted_end
+        self._segment_mac = self._new_segment_mac()
+        if self._segment_mac is not None:
+            self._segment_mac.update(memoryview(raw)[trusted_end:])
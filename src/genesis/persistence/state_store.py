@@ -15,11 +15,19 @@ while keeping the same interface.
 
 from __future__ import annotations
 
+import enum
+import gzip
+import hashlib
 import json
-from dataclasses import asdict
+import os
+import sys
+from contextlib import contextmanager
+from dataclasses import fields
 from datetime import datetime, timezone
+from functools import lru_cache
+from json.decoder import scanstring
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Iterator, Optional, TypeVar
 
 from genesis.models.mission import (
     DomainType,
@@ -53,10 +61,487 @@ from genesis.models.leave import (
     LeaveCategory,
     LeaveRecord,
     LeaveState,
+    TERMINAL_LEAVE_STATES,
 )
 from genesis.models.trust import ActorKind, TrustRecord
 from genesis.review.roster import ActorRoster, ActorStatus, RosterEntry
 
+_E = TypeVar("_E", bound=enum.Enum)
+_T = TypeVar("_T")
+
+# Every save_* rewrites the whole state, so the encoder is built once.
+# Without indent, json uses its C encoder; indented output goes through
+# the pure-Python path and is several times slower on large rosters.
+# Keys are not sorted by the encoder: record fields are written in the
+# fixed order of the builders' dict literals, and the savers iterate
+# record maps sorted by ID, so saves of the same state stay
+# byte-identical without sorting every dict on every save.
+_STATE_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+# Top-level sections are written one per line. The encoder escapes
+# every newline inside strings, so a raw newline in the file can only
+# be this separator, and a section can be found without parsing the
+# others.
+_SECTION_SEPARATOR = ",\n"
+
+# State files named *.gz are gzip-compressed. JSON shrinks several-fold
+# even at the fastest level, which keeps compression cheaper than the
+# bytes it saves. Loading detects compression from the magic bytes.
+_GZIP_LEVEL = 1
+_GZIP_MAGIC = b"\x1f\x8b"
+
+# Once the state file reaches this size, a flush appends just the
+# sections that changed to a write-ahead log beside it instead of
+# rewriting the whole file. The log is folded back into the file (one
+# full rewrite) when it grows past the file's own size. Smaller states
+# are cheaper to rewrite whole.
+_WAL_MIN_STATE_BYTES = 1 << 20
+
+# Superseded lines the leave log may hold beyond its live records before
+# the next write compacts it.
+_LEAVE_LOG_SLACK = 64
+
+# Roster fields, in the order load_roster() unpacks them.
+_ROSTER_COLUMNS = (
+    "actor_id", "actor_kind", "trust_score", "region",
+    "organization", "model_family", "method_type", "status",
+)
+
+# Trust record fields, in the order load_trust_records() unpacks them.
+_TRUST_COLUMNS = (
+    "actor_id", "actor_kind", "score", "quality", "reliability", "volume",
+    "effort", "quarantined", "decommissioned", "last_active_utc",
+    "domain_scores",
+)
+
+
+# Values the load_* side falls back to for a missing key. Savers drop
+# fields equal to these, so unset optional fields cost no bytes to write
+# or parse. Keep each table in step with its loader's .get() defaults.
+_DOMAIN_SCORE_DEFAULTS: dict[str, Any] = {
+    "score": 0.0, "quality": 0.0, "reliability": 0.0, "volume": 0.0,
+    "effort": 0.0, "mission_count": 0, "last_active_utc": None,
+}
+_TRUST_RECORD_DEFAULTS: dict[str, Any] = {
+    "quality": 0.0, "reliability": 0.0, "volume": 0.0, "effort": 0.0,
+    "quarantined": False, "decommissioned": False,
+    "last_active_utc": None, "domain_scores": {},
+}
+_MISSION_DEFAULTS: dict[str, Any] = {
+    "worker_id": None, "human_final_approval": False, "reviewers": [],
+    "review_decisions": [], "evidence": [], "skill_requirements": [],
+}
+_REVIEW_DECISION_DEFAULTS: dict[str, Any] = {"notes": ""}
+_SKILL_REQUIREMENT_DEFAULTS: dict[str, Any] = {
+    "minimum_proficiency": 0.0, "required": True,
+}
+_SKILL_PROFICIENCY_DEFAULTS: dict[str, Any] = {
+    "evidence_count": 0, "last_demonstrated_utc": None,
+    "endorsement_count": 0, "source": "outcome_derived",
+}
+_SKILL_PROFILE_DEFAULTS: dict[str, Any] = {
+    "skills": {}, "primary_domains": [], "updated_utc": None,
+}
+_LISTING_DEFAULTS: dict[str, Any] = {
+    "skill_requirements": [], "created_utc": None, "opened_utc": None,
+    "allocated_utc": None, "allocated_worker_id": None,
+    "allocated_mission_id": None, "domain_tags": [], "preferences": {},
+}
+_BID_DEFAULTS: dict[str, Any] = {
+    "relevance_score": 0.0, "global_trust": 0.0, "domain_trust": 0.0,
+    "composite_score": 0.0, "submitted_utc": None, "notes": "",
+}
+_ADJUDICATION_DEFAULTS: dict[str, Any] = {"notes": "", "timestamp_utc": None}
+_LEAVE_RECORD_DEFAULTS: dict[str, Any] = {
+    "reason_summary": "", "petitioner_id": None, "adjudications": [],
+    "trust_score_at_freeze": None, "last_active_utc_at_freeze": None,
+    "domain_scores_at_freeze": {}, "pre_leave_status": None,
+    "granted_duration_days": None, "expires_utc": None,
+    "requested_utc": None, "approved_utc": None, "denied_utc": None,
+    "returned_utc": None, "memorialised_utc": None,
+}
+
+
+# The save_* builders read enum members' _value_ attribute directly.
+# Enum.value is a property, several times slower per access, and every
+# saved record holds at least one enum.
+
+
+def _drop_defaults(entry: dict[str, Any], defaults: dict[str, Any]) -> dict[str, Any]:
+    """Remove the fields of entry that equal their load-time default."""
+    for key, default in defaults.items():
+        if entry[key] == default:
+            del entry[key]
+    return entry
+
+
+def _skill_requirement_entry(req: SkillRequirement) -> dict[str, Any]:
+    """Build the stored form of a skill requirement.
+
+    Copies the instance __dict__ in one step rather than reading each
+    field; only skill_id needs converting to its canonical string.
+    """
+    entry = {**vars(req), "skill_id": req.skill_id.canonical}
+    return _drop_defaults(entry, _SKILL_REQUIREMENT_DEFAULTS)
+
+
+def _bid_entry(b: Bid) -> dict[str, Any]:
+    """Build the stored form of a bid from a shallow __dict__ copy."""
+    entry = {
+        **vars(b),
+        "state": b.state._value_,
+        "submitted_utc": _format_utc(b.submitted_utc),
+    }
+    return _drop_defaults(entry, _BID_DEFAULTS)
+
+
+def _mission_entry(m: Mission) -> dict[str, Any]:
+    """Build the stored form of a mission and its sub-records."""
+    return _drop_defaults({
+        "mission_id": m.mission_id,
+        "mission_title": m.mission_title,
+        "mission_class": m.mission_class._value_,
+        "risk_tier": m.risk_tier._value_,
+        "domain_type": m.domain_type._value_,
+        "state": m.state._value_,
+        "worker_id": m.worker_id,
+        "human_final_approval": m.human_final_approval,
+        "reviewers": [
+            {
+                "id": r.id,
+                "model_family": r.model_family,
+                "method_type": r.method_type,
+                "region": r.region,
+                "organization": r.organization,
+            }
+            for r in m.reviewers
+        ],
+        "review_decisions": [
+            _drop_defaults({
+                "reviewer_id": d.reviewer_id,
+                "decision": d.decision._value_,
+                "notes": d.notes,
+            }, _REVIEW_DECISION_DEFAULTS)
+            for d in m.review_decisions
+        ],
+        "evidence": [
+            {
+                "artifact_hash": e.artifact_hash,
+                "signature": e.signature,
+            }
+            for e in m.evidence
+        ],
+        "skill_requirements": [
+            _skill_requirement_entry(req)
+            for req in m.skill_requirements
+        ],
+    }, _MISSION_DEFAULTS)
+
+
+def _split_sections(text: str) -> Optional[dict[str, str]]:
+    """Split a one-section-per-line state file into raw section JSON.
+
+    Returns None for any other layout (a single-line or indented file),
+    which the caller then parses whole.
+    """
+    lines = text.split("\n")
+    if len(lines) < 2 or not text.startswith('{"') or not text.endswith("}"):
+        return None
+    last = len(lines) - 1
+    sections: dict[str, str] = {}
+    for i, line in enumerate(lines):
+        start = 1 if i == 0 else 0
+        if line[start:start + 1] != '"':
+            return None
+        try:
+            key, end = scanstring(line, start + 1)
+        except ValueError:
+            return None
+        if line[end:end + 2] != ": " or line[-1] != ("}" if i == last else ","):
+            return None
+        sections[key] = line[end + 2:-1]
+    return sections
+
+
+def _split_wal_line(line: str) -> tuple[str, Optional[str]]:
+    """Split a write-ahead log line into (section, raw JSON or None).
+
+    Lines are ["section", value] for a replaced section and ["section"]
+    for a removed one.
+    """
+    if line[:2] != '["':
+        raise ValueError(f"Malformed state log line: {line[:40]!r}")
+    section, end = scanstring(line, 2)
+    rest = line[end:]
+    if rest == "]":
+        return section, None
+    if rest[:2] != ", " or rest[-1:] != "]":
+        raise ValueError(f"Malformed state log line: {line[:40]!r}")
+    return section, rest[2:-1]
+
+
+def _enum_parser(enum_cls: type[_E]) -> Callable[[Any], _E]:
+    """Return a stored value -> member parser for enum_cls.
+
+    Known values cost one dict lookup instead of an Enum.__call__;
+    anything else falls through to enum_cls(value), which raises
+    ValueError as before.
+    """
+    lookup = enum_cls._value2member_map_.get
+
+    def parse(value: Any) -> _E:
+        member = lookup(value)
+        return member if member is not None else enum_cls(value)
+
+    return parse
+
+
+_parse_actor_kind = _enum_parser(ActorKind)
+_parse_actor_status = _enum_parser(ActorStatus)
+_parse_mission_class = _enum_parser(MissionClass)
+_parse_risk_tier = _enum_parser(RiskTier)
+_parse_domain_type = _enum_parser(DomainType)
+_parse_mission_state = _enum_parser(MissionState)
+_parse_review_decision_verdict = _enum_parser(ReviewDecisionVerdict)
+_parse_listing_state = _enum_parser(ListingState)
+_parse_bid_state = _enum_parser(BidState)
+_parse_adjudication_verdict = _enum_parser(AdjudicationVerdict)
+_parse_leave_category = _enum_parser(LeaveCategory)
+_parse_leave_state = _enum_parser(LeaveState)
+
+
+def _slots_builder(cls: type[_T]) -> Callable[[dict[str, Any]], _T]:
+    """Return a stored dict -> instance builder for a slotted dataclass.
+
+    Each field is set through its slot descriptor, skipping the keyword
+    dispatch of cls(**data). That is only equivalent when __init__ does
+    nothing but assign fields, so classes with __post_init__ are refused.
+    A missing field raises KeyError.
+    """
+    if hasattr(cls, "__post_init__"):
+        raise TypeError(f"{cls.__name__} defines __post_init__")
+    setters = [(f.name, getattr(cls, f.name).__set__) for f in fields(cls)]
+    new = object.__new__
+
+    def build(data: dict[str, Any]) -> _T:
+        obj = new(cls)
+        for name, set_field in setters:
+            set_field(obj, data[name])
+        return obj
+
+    return build
+
+
+_build_reviewer = _slots_builder(Reviewer)
+_build_evidence_record = _slots_builder(EvidenceRecord)
+
+# Skill requirements repeat the same few canonical strings across every
+# mission and listing. SkillId is frozen, so parsed instances can be
+# shared; invalid strings raise and are never cached.
+_parse_skill_id = lru_cache(maxsize=4096)(SkillId.parse)
+
+
+def _format_utc(dt: Optional[datetime]) -> Optional[str]:
+    """Format a timestamp as YYYY-MM-DDTHH:MM:SSZ, passing None through.
+
+    Slices isoformat(), which is several times cheaper than strftime()
+    re-reading its format string for every timestamp saved.
+    """
+    if dt is None:
+        return None
+    return dt.isoformat()[:19] + "Z"
+
+
+def _parse_utc(value: Optional[str]) -> Optional[datetime]:
+    """Parse a YYYY-MM-DDTHH:MM:SSZ timestamp; empty or None gives None.
+
+    fromisoformat() is a fixed-format C parser, several times faster
+    than strptime() interpreting its format string per call. Given an
+    explicit +00:00 offset it returns an aware datetime on the shared
+    timezone.utc directly, with no second replace(tzinfo=...) copy.
+    """
+    if not value:
+        return None
+    if value[-1] != "Z":
+        raise ValueError(f"Expected a UTC timestamp ending in Z: {value!r}")
+    return datetime.fromisoformat(value[:-1] + "+00:00")
+
+
+# Every reviewer on a mission is assessed in the same second, so
+# assessment timestamps repeat across histories. A cache hit is several
+# times cheaper than a parse, but a miss costs more than parsing, so
+# this is only used where repeats are the norm. datetimes are immutable
+# and safe to share.
+_parse_repeated_utc = lru_cache(maxsize=4096)(_parse_utc)
+
+
+# ----------------------------------------------------------------------
+# Record builders used by the load_* methods
+# ----------------------------------------------------------------------
+
+
+def _domain_score_from_state(domain: str, data: dict[str, Any]) -> DomainTrustScore:
+    """Rebuild a domain trust score stored under its domain key."""
+    get = data.get
+    return DomainTrustScore(
+        domain=get("domain", domain),
+        score=get("score", 0.0),
+        quality=get("quality", 0.0),
+        reliability=get("reliability", 0.0),
+        volume=get("volume", 0.0),
+        effort=get("effort", 0.0),
+        mission_count=get("mission_count", 0),
+        last_active_utc=_parse_utc(get("last_active_utc")),
+    )
+
+
+def _trust_record_from_state(data: dict[str, Any]) -> TrustRecord:
+    """Rebuild a trust record, including its per-domain scores."""
+    get = data.get
+    record = TrustRecord(
+        actor_id=data["actor_id"],
+        actor_kind=_parse_actor_kind(data["actor_kind"]),
+        score=data["score"],
+        quality=get("quality", 0.0),
+        reliability=get("reliability", 0.0),
+        volume=get("volume", 0.0),
+        effort=get("effort", 0.0),
+        last_active_utc=_parse_utc(get("last_active_utc")),
+        domain_scores={
+            domain: _domain_score_from_state(domain, ds_data)
+            for domain, ds_data in get("domain_scores", {}).items()
+        },
+    )
+    record.quarantined = get("quarantined", False)
+    record.decommissioned = get("decommissioned", False)
+    return record
+
+
+def _skill_requirement_from_state(data: dict[str, Any]) -> SkillRequirement:
+    """Rebuild a mission or listing skill requirement."""
+    return SkillRequirement(
+        skill_id=_parse_skill_id(data["skill_id"]),
+        minimum_proficiency=data.get("minimum_proficiency", 0.0),
+        required=data.get("required", True),
+    )
+
+
+def _mission_from_state(data: dict[str, Any]) -> Mission:
+    """Rebuild a mission with its reviewers, decisions and evidence."""
+    get = data.get
+    return Mission(
+        mission_id=data["mission_id"],
+        mission_title=data["mission_title"],
+        mission_class=_parse_mission_class(data["mission_class"]),
+        risk_tier=_parse_risk_tier(data["risk_tier"]),
+        domain_type=_parse_domain_type(data["domain_type"]),
+        state=_parse_mission_state(data["state"]),
+        worker_id=get("worker_id"),
+        human_final_approval=get("human_final_approval", False),
+        reviewers=[_build_reviewer(r) for r in get("reviewers", [])],
+        review_decisions=[
+            ReviewDecision(
+                reviewer_id=d["reviewer_id"],
+                decision=_parse_review_decision_verdict(d["decision"]),
+                notes=d.get("notes", ""),
+            )
+            for d in get("review_decisions", [])
+        ],
+        evidence=[_build_evidence_record(e) for e in get("evidence", [])],
+        skill_requirements=[
+            _skill_requirement_from_state(sr)
+            for sr in get("skill_requirements", [])
+        ],
+    )
+
+
+def _listing_from_state(data: dict[str, Any]) -> MarketListing:
+    """Rebuild a market listing."""
+    get = data.get
+    return MarketListing(
+        listing_id=data["listing_id"],
+        title=data["title"],
+        description=data["description"],
+        creator_id=data["creator_id"],
+        state=_parse_listing_state(data["state"]),
+        skill_requirements=[
+            _skill_requirement_from_state(sr)
+            for sr in get("skill_requirements", [])
+        ],
+        created_utc=_parse_utc(get("created_utc")),
+        opened_utc=_parse_utc(get("opened_utc")),
+        allocated_utc=_parse_utc(get("allocated_utc")),
+        allocated_worker_id=get("allocated_worker_id"),
+        allocated_mission_id=get("allocated_mission_id"),
+        domain_tags=get("domain_tags", []),
+        preferences=get("preferences", {}),
+    )
+
+
+def _bid_from_state(data: dict[str, Any]) -> Bid:
+    """Rebuild a bid on a market listing."""
+    get = data.get
+    return Bid(
+        bid_id=data["bid_id"],
+        listing_id=data["listing_id"],
+        worker_id=data["worker_id"],
+        state=_parse_bid_state(data["state"]),
+        relevance_score=get("relevance_score", 0.0),
+        global_trust=get("global_trust", 0.0),
+        domain_trust=get("domain_trust", 0.0),
+        composite_score=get("composite_score", 0.0),
+        submitted_utc=_parse_utc(get("submitted_utc")),
+        notes=get("notes", ""),
+    )
+
+
+def _adjudication_from_state(data: dict[str, Any]) -> LeaveAdjudication:
+    """Rebuild one adjudicator's decision on a leave request."""
+    get = data.get
+    return LeaveAdjudication(
+        adjudicator_id=data["adjudicator_id"],
+        verdict=_parse_adjudication_verdict(data["verdict"]),
+        domain_qualified=data["domain_qualified"],
+        trust_score_at_decision=data["trust_score_at_decision"],
+        notes=get("notes", ""),
+        timestamp_utc=_parse_utc(get("timestamp_utc")),
+    )
+
+
+def _leave_record_from_state(data: dict[str, Any]) -> LeaveRecord:
+    """Rebuild a leave record with its adjudications and freeze snapshot."""
+    get = data.get
+    # Legacy compat: map "permanent" → "memorialised"
+    raw_state = data["state"]
+    if raw_state == "permanent":
+        raw_state = "memorialised"
+    return LeaveRecord(
+        leave_id=data["leave_id"],
+        actor_id=data["actor_id"],
+        category=_parse_leave_category(data["category"]),
+        state=_parse_leave_state(raw_state),
+        reason_summary=get("reason_summary", ""),
+        petitioner_id=get("petitioner_id"),
+        adjudications=[
+            _adjudication_from_state(adj_data)
+            for adj_data in get("adjudications", [])
+        ],
+        trust_score_at_freeze=get("trust_score_at_freeze"),
+        last_active_utc_at_freeze=_parse_utc(get("last_active_utc_at_freeze")),
+        domain_scores_at_freeze={
+            domain: _domain_score_from_state(domain, ds_data)
+            for domain, ds_data in get("domain_scores_at_freeze", {}).items()
+        },
+        pre_leave_status=get("pre_leave_status"),
+        granted_duration_days=get("granted_duration_days"),
+        expires_utc=_parse_utc(get("expires_utc")),
+        requested_utc=_parse_utc(get("requested_utc")),
+        approved_utc=_parse_utc(get("approved_utc")),
+        denied_utc=_parse_utc(get("denied_utc")),
+        returned_utc=_parse_utc(get("returned_utc")),
+        memorialised_utc=_parse_utc(get("memorialised_utc")),
+    )
+
 
 class StateStore:
     """JSON file-based state persistence.
@@ -71,59 +556,429 @@ class StateStore:
         roster = store.load_roster()
         missions = store.load_missions()
         prev_hash, count = store.load_epoch_state()
+
+    Leave records are kept in an append-only sidecar log next to the
+    state file (state.leave.jsonl for state.json). A storage path
+    ending in .gz stores the state file gzip-compressed.
+
+    Each save_* writes the whole file. To save several sections with
+    one write:
+        with store.save_batch():
+            store.save_roster(roster)
+            store.save_missions(missions)
     """
 
     def __init__(self, storage_path: Path) -> None:
         self._path = storage_path
         self._state: dict[str, Any] = {}
+        # Open save_batch() blocks, and whether a save_* inside them
+        # changed state that is not yet written.
+        self._batch_depth = 0
+        self._dirty = False
+        # Encoded JSON per top-level section, dropped when the section is
+        # saved again, so a write re-encodes only what changed.
+        self._encoded: dict[str, str] = {}
+        # Sections read from disk but not parsed yet; each is parsed by
+        # _section() on first use. Their text doubles as the encoding.
+        self._unparsed: dict[str, str] = {}
+        # Sections saved since the last write, with the encoding that
+        # write used (None if it had none). _synced is whether the file
+        # holds exactly the encodings in _encoded; when it does and no
+        # saved section encodes differently, flush() skips the write.
+        self._replaced: dict[str, Optional[str]] = {}
+        self._synced = False
+        # Write-ahead log for large states (state.json -> state.wal.jsonl).
+        # Its first line names the SHA-256 of the state file it extends,
+        # so a log already folded into a newer file is ignored on load.
+        # _main_size and _main_digest describe the state file on disk
+        # (the digest only once it is large enough to use the log);
+        # _wal_size is the valid log's size, None when there is none, and
+        # _wal_stale whether an ignored log file is still on disk.
+        self._wal_path = storage_path.with_suffix(".wal.jsonl")
+        self._main_size = 0
+        self._main_digest: Optional[str] = None
+        self._wal_size: Optional[int] = None
+        self._wal_stale = False
+        # Serialized entries of sealed leave records, keyed by leave_id
+        # with the record they were built from. Only records the caller
+        # has already sealed are cached: sealed records never change, so
+        # their entries are reused while the record object is.
+        self._sealed_leave_entries: dict[str, tuple[LeaveRecord, dict[str, Any]]] = {}
+        # Serialized reviewer assessments keyed by id() with the frozen
+        # assessment they were built from, so entries still in a
+        # reviewer's window are not rebuilt on every save.
+        self._assessment_entries: dict[
+            int, tuple[ReviewerQualityAssessment, dict[str, Any]]
+        ] = {}
+        # Leave records live in an append-only sidecar log
+        # (state.json -> state.leave.jsonl), one entry per line, last
+        # line per leave_id wins. A save appends only the records that
+        # changed. _leave_logged is what the log holds once
+        # _leave_pending is written; _leave_entries also includes
+        # records still in a pre-log state file's "leave_records".
+        self._leave_path = storage_path.with_suffix(".leave.jsonl")
+        self._leave_entries: dict[str, dict[str, Any]] = {}
+        self._leave_logged: dict[str, dict[str, Any]] = {}
+        self._leave_pending: list[str] = []
+        self._leave_log_lines = 0
+        self._leave_log_compact = False
         if storage_path.exists():
             self._load()
+        removed: set[str] = set()
+        if self._leave_path.exists():
+            removed = self._load_leave_log()
+        self._leave_entries = {
+            leave_id: entry
+            for leave_id, entry in self._section("leave_records", {}).items()
+            if leave_id not in removed
+        }
+        self._leave_entries.update(self._leave_logged)
+        # Set once a save has moved the state file's "leave_records" into
+        # the log; flush() drops the section after the log is written.
+        self._leave_legacy = False
 
     def _load(self) -> None:
-        with self._path.open("r", encoding="utf-8") as f:
-            self._state = json.load(f)
-
-    def _save(self) -> None:
+        raw = self._path.read_bytes()
+        self._main_size = len(raw)
+        wal_exists = self._wal_path.exists()
+        if wal_exists or len(raw) >= _WAL_MIN_STATE_BYTES:
+            self._main_digest = hashlib.sha256(raw).hexdigest()
+        if raw[:2] == _GZIP_MAGIC:
+            raw = gzip.decompress(raw)
+        text = raw.decode("utf-8")
+        sections = _split_sections(text)
+        if sections is None:
+            self._state = json.loads(text)
+        else:
+            self._unparsed = sections
+            self._encoded.update(sections)
+            self._synced = True
+        if wal_exists:
+            self._load_wal()
+
+    def _load_wal(self) -> None:
+        """Replay the write-ahead log over the loaded sections.
+
+        A log whose header names a different state file is stale (it was
+        folded in before a crash could remove it) and is ignored. A torn
+        final line is ignored too; either way the next write rewrites
+        the state file whole.
+        """
+        data = self._wal_path.read_bytes()
+        lines = data.split(b"\n")
+        try:
+            header = json.loads(lines[0])
+        except ValueError:
+            header = {}
+        if len(lines) < 2 or header.get("base") != self._main_digest:
+            self._wal_stale = True
+            return
+        for line in lines[1:-1]:
+            section, text = _split_wal_line(line.decode("utf-8"))
+            self._state.pop(section, None)
+            if text is None:
+                self._unparsed.pop(section, None)
+                self._encoded.pop(section, None)
+            else:
+                self._unparsed[section] = self._encoded[section] = text
+        if lines[-1]:
+            # The replayed lines are only on disk in this log; write them
+            # into the state file before logging anything new.
+            self._wal_stale = True
+            self._synced = False
+        else:
+            self._wal_size = len(data)
+
+    def _section(self, name: str, default: Any) -> Any:
+        """Return a top-level section, parsing it on first use."""
+        raw = self._unparsed.pop(name, None)
+        if raw is not None:
+            self._state[name] = json.loads(raw)
+        return self._state.get(name, default)
+
+    def _load_leave_log(self) -> set[str]:
+        """Replay the leave log into _leave_logged.
+
+        Returns the IDs whose last line is a removal. A torn final line
+        (a crash mid-append) is ignored, and the log is rewritten on its
+        next write.
+        """
+        removed: set[str] = set()
+        logged = self._leave_logged
+        lines = self._leave_path.read_bytes().split(b"\n")
+        for i, line in enumerate(lines):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                if i == len(lines) - 1:
+                    self._leave_log_compact = True
+                    break
+                raise
+            self._leave_log_lines += 1
+            leave_id = entry["leave_id"]
+            if entry.get("removed"):
+                logged.pop(leave_id, None)
+                removed.add(leave_id)
+            else:
+                logged[leave_id] = entry
+                removed.discard(leave_id)
+        return removed
+
+    def _save(self, *sections: str) -> None:
+        """Write the state after the given sections were replaced."""
+        self._mark_replaced(*sections)
+        self._write_or_defer()
+
+    def _mark_replaced(self, *sections: str) -> None:
+        """Drop stale encodings of sections whose value was replaced."""
+        for section in sections:
+            previous = self._encoded.pop(section, None)
+            self._replaced.setdefault(section, previous)
+            self._unparsed.pop(section, None)
+
+    def _save_encoded(self, section: str, text: str) -> None:
+        """Write the state after a section was replaced by its encoding.
+
+        The section is kept only as text, parsed again if it is loaded.
+        """
+        self._replaced.setdefault(section, self._encoded.get(section))
+        self._encoded[section] = self._unparsed[section] = text
+        self._state.pop(section, None)
+        self._write_or_defer()
+
+    def _write_or_defer(self) -> None:
+        """Flush now, or mark the state dirty inside save_batch()."""
+        if self._batch_depth:
+            self._dirty = True
+            return
+        self.flush()
+
+    def flush(self, fsync: bool = False) -> None:
+        """Write the current state to disk now.
+
+        The file is assembled from per-section encodings, one section per
+        line, so a later load parses only the sections it is asked for;
+        sections never parsed are written back from their original text.
+        It is written to a sibling temporary file and renamed over the
+        old one, so a crash mid-write leaves the previous state intact.
+        With fsync=True the new file is forced to disk before the rename.
+
+        If every section saved since the last write encodes to the same
+        text, the file already holds this state and is not rewritten.
+        Once the file is large, the sections that changed are appended to
+        the write-ahead log instead (see _WAL_MIN_STATE_BYTES). fsync=True
+        always rewrites the file, folding in the log.
+
+        Pending leave-log lines are appended only after the state file
+        is written, so a failed or interrupted state write never leaves
+        the leave log (which wins on load) ahead of the rest of the
+        state. A crash between the two writes can only leave the leave
+        log one save behind.
+        """
+        self._write_main(fsync)
+        self._write_leave_log(fsync)
+        if self._leave_legacy:
+            # Records from a pre-log state file are now in the leave log;
+            # only now may the state file stop carrying them.
+            self._leave_legacy = False
+            self._state.pop("leave_records", None)
+            self._mark_replaced("leave_records")
+            self._write_main(fsync)
+
+    def _write_main(self, fsync: bool) -> None:
+        """Write the state file, or append changes to the write-ahead log."""
+        encode = _STATE_ENCODER.encode
+        encoded = self._encoded
+        for section, value in self._state.items():
+            if section not in encoded:
+                encoded[section] = encode(value)
+        if self._synced and not fsync:
+            changed = [
+                section for section, previous in self._replaced.items()
+                if encoded.get(section) != previous
+            ]
+            if not changed or (
+                self._main_size >= _WAL_MIN_STATE_BYTES
+                and self._append_wal(changed)
+            ):
+                self._replaced.clear()
+                self._dirty = False
+                return
+        body = _SECTION_SEPARATOR.join(
+            f"{encode(section)}: {encoded[section]}"
+            for section in sorted(self._state.keys() | self._unparsed.keys())
+        )
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        with self._path.open("w", encoding="utf-8") as f:
-            json.dump(self._state, f, indent=2, sort_keys=True, ensure_ascii=False)
+        tmp = self._path.with_name(self._path.name + ".tmp")
+        data = ("{" + body + "}").encode("utf-8")
+        if self._path.suffix == ".gz":
+            data = gzip.compress(data, compresslevel=_GZIP_LEVEL, mtime=0)
+        with tmp.open("wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, self._path)
+        self._main_size = len(data)
+        if len(data) >= _WAL_MIN_STATE_BYTES:
+            self._main_digest = hashlib.sha256(data).hexdigest()
+        if self._wal_size is not None or self._wal_stale:
+            # The log now names the replaced file, so a crash before
+            # this unlink leaves it stale rather than replayed.
+            self._wal_path.unlink(missing_ok=True)
+            self._wal_size = None
+            self._wal_stale = False
+        self._replaced.clear()
+        self._synced = True
+        self._dirty = False
+
+    def _append_wal(self, changed: list[str]) -> bool:
+        """Append the changed sections to the write-ahead log.
+
+        Returns False, writing nothing, when the log would outgrow the
+        state file; the caller then rewrites the file instead.
+        """
+        encode = _STATE_ENCODER.encode
+        encoded = self._encoded
+        lines = []
+        for section in changed:
+            text = encoded.get(section)
+            if text is None:
+                lines.append(f"[{encode(section)}]")
+            else:
+                lines.append(f"[{encode(section)}, {text}]")
+        data = ("\n".join(lines) + "\n").encode("utf-8")
+        size = self._wal_size
+        if size is None:
+            header = encode({"base": self._main_digest}) + "\n"
+            data = header.encode("utf-8") + data
+            size, mode = 0, "wb"
+        else:
+            mode = "ab"
+        if size + len(data) > self._main_size:
+            return False
+        try:
+            with self._wal_path.open(mode) as f:
+                f.write(data)
+        except OSError:
+            # A partial append cannot be extended safely; rewrite the
+            # state file whole on the next flush, removing the log.
+            self._synced = False
+            self._wal_stale = True
+            raise
+        self._wal_size = size + len(data)
+        self._wal_stale = False
+        return True
+
+    def _write_leave_log(self, fsync: bool) -> None:
+        """Append pending leave entries, or compact the log instead.
+
+        The log is rewritten from the current entries (temporary file
+        and rename) when superseded lines would outnumber live ones, or
+        after a failed append, which may have left a torn line behind.
+        """
+        pending = self._leave_pending
+        if not pending:
+            return
+        logged = self._leave_logged
+        lines = self._leave_log_lines + len(pending)
+        if self._leave_log_compact or lines > 2 * len(logged) + _LEAVE_LOG_SLACK:
+            encode = _STATE_ENCODER.encode
+            pending = [encode(entry) for entry in logged.values()]
+            path = self._leave_path.with_name(self._leave_path.name + ".tmp")
+            mode = "wb"
+            lines = len(pending)
+        else:
+            path = self._leave_path
+            mode = "ab"
+        self._leave_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with path.open(mode) as f:
+                if pending:
+                    f.write(("\n".join(pending) + "\n").encode("utf-8"))
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+        except OSError:
+            # A partial append cannot be extended safely; the next write
+            # rewrites the log whole from _leave_logged instead.
+            self._leave_log_compact = True
+            raise
+        if path != self._leave_path:
+            os.replace(path, self._leave_path)
+        self._leave_log_lines = lines
+        self._leave_log_compact = False
+        self._leave_pending.clear()
+
+    @contextmanager
+    def save_batch(self) -> Iterator[None]:
+        """Coalesce the writes of save_* calls in the block into one.
+
+        The state is written when the outermost block exits, and write
+        errors (OSError) are raised there. If the block raises, nothing
+        is written; call flush() to write the state regardless.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+        if not self._batch_depth and self._dirty:
+            self.flush()
 
     # ------------------------------------------------------------------
     # Roster persistence
     # ------------------------------------------------------------------
 
     def save_roster(self, roster: ActorRoster) -> None:
-        """Serialize the actor roster to state."""
-        entries = []
-        for actor in roster.all_actors():
-            entries.append({
-                "actor_id": actor.actor_id,
-                "actor_kind": actor.actor_kind.value,
-                "trust_score": actor.trust_score,
-                "region": actor.region,
-                "organization": actor.organization,
-                "model_family": actor.model_family,
-                "method_type": actor.method_type,
-                "status": actor.status.value,
-            })
-        self._state["roster"] = entries
-        self._save()
+        """Serialize the actor roster to state.
+
+        Stored column-wise (one list per field, aligned by index), so
+        field names are written once rather than once per actor.
+        """
+        actors = roster.all_actors()
+        self._state["roster"] = {
+            "actor_id": [a.actor_id for a in actors],
+            "actor_kind": [a.actor_kind._value_ for a in actors],
+            "trust_score": [a.trust_score for a in actors],
+            "region": [a.region for a in actors],
+            "organization": [a.organization for a in actors],
+            "model_family": [a.model_family for a in actors],
+            "method_type": [a.method_type for a in actors],
+            "status": [a.status._value_ for a in actors],
+        }
+        self._save("roster")
 
     def load_roster(self) -> ActorRoster:
-        """Deserialize the actor roster from state."""
+        """Deserialize the actor roster from state.
+
+        Also accepts the earlier row-per-actor layout. IDs and the
+        categorical fields are interned: a large roster repeats a few
+        regions, organizations and model families many times over.
+        """
+        intern = sys.intern
         roster = ActorRoster()
-        for data in self._state.get("roster", []):
-            entry = RosterEntry(
-                actor_id=data["actor_id"],
-                actor_kind=ActorKind(data["actor_kind"]),
-                trust_score=data["trust_score"],
-                region=data["region"],
-                organization=data["organization"],
-                model_family=data["model_family"],
-                method_type=data["method_type"],
-                status=ActorStatus(data["status"]),
-            )
-            roster.register(entry)
+        data = self._section("roster", [])
+        if isinstance(data, list):
+            rows = [[row[c] for c in _ROSTER_COLUMNS] for row in data]
+        else:
+            rows = zip(*(data[c] for c in _ROSTER_COLUMNS))
+        for (
+            actor_id, actor_kind, trust_score, region,
+            organization, model_family, method_type, status,
+        ) in rows:
+            roster.register(RosterEntry(
+                actor_id=intern(actor_id),
+                actor_kind=_parse_actor_kind(actor_kind),
+                trust_score=trust_score,
+                region=intern(region),
+                organization=intern(organization),
+                model_family=intern(model_family),
+                method_type=intern(method_type),
+                status=_parse_actor_status(status),
+            ))
         return roster
 
     # ------------------------------------------------------------------
@@ -131,14 +986,20 @@ class StateStore:
     # ------------------------------------------------------------------
 
     def save_trust_records(self, records: dict[str, TrustRecord]) -> None:
-        """Serialize trust records to state."""
-        entries = {}
-        for actor_id, record in records.items():
+        """Serialize trust records to state.
+
+        Stored column-wise like the roster, so loading parses a few long
+        lists instead of one small dict per actor. A column whose values
+        all equal the load-time default is left out.
+        """
+        recs = [record for _, record in sorted(records.items())]
+        domain_scores_column: list[dict[str, dict[str, Any]]] = []
+        for record in recs:
             # Serialize domain scores
             domain_scores_data: dict[str, dict[str, Any]] = {}
             for domain, ds in record.domain_scores.items():
                 if isinstance(ds, DomainTrustScore):
-                    domain_scores_data[domain] = {
+                    domain_scores_data[domain] = _drop_defaults({
                         "domain": ds.domain,
                         "score": ds.score,
                         "quality": ds.quality,
@@ -146,76 +1007,67 @@ class StateStore:
                         "volume": ds.volume,
                         "effort": ds.effort,
                         "mission_count": ds.mission_count,
-                        "last_active_utc": (
-                            ds.last_active_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
-                            if ds.last_active_utc
-                            else None
-                        ),
-                    }
-
-            entries[actor_id] = {
-                "actor_id": record.actor_id,
-                "actor_kind": record.actor_kind.value,
-                "score": record.score,
-                "quality": record.quality,
-                "reliability": record.reliability,
-                "volume": record.volume,
-                "effort": record.effort,
-                "quarantined": record.quarantined,
-                "decommissioned": record.decommissioned,
-                "last_active_utc": (
-                    record.last_active_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
-                    if record.last_active_utc
-                    else None
-                ),
-                "domain_scores": domain_scores_data,
-            }
-        self._state["trust_records"] = entries
-        self._save()
+                        "last_active_utc": _format_utc(ds.last_active_utc),
+                    }, _DOMAIN_SCORE_DEFAULTS)
+            domain_scores_column.append(domain_scores_data)
+
+        columns: dict[str, list[Any]] = {
+            "actor_id": [r.actor_id for r in recs],
+            "actor_kind": [r.actor_kind._value_ for r in recs],
+            "score": [r.score for r in recs],
+            "quality": [r.quality for r in recs],
+            "reliability": [r.reliability for r in recs],
+            "volume": [r.volume for r in recs],
+            "effort": [r.effort for r in recs],
+            "quarantined": [r.quarantined for r in recs],
+            "decommissioned": [r.decommissioned for r in recs],
+            "last_active_utc": [_format_utc(r.last_active_utc) for r in recs],
+            "domain_scores": domain_scores_column,
+        }
+        for name, default in _TRUST_RECORD_DEFAULTS.items():
+            if all(value == default for value in columns[name]):
+                del columns[name]
+        self._state["trust_records"] = columns
+        self._save("trust_records")
 
     def load_trust_records(self) -> dict[str, TrustRecord]:
-        """Deserialize trust records from state."""
-        records = {}
-        for actor_id, data in self._state.get("trust_records", {}).items():
-            # Deserialize domain scores
-            domain_scores: dict[str, DomainTrustScore] = {}
-            for domain, ds_data in data.get("domain_scores", {}).items():
-                last_active = None
-                if ds_data.get("last_active_utc"):
-                    last_active = datetime.strptime(
-                        ds_data["last_active_utc"], "%Y-%m-%dT%H:%M:%SZ"
-                    ).replace(tzinfo=timezone.utc)
-                domain_scores[domain] = DomainTrustScore(
-                    domain=ds_data.get("domain", domain),
-                    score=ds_data.get("score", 0.0),
-                    quality=ds_data.get("quality", 0.0),
-                    reliability=ds_data.get("reliability", 0.0),
-                    volume=ds_data.get("volume", 0.0),
-                    effort=ds_data.get("effort", 0.0),
-                    mission_count=ds_data.get("mission_count", 0),
-                    last_active_utc=last_active,
-                )
-
-            # Deserialize last_active_utc for the global record
-            last_active_utc = None
-            if data.get("last_active_utc"):
-                last_active_utc = datetime.strptime(
-                    data["last_active_utc"], "%Y-%m-%dT%H:%M:%SZ"
-                ).replace(tzinfo=timezone.utc)
+        """Deserialize trust records from state.
 
+        Records are keyed by actor_id. Also accepts the earlier
+        dict-per-actor layout.
+        """
+        data = self._section("trust_records", {})
+        if not isinstance(data.get("actor_id"), list):
+            return {
+                actor_id: _trust_record_from_state(entry)
+                for actor_id, entry in data.items()
+            }
+        count = len(data["actor_id"])
+        records: dict[str, TrustRecord] = {}
+        for (
+            actor_id, actor_kind, score, quality, reliability, volume,
+            effort, quarantined, decommissioned, last_active_utc,
+            domain_scores,
+        ) in zip(*(
+            data[c] if c in data else [_TRUST_RECORD_DEFAULTS[c]] * count
+            for c in _TRUST_COLUMNS
+        )):
             record = TrustRecord(
-                actor_id=data["actor_id"],
-                actor_kind=ActorKind(data["actor_kind"]),
-                score=data["score"],
-                quality=data.get("quality", 0.0),
-                reliability=data.get("reliability", 0.0),
-                volume=data.get("volume", 0.0),
-                effort=data.get("effort", 0.0),
-                last_active_utc=last_active_utc,
-                domain_scores=domain_scores,
+                actor_id=actor_id,
+                actor_kind=_parse_actor_kind(actor_kind),
+                score=score,
+                quality=quality,
+                reliability=reliability,
+                volume=volume,
+                effort=effort,
+                last_active_utc=_parse_utc(last_active_utc),
+                domain_scores={
+                    domain: _domain_score_from_state(domain, ds_data)
+                    for domain, ds_data in domain_scores.items()
+                },
             )
-            record.quarantined = data.get("quarantined", False)
-            record.decommissioned = data.get("decommissioned", False)
+            record.quarantined = quarantined
+            record.decommissioned = decommissioned
             records[actor_id] = record
         return records
 
@@ -224,93 +1076,24 @@ class StateStore:
     # ------------------------------------------------------------------
 
     def save_missions(self, missions: dict[str, Mission]) -> None:
-        """Serialize missions to state."""
-        entries = {}
-        for mid, m in missions.items():
-            entries[mid] = {
-                "mission_id": m.mission_id,
-                "mission_title": m.mission_title,
-                "mission_class": m.mission_class.value,
-                "risk_tier": m.risk_tier.value,
-                "domain_type": m.domain_type.value,
-                "state": m.state.value,
-                "worker_id": m.worker_id,
-                "human_final_approval": m.human_final_approval,
-                "reviewers": [
-                    {
-                        "id": r.id,
-                        "model_family": r.model_family,
-                        "method_type": r.method_type,
-                        "region": r.region,
-                        "organization": r.organization,
-                    }
-                    for r in m.reviewers
-                ],
-                "review_decisions": [
-                    {
-                        "reviewer_id": d.reviewer_id,
-                        "decision": d.decision.value,
-                        "notes": d.notes,
-                    }
-                    for d in m.review_decisions
-                ],
-                "evidence": [
-                    {
-                        "artifact_hash": e.artifact_hash,
-                        "signature": e.signature,
-                    }
-                    for e in m.evidence
-                ],
-                "skill_requirements": [
-                    {
-                        "skill_id": req.skill_id.canonical,
-                        "minimum_proficiency": req.minimum_proficiency,
-                        "required": req.required,
-                    }
-                    for req in m.skill_requirements
-                ],
-            }
-        self._state["missions"] = entries
-        self._save()
+        """Serialize missions to state.
+
+        Each mission is encoded as soon as its entry is built, so only
+        one mission's entry tree is alive at a time rather than the
+        whole section's.
+        """
+        encode = _STATE_ENCODER.encode
+        parts: list[str] = []
+        for mid in sorted(missions):
+            parts.append(f"{encode(mid)}: {encode(_mission_entry(missions[mid]))}")
+        self._save_encoded("missions", "{" + ", ".join(parts) + "}")
 
     def load_missions(self) -> dict[str, Mission]:
         """Deserialize missions from state."""
-        missions = {}
-        for mid, data in self._state.get("missions", {}).items():
-            mission = Mission(
-                mission_id=data["mission_id"],
-                mission_title=data["mission_title"],
-                mission_class=MissionClass(data["mission_class"]),
-                risk_tier=RiskTier(data["risk_tier"]),
-                domain_type=DomainType(data["domain_type"]),
-                state=MissionState(data["state"]),
-                worker_id=data.get("worker_id"),
-                human_final_approval=data.get("human_final_approval", False),
-                reviewers=[
-                    Reviewer(**r) for r in data.get("reviewers", [])
-                ],
-                review_decisions=[
-                    ReviewDecision(
-                        reviewer_id=d["reviewer_id"],
-                        decision=ReviewDecisionVerdict(d["decision"]),
-                        notes=d.get("notes", ""),
-                    )
-                    for d in data.get("review_decisions", [])
-                ],
-                evidence=[
-                    EvidenceRecord(**e) for e in data.get("evidence", [])
-                ],
-                skill_requirements=[
-                    SkillRequirement(
-                        skill_id=SkillId.parse(sr["skill_id"]),
-                        minimum_proficiency=sr.get("minimum_proficiency", 0.0),
-                        required=sr.get("required", True),
-                    )
-                    for sr in data.get("skill_requirements", [])
-                ],
-            )
-            missions[mid] = mission
-        return missions
+        return {
+            mid: _mission_from_state(data)
+            for mid, data in self._section("missions", {}).items()
+        }
 
     # ------------------------------------------------------------------
     # Reviewer quality assessment history
@@ -326,43 +1109,51 @@ class StateStore:
         calibration scoring. We persist enough to reconstruct on restart.
         """
         entries: dict[str, list[dict[str, Any]]] = {}
-        for reviewer_id, assessments in histories.items():
-            entries[reviewer_id] = [
-                {
-                    "reviewer_id": a.reviewer_id,
-                    "mission_id": a.mission_id,
-                    "alignment_score": a.alignment_score,
-                    "calibration_score": a.calibration_score,
-                    "derived_quality": a.derived_quality,
-                    "assessment_utc": a.assessment_utc.strftime(
-                        "%Y-%m-%dT%H:%M:%SZ"
-                    ),
-                }
-                for a in assessments
-            ]
+        previous = self._assessment_entries
+        built: dict[int, tuple[ReviewerQualityAssessment, dict[str, Any]]] = {}
+        for reviewer_id, assessments in sorted(histories.items()):
+            rows = []
+            for a in assessments:
+                cached = previous.get(id(a))
+                if cached is None or cached[0] is not a:
+                    cached = (a, {
+                        "reviewer_id": a.reviewer_id,
+                        "mission_id": a.mission_id,
+                        "alignment_score": a.alignment_score,
+                        "calibration_score": a.calibration_score,
+                        "derived_quality": a.derived_quality,
+                        "assessment_utc": _format_utc(a.assessment_utc),
+                    })
+                built[id(a)] = cached
+                rows.append(cached[1])
+            entries[reviewer_id] = rows
+        self._assessment_entries = built
         self._state["reviewer_histories"] = entries
-        self._save()
+        self._save("reviewer_histories")
 
     def load_reviewer_histories(
         self,
     ) -> dict[str, list[ReviewerQualityAssessment]]:
-        """Deserialize reviewer quality assessment histories from state."""
+        """Deserialize reviewer quality assessment histories from state.
+
+        Reviewer and mission IDs are interned, since each recurs across
+        many histories.
+        """
+        intern = sys.intern
         histories: dict[str, list[ReviewerQualityAssessment]] = {}
-        for reviewer_id, entries in self._state.get(
+        for reviewer_id, entries in self._section(
             "reviewer_histories", {}
         ).items():
             assessments = []
             for data in entries:
                 assessments.append(
                     ReviewerQualityAssessment(
-                        reviewer_id=data["reviewer_id"],
-                        mission_id=data["mission_id"],
+                        reviewer_id=intern(data["reviewer_id"]),
+                        mission_id=intern(data["mission_id"]),
                         alignment_score=data["alignment_score"],
                         calibration_score=data["calibration_score"],
                         derived_quality=data["derived_quality"],
-                        assessment_utc=datetime.strptime(
-                            data["assessment_utc"], "%Y-%m-%dT%H:%M:%SZ"
-                        ).replace(tzinfo=timezone.utc),
+                        assessment_utc=_parse_repeated_utc(data["assessment_utc"]),
                     )
                 )
             histories[reviewer_id] = assessments
@@ -378,51 +1169,38 @@ class StateStore:
     ) -> None:
         """Serialize actor skill profiles to state."""
         entries: dict[str, dict[str, Any]] = {}
-        for actor_id, profile in profiles.items():
+        for actor_id, profile in sorted(profiles.items()):
             skills_data: dict[str, dict[str, Any]] = {}
             for canonical, sp in profile.skills.items():
-                skills_data[canonical] = {
+                skills_data[canonical] = _drop_defaults({
                     "domain": sp.skill_id.domain,
                     "skill": sp.skill_id.skill,
                     "proficiency_score": sp.proficiency_score,
                     "evidence_count": sp.evidence_count,
-                    "last_demonstrated_utc": (
-                        sp.last_demonstrated_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
-                        if sp.last_demonstrated_utc
-                        else None
-                    ),
+                    "last_demonstrated_utc": _format_utc(sp.last_demonstrated_utc),
                     "endorsement_count": sp.endorsement_count,
                     "source": sp.source,
-                }
-            entries[actor_id] = {
+                }, _SKILL_PROFICIENCY_DEFAULTS)
+            entries[actor_id] = _drop_defaults({
                 "actor_id": profile.actor_id,
                 "skills": skills_data,
                 "primary_domains": profile.primary_domains,
-                "updated_utc": (
-                    profile.updated_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
-                    if profile.updated_utc
-                    else None
-                ),
-            }
+                "updated_utc": _format_utc(profile.updated_utc),
+            }, _SKILL_PROFILE_DEFAULTS)
         self._state["skill_profiles"] = entries
-        self._save()
+        self._save("skill_profiles")
 
     def load_skill_profiles(self) -> dict[str, ActorSkillProfile]:
         """Deserialize actor skill profiles from state."""
         profiles: dict[str, ActorSkillProfile] = {}
-        for actor_id, data in self._state.get("skill_profiles", {}).items():
+        for actor_id, data in self._section("skill_profiles", {}).items():
             skills: dict[str, SkillProficiency] = {}
             for canonical, sp_data in data.get("skills", {}).items():
                 skill_id = SkillId(
                     domain=sp_data["domain"],
                     skill=sp_data["skill"],
                 )
-                last_demo = None
-                if sp_data.get("last_demonstrated_utc"):
-                    last_demo = datetime.strptime(
-                        sp_data["last_demonstrated_utc"],
-                        "%Y-%m-%dT%H:%M:%SZ",
-                    ).replace(tzinfo=timezone.utc)
+                last_demo = _parse_utc(sp_data.get("last_demonstrated_utc"))
 
                 skills[canonical] = SkillProficiency(
                     skill_id=skill_id,
@@ -433,12 +1211,7 @@ class StateStore:
                     source=sp_data.get("source", "outcome_derived"),
                 )
 
-            updated = None
-            if data.get("updated_utc"):
-                updated = datetime.strptime(
-                    data["updated_utc"],
-                    "%Y-%m-%dT%H:%M:%SZ",
-                ).replace(tzinfo=timezone.utc)
+            updated = _parse_utc(data.get("updated_utc"))
 
             profiles[actor_id] = ActorSkillProfile(
                 actor_id=data["actor_id"],
@@ -459,135 +1232,49 @@ class StateStore:
     ) -> None:
         """Serialize market listings and bids to state."""
         listing_entries: dict[str, dict[str, Any]] = {}
-        for lid, listing in listings.items():
-            listing_entries[lid] = {
+        for lid, listing in sorted(listings.items()):
+            listing_entries[lid] = _drop_defaults({
                 "listing_id": listing.listing_id,
                 "title": listing.title,
                 "description": listing.description,
                 "creator_id": listing.creator_id,
-                "state": listing.state.value,
+                "state": listing.state._value_,
                 "skill_requirements": [
-                    {
-                        "skill_id": req.skill_id.canonical,
-                        "minimum_proficiency": req.minimum_proficiency,
-                        "required": req.required,
-                    }
+                    _skill_requirement_entry(req)
                     for req in listing.skill_requirements
                 ],
-                "created_utc": (
-                    listing.created_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
-                    if listing.created_utc else None
-                ),
-                "opened_utc": (
-                    listing.opened_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
-                    if listing.opened_utc else None
-                ),
-                "allocated_utc": (
-                    listing.allocated_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
-                    if listing.allocated_utc else None
-                ),
+                "created_utc": _format_utc(listing.created_utc),
+                "opened_utc": _format_utc(listing.opened_utc),
+                "allocated_utc": _format_utc(listing.allocated_utc),
                 "allocated_worker_id": listing.allocated_worker_id,
                 "allocated_mission_id": listing.allocated_mission_id,
                 "domain_tags": listing.domain_tags,
                 "preferences": listing.preferences,
-            }
+            }, _LISTING_DEFAULTS)
 
         bid_entries: dict[str, list[dict[str, Any]]] = {}
-        for lid, bid_list in bids.items():
+        for lid, bid_list in sorted(bids.items()):
             bid_entries[lid] = [
-                {
-                    "bid_id": b.bid_id,
-                    "listing_id": b.listing_id,
-                    "worker_id": b.worker_id,
-                    "state": b.state.value,
-                    "relevance_score": b.relevance_score,
-                    "global_trust": b.global_trust,
-                    "domain_trust": b.domain_trust,
-                    "composite_score": b.composite_score,
-                    "submitted_utc": (
-                        b.submitted_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
-                        if b.submitted_utc else None
-                    ),
-                    "notes": b.notes,
-                }
-                for b in bid_list
+                _bid_entry(b) for b in bid_list
             ]
 
         self._state["listings"] = listing_entries
         self._state["bids"] = bid_entries
-        self._save()
+        self._save("listings", "bids")
 
     def load_listings(self) -> tuple[dict[str, MarketListing], dict[str, list[Bid]]]:
         """Deserialize market listings and bids from state.
 
         Returns (listings_dict, bids_dict).
         """
-        listings: dict[str, MarketListing] = {}
-        for lid, data in self._state.get("listings", {}).items():
-            created_utc = None
-            if data.get("created_utc"):
-                created_utc = datetime.strptime(
-                    data["created_utc"], "%Y-%m-%dT%H:%M:%SZ"
-                ).replace(tzinfo=timezone.utc)
-
-            opened_utc = None
-            if data.get("opened_utc"):
-                opened_utc = datetime.strptime(
-                    data["opened_utc"], "%Y-%m-%dT%H:%M:%SZ"
-                ).replace(tzinfo=timezone.utc)
-
-            allocated_utc = None
-            if data.get("allocated_utc"):
-                allocated_utc = datetime.strptime(
-                    data["allocated_utc"], "%Y-%m-%dT%H:%M:%SZ"
-                ).replace(tzinfo=timezone.utc)
-
-            listings[lid] = MarketListing(
-                listing_id=data["listing_id"],
-                title=data["title"],
-                description=data["description"],
-                creator_id=data["creator_id"],
-                state=ListingState(data["state"]),
-                skill_requirements=[
-                    SkillRequirement(
-                        skill_id=SkillId.parse(sr["skill_id"]),
-                        minimum_proficiency=sr.get("minimum_proficiency", 0.0),
-                        required=sr.get("required", True),
-                    )
-                    for sr in data.get("skill_requirements", [])
-                ],
-                created_utc=created_utc,
-                opened_utc=opened_utc,
-                allocated_utc=allocated_utc,
-                allocated_worker_id=data.get("allocated_worker_id"),
-                allocated_mission_id=data.get("allocated_mission_id"),
-                domain_tags=data.get("domain_tags", []),
-                preferences=data.get("preferences", {}),
-            )
-
-        bids: dict[str, list[Bid]] = {}
-        for lid, bid_list in self._state.get("bids", {}).items():
-            bids[lid] = []
-            for bd in bid_list:
-                submitted_utc = None
-                if bd.get("submitted_utc"):
-                    submitted_utc = datetime.strptime(
-                        bd["submitted_utc"], "%Y-%m-%dT%H:%M:%SZ"
-                    ).replace(tzinfo=timezone.utc)
-
-                bids[lid].append(Bid(
-                    bid_id=bd["bid_id"],
-                    listing_id=bd["listing_id"],
-                    worker_id=bd["worker_id"],
-                    state=BidState(bd["state"]),
-                    relevance_score=bd.get("relevance_score", 0.0),
-                    global_trust=bd.get("global_trust", 0.0),
-                    domain_trust=bd.get("domain_trust", 0.0),
-                    composite_score=bd.get("composite_score", 0.0),
-                    submitted_utc=submitted_utc,
-                    notes=bd.get("notes", ""),
-                ))
-
+        listings = {
+            lid: _listing_from_state(data)
+            for lid, data in self._section("listings", {}).items()
+        }
+        bids = {
+            lid: [_bid_from_state(bd) for bd in bid_list]
+            for lid, bid_list in self._section("bids", {}).items()
+        }
         return listings, bids
 
     # ------------------------------------------------------------------
@@ -601,31 +1288,38 @@ class StateStore:
         """Serialize protected leave records to state.
 
         Persists the full leave record including adjudications,
-        trust freeze snapshots, and domain score snapshots.
+        trust freeze snapshots, and domain score snapshots. The records
+        are not modified; a record that is already sealed is only
+        serialized the first time it is saved. Only
+        records that differ from the last save are appended to the
+        leave log; records no longer present get a removal line.
         """
         entries: dict[str, dict[str, Any]] = {}
+        previous = self._sealed_leave_entries
+        sealed_entries: dict[str, tuple[LeaveRecord, dict[str, Any]]] = {}
         for leave_id, record in records.items():
+            cached = previous.get(leave_id)
+            if cached is not None and cached[0] is record:
+                entries[leave_id] = cached[1]
+                sealed_entries[leave_id] = cached
+                continue
             # Serialize adjudications
             adjudications_data = []
             for adj in record.adjudications:
-                adjudications_data.append({
+                adjudications_data.append(_drop_defaults({
                     "adjudicator_id": adj.adjudicator_id,
-                    "verdict": adj.verdict.value,
+                    "verdict": adj.verdict._value_,
                     "domain_qualified": adj.domain_qualified,
                     "trust_score_at_decision": adj.trust_score_at_decision,
                     "notes": adj.notes,
-                    "timestamp_utc": (
-                        adj.timestamp_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
-                        if adj.timestamp_utc else None
-                    ),
-                })
+                    "timestamp_utc": _format_utc(adj.timestamp_utc),
+                }, _ADJUDICATION_DEFAULTS))
 
             # Serialize domain scores at freeze snapshot
             domain_scores_data: dict[str, dict[str, Any]] = {}
             for domain, ds in record.domain_scores_at_freeze.items():
-                if hasattr(ds, "score"):
-                    # DomainTrustScore object
-                    domain_scores_data[domain] = {
+                if isinstance(ds, DomainTrustScore):
+                    domain_scores_data[domain] = _drop_defaults({
                         "domain": ds.domain,
                         "score": ds.score,
                         "quality": ds.quality,
@@ -633,168 +1327,66 @@ class StateStore:
                         "volume": ds.volume,
                         "effort": ds.effort,
                         "mission_count": ds.mission_count,
-                        "last_active_utc": (
-                            ds.last_active_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
-                            if ds.last_active_utc else None
-                        ),
-                    }
+                        "last_active_utc": _format_utc(ds.last_active_utc),
+                    }, _DOMAIN_SCORE_DEFAULTS)
 
-            entries[leave_id] = {
+            entry = entries[leave_id] = _drop_defaults({
                 "leave_id": record.leave_id,
                 "actor_id": record.actor_id,
-                "category": record.category.value,
-                "state": record.state.value,
+                "category": record.category._value_,
+                "state": record.state._value_,
                 "reason_summary": record.reason_summary,
                 "petitioner_id": record.petitioner_id,
                 "adjudications": adjudications_data,
                 "trust_score_at_freeze": record.trust_score_at_freeze,
-                "last_active_utc_at_freeze": (
-                    record.last_active_utc_at_freeze.strftime("%Y-%m-%dT%H:%M:%SZ")
-                    if record.last_active_utc_at_freeze else None
-                ),
+                "last_active_utc_at_freeze": _format_utc(record.last_active_utc_at_freeze),
                 "domain_scores_at_freeze": domain_scores_data,
                 "pre_leave_status": record.pre_leave_status,
                 "granted_duration_days": record.granted_duration_days,
-                "expires_utc": (
-                    record.expires_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
-                    if record.expires_utc else None
-                ),
-                "requested_utc": (
-                    record.requested_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
-                    if record.requested_utc else None
-                ),
-                "approved_utc": (
-                    record.approved_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
-                    if record.approved_utc else None
-                ),
-                "denied_utc": (
-                    record.denied_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
-                    if record.denied_utc else None
-                ),
-                "returned_utc": (
-                    record.returned_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
-                    if record.returned_utc else None
-                ),
-                "memorialised_utc": (
-                    record.memorialised_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
-                    if record.memorialised_utc else None
-                ),
-            }
-        self._state["leave_records"] = entries
-        self._save()
+                "expires_utc": _format_utc(record.expires_utc),
+                "requested_utc": _format_utc(record.requested_utc),
+                "approved_utc": _format_utc(record.approved_utc),
+                "denied_utc": _format_utc(record.denied_utc),
+                "returned_utc": _format_utc(record.returned_utc),
+                "memorialised_utc": _format_utc(record.memorialised_utc),
+            }, _LEAVE_RECORD_DEFAULTS)
+            if record.sealed:
+                sealed_entries[leave_id] = (record, entry)
+        self._sealed_leave_entries = sealed_entries
+
+        encode = _STATE_ENCODER.encode
+        pending = self._leave_pending
+        logged = self._leave_logged
+        for leave_id, entry in entries.items():
+            previous = logged.get(leave_id)
+            if previous is not entry and previous != entry:
+                pending.append(encode(entry))
+        for leave_id in self._leave_entries.keys() - entries.keys():
+            pending.append(encode({"leave_id": leave_id, "removed": True}))
+        self._leave_logged = self._leave_entries = entries
+        if "leave_records" in self._state or "leave_records" in self._unparsed:
+            self._leave_legacy = True
+        self._write_or_defer()
 
     def load_leave_records(self) -> dict[str, LeaveRecord]:
         """Deserialize protected leave records from state.
 
         Reconstructs the full leave record including adjudications
-        and trust freeze domain score snapshots.
+        and trust freeze domain score snapshots. Sealed records are
+        remembered with their stored entries, so saving them back
+        unchanged does not re-serialize them.
         """
         records: dict[str, LeaveRecord] = {}
-        for leave_id, data in self._state.get("leave_records", {}).items():
-            # Deserialize adjudications
-            adjudications: list[LeaveAdjudication] = []
-            for adj_data in data.get("adjudications", []):
-                adj_ts = None
-                if adj_data.get("timestamp_utc"):
-                    adj_ts = datetime.strptime(
-                        adj_data["timestamp_utc"], "%Y-%m-%dT%H:%M:%SZ"
-                    ).replace(tzinfo=timezone.utc)
-                adjudications.append(LeaveAdjudication(
-                    adjudicator_id=adj_data["adjudicator_id"],
-                    verdict=AdjudicationVerdict(adj_data["verdict"]),
-                    domain_qualified=adj_data["domain_qualified"],
-                    trust_score_at_decision=adj_data["trust_score_at_decision"],
-                    notes=adj_data.get("notes", ""),
-                    timestamp_utc=adj_ts,
-                ))
-
-            # Deserialize domain scores at freeze
-            domain_scores_at_freeze: dict[str, DomainTrustScore] = {}
-            for domain, ds_data in data.get("domain_scores_at_freeze", {}).items():
-                last_active = None
-                if ds_data.get("last_active_utc"):
-                    last_active = datetime.strptime(
-                        ds_data["last_active_utc"], "%Y-%m-%dT%H:%M:%SZ"
-                    ).replace(tzinfo=timezone.utc)
-                domain_scores_at_freeze[domain] = DomainTrustScore(
-                    domain=ds_data.get("domain", domain),
-                    score=ds_data.get("score", 0.0),
-                    quality=ds_data.get("quality", 0.0),
-                    reliability=ds_data.get("reliability", 0.0),
-                    volume=ds_data.get("volume", 0.0),
-                    effort=ds_data.get("effort", 0.0),
-                    mission_count=ds_data.get("mission_count", 0),
-                    last_active_utc=last_active,
-                )
-
-            # Deserialize timestamps
-            last_active_at_freeze = None
-            if data.get("last_active_utc_at_freeze"):
-                last_active_at_freeze = datetime.strptime(
-                    data["last_active_utc_at_freeze"], "%Y-%m-%dT%H:%M:%SZ"
-                ).replace(tzinfo=timezone.utc)
-
-            expires_utc = None
-            if data.get("expires_utc"):
-                expires_utc = datetime.strptime(
-                    data["expires_utc"], "%Y-%m-%dT%H:%M:%SZ"
-                ).replace(tzinfo=timezone.utc)
-
-            requested_utc = None
-            if data.get("requested_utc"):
-                requested_utc = datetime.strptime(
-                    data["requested_utc"], "%Y-%m-%dT%H:%M:%SZ"
-                ).replace(tzinfo=timezone.utc)
-
-            approved_utc = None
-            if data.get("approved_utc"):
-                approved_utc = datetime.strptime(
-                    data["approved_utc"], "%Y-%m-%dT%H:%M:%SZ"
-                ).replace(tzinfo=timezone.utc)
-
-            denied_utc = None
-            if data.get("denied_utc"):
-                denied_utc = datetime.strptime(
-                    data["denied_utc"], "%Y-%m-%dT%H:%M:%SZ"
-                ).replace(tzinfo=timezone.utc)
-
-            returned_utc = None
-            if data.get("returned_utc"):
-                returned_utc = datetime.strptime(
-                    data["returned_utc"], "%Y-%m-%dT%H:%M:%SZ"
-                ).replace(tzinfo=timezone.utc)
-
-            memorialised_utc = None
-            if data.get("memorialised_utc"):
-                memorialised_utc = datetime.strptime(
-                    data["memorialised_utc"], "%Y-%m-%dT%H:%M:%SZ"
-                ).replace(tzinfo=timezone.utc)
-
-            # Legacy compat: map "permanent" → "memorialised"
-            raw_state = data["state"]
-            if raw_state == "permanent":
-                raw_state = "memorialised"
-
-            records[leave_id] = LeaveRecord(
-                leave_id=data["leave_id"],
-                actor_id=data["actor_id"],
-                category=LeaveCategory(data["category"]),
-                state=LeaveState(raw_state),
-                reason_summary=data.get("reason_summary", ""),
-                petitioner_id=data.get("petitioner_id"),
-                adjudications=adjudications,
-                trust_score_at_freeze=data.get("trust_score_at_freeze"),
-                last_active_utc_at_freeze=last_active_at_freeze,
-                domain_scores_at_freeze=domain_scores_at_freeze,
-                pre_leave_status=data.get("pre_leave_status"),
-                granted_duration_days=data.get("granted_duration_days"),
-                expires_utc=expires_utc,
-                requested_utc=requested_utc,
-                approved_utc=approved_utc,
-                denied_utc=denied_utc,
-                returned_utc=returned_utc,
-                memorialised_utc=memorialised_utc,
-            )
+        sealed_entries = self._sealed_leave_entries
+        for leave_id, data in self._leave_entries.items():
+            record = _leave_record_from_state(data)
+            if record.state in TERMINAL_LEAVE_STATES:
+                record.seal()
+                # The stored entry is what saving this record builds,
+                # unless it still holds a legacy state name.
+                if data["state"] == record.state.value:
+                    sealed_entries[leave_id] = (record, data)
+            records[leave_id] = record
         return records
 
     # ------------------------------------------------------------------
@@ -810,9 +1402,9 @@ class StateStore:
         self._state["epoch"] = {
             "previous_hash": previous_hash,
             "committed_count": committed_count,
-            "saved_utc": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "saved_utc": _format_utc(datetime.now(timezone.utc)),
         }
-        self._save()
+        self._save("epoch")
 
     def load_epoch_state(self) -> tuple[str, int]:
         """Load epoch chain continuity state.
@@ -820,7 +1412,7 @@ class StateStore:
         Returns (previous_hash, committed_count).
         Returns defaults if no state exists.
         """
-        epoch = self._state.get("epoch", {})
+        epoch = self._section("epoch", {})
         from genesis.crypto.epoch_service import GENESIS_PREVIOUS_HASH
         return (
             epoch.get("previous_hash", GENESIS_PREVIOUS_HASH),
@@ -7,12 +7,164 @@ No magic. No defaults. If a value is missing from the config, it fails loud.
 from __future__ import annotations
 
 import json
+import os
 from dataclasses import dataclass
+from datetime import timedelta
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, TypeVar
 
 from genesis.models.mission import DomainType, MissionClass, RiskTier
 from genesis.models.governance import Chamber, ChamberKind, GenesisPhase
+from genesis.models.leave import CATEGORY_REQUIRED_DOMAINS, LeaveCategory
+
+
+_T = TypeVar("_T")
+
+# ---------------------------------------------------------------------------
+# Key paths the accessors read, checked once at load. A path is required
+# whenever its top-level section is present, so a truncated section fails
+# with the full path instead of a bare KeyError on first use. A section
+# that is absent altogether is reported by the accessor that needs it.
+# ---------------------------------------------------------------------------
+
+_REQUIRED_PARAMS: tuple[str, ...] = (
+    "trust_weights.w_Q", "trust_weights.w_R", "trust_weights.w_V", "trust_weights.w_E",
+    "quality_gates.Q_min_M", "quality_gates.Q_min_H",
+    "trust_floors.T_floor_M", "trust_floors.T_floor_H_positive",
+    "fast_elevation.delta_fast",
+    "eligibility.tau_vote", "eligibility.tau_prop",
+    "constitutional_voting.w_H_const", "constitutional_voting.w_M_const",
+    "reviewer_heterogeneity.H_R2_MODEL_FAMILIES",
+    "reviewer_heterogeneity.H_R2_METHOD_TYPES",
+    "reviewer_heterogeneity.valid_method_types",
+    "normative_resolution.NORMATIVE_AGREEMENT_THRESHOLD",
+    "normative_resolution.NORMATIVE_PANEL_SIZE",
+    "normative_resolution.NORMATIVE_PANEL_REGIONS",
+    "normative_resolution.NORMATIVE_PANEL_ORGS",
+    "genesis.G0_MAX_DAYS", "genesis.G0_EXTENSION_DAYS", "genesis.G1_MAX_DAYS",
+    "genesis.G0_RATIFICATION_WINDOW_DAYS", "genesis.phase_thresholds",
+    "commitment_tiers.EPOCH_HOURS",
+    "commitment_tiers.C0_max_humans", "commitment_tiers.C1_max_humans",
+    "commitment_committee.n", "commitment_committee.t",
+    "key_management.KEY_ROTATION_DAYS",
+    "quality_assessment.worker_weights.consensus",
+    "quality_assessment.worker_weights.evidence",
+    "quality_assessment.worker_weights.complexity",
+    "quality_assessment.reviewer_weights.alignment",
+    "quality_assessment.reviewer_weights.calibration",
+    "quality_assessment.evidence_expectations",
+    "quality_assessment.complexity_multipliers",
+    "quality_assessment.reviewer_alignment_scores",
+    "quality_assessment.calibration_min_history",
+    "quality_assessment.calibration_window_size",
+)
+
+_REQUIRED_SKILL_TRUST: tuple[str, ...] = (
+    "domain_trust_weights.w_Q", "domain_trust_weights.w_R",
+    "domain_trust_weights.w_V", "domain_trust_weights.w_E",
+    "inactivity_decay.half_life_days_human",
+    "inactivity_decay.half_life_days_machine",
+)
+
+# ---------------------------------------------------------------------------
+# Defaults for optional config files, copied out by the accessors when the
+# file is not loaded. Read-only all the way down, so they cannot drift.
+# ---------------------------------------------------------------------------
+
+_DEFAULT_GLOBAL_SCORE_AGGREGATION: Mapping[str, Any] = MappingProxyType({
+    "method": "weighted_mean",
+    "recency_weight": 0.3,
+    "volume_weight": 0.7,
+})
+
+_DEFAULT_ALLOCATION_WEIGHTS: Mapping[str, float] = MappingProxyType({
+    "relevance": 0.50,
+    "global_trust": 0.20,
+    "domain_trust": 0.30,
+})
+
+_DEFAULT_SKILL_MATCHING: Mapping[str, Any] = MappingProxyType({
+    "min_relevance_score": 0.3,
+    "proficiency_weight": 0.60,
+    "domain_trust_weight": 0.40,
+    "worker_allocation_weights": _DEFAULT_ALLOCATION_WEIGHTS,
+})
+
+_DEFAULT_SKILL_LIFECYCLE: Mapping[str, Any] = MappingProxyType({
+    "skill_half_life_days_human": 365.0,
+    "skill_half_life_days_machine": 90.0,
+    "skill_decay_floor": 0.01,
+    "skill_prune_threshold": 0.01,
+    "endorsement": MappingProxyType({
+        "base_boost": 0.05,
+        "min_endorser_proficiency": 0.5,
+        "max_endorsements_per_skill": 10,
+    }),
+    "outcome_updates": MappingProxyType({
+        "approval_boost": 0.05,
+        "rejection_penalty": 0.02,
+        "complexity_multipliers": MappingProxyType({
+            "R0": 1.0, "R1": 1.5, "R2": 2.0, "R3": 2.5,
+        }),
+    }),
+})
+
+_DEFAULT_LISTING: Mapping[str, Any] = MappingProxyType({
+    "max_bids_per_listing": 50,
+    "bid_window_hours": 48,
+    "min_skill_requirements": 0,
+    "auto_close_on_allocation": True,
+})
+
+_DEFAULT_BID_REQUIREMENTS: Mapping[str, Any] = MappingProxyType({
+    "min_trust_to_bid": 0.10,
+    "min_relevance_to_bid": 0.0,
+    "allow_multiple_bids_per_worker": False,
+})
+
+_DEFAULT_LEAVE_ADJUDICATION: Mapping[str, Any] = MappingProxyType({
+    "min_quorum": 3,
+    "min_approve_to_grant": 2,
+    "min_adjudicator_trust": 0.40,
+    "min_domain_trust": 0.30,
+    "max_adjudicators": 5,
+    "adjudicator_diversity": MappingProxyType({
+        "min_organizations": 2,
+        "min_regions": 2,
+    }),
+})
+
+_DEFAULT_LEAVE_CATEGORIES: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    category: MappingProxyType({
+        "required_adjudicator_domains": domains,
+        "max_duration_days": None,
+        "renewable": True,
+    })
+    for category, domains in CATEGORY_REQUIRED_DOMAINS.items()
+})
+
+_DEFAULT_LEAVE_ANTI_GAMING: Mapping[str, Any] = MappingProxyType({
+    "cooldown_days_between_leaves": 30,
+    "max_leaves_per_year": 4,
+    "adjudicator_cannot_self_approve": True,
+})
+
+_DEFAULT_LEAVE_TRUST_FREEZE: Mapping[str, Any] = MappingProxyType({
+    "freeze_trust_score": True,
+    "freeze_domain_scores": True,
+    "freeze_skill_decay": True,
+    "reset_last_active_on_return": True,
+})
+
+_DEFAULT_LEAVE_DURATION: Mapping[str, Any] = MappingProxyType({
+    "default_max_days": None,
+    "category_overrides": MappingProxyType({
+        "pregnancy": 365,
+        "child_care": 365,
+    }),
+    "extension_requires_new_adjudication": True,
+})
 
 
 @dataclass(frozen=True)
@@ -29,6 +181,29 @@ class TierPolicy:
     min_method_types: int
 
 
+@dataclass(frozen=True)
+class LeaveAdjudicationPolicy:
+    """Leave adjudication policy compiled into typed fields.
+
+    Built once per resolver so hot eligibility and quorum
+    checks read attributes instead of walking config dicts.
+    """
+    min_adjudicator_trust: float
+    min_domain_trust: float
+    min_quorum: int
+    min_approve_to_grant: int
+    max_adjudicators: Optional[int]
+    min_organizations: int
+    min_regions: int
+    cooldown_days_between_leaves: int
+    max_leaves_per_year: int
+    default_max_days: Optional[int]
+    category_overrides: dict[str, int]
+    required_domains: Mapping[LeaveCategory, tuple[str, ...]]
+    max_days_by_category: Mapping[LeaveCategory, Optional[int]]
+    expires_delta_by_category: Mapping[LeaveCategory, Optional[timedelta]]
+
+
 class PolicyResolver:
     """Loads and resolves all constitutional and runtime policy.
 
@@ -55,13 +230,193 @@ class PolicyResolver:
         self._market_policy = market_policy
         self._skill_lifecycle = skill_lifecycle
         self._leave_policy = leave_policy
-        self._validate_versions()
-
-    def _validate_versions(self) -> None:
+        self._compiled_leave_policy: LeaveAdjudicationPolicy | None = None
+        # Per-phase governance tables, resolved on first request. G0 and
+        # unconfigured phases are never stored, so they keep failing loud.
+        self._chambers_by_phase: dict[GenesisPhase, Mapping[ChamberKind, Chamber]] = {}
+        self._geo_by_phase: dict[GenesisPhase, tuple[int, float]] = {}
+        self._fast_elevation_by_phase: dict[GenesisPhase, tuple[int, int, int]] = {}
+        self._validate_and_index()
+
+    def _validate_and_index(self) -> None:
+        """Fail loud on malformed config, then index what accessors return."""
         if "version" not in self._params:
             raise ValueError("constitutional_params.json missing version")
         if "version" not in self._policy:
             raise ValueError("runtime_policy.json missing version")
+        _check_required(self._params, "constitutional_params.json", _REQUIRED_PARAMS)
+        if self._skill_trust is not None:
+            _check_required(
+                self._skill_trust, "skill_trust_params.json", _REQUIRED_SKILL_TRUST,
+            )
+
+        self._tier_policies = self._compile_tier_policies()
+        # Unknown class or tier names fail here, at load. Classes absent from
+        # the map (leave adjudication has no tier) still fail at use.
+        self._mission_tier_map = {
+            MissionClass(cls_str): RiskTier(tier_str)
+            for cls_str, tier_str in self._policy.get("mission_class_to_tier", {}).items()
+        }
+        self._build_views()
+        self._flatten()
+
+    def _build_views(self) -> None:
+        """Wrap every config section handed out by accessors in a read-only view.
+
+        Sections are looked up once here; accessors hand out a fresh dict
+        copy of the view on each call. A required section absent from the
+        config is stored as None and reported when its accessor is called.
+        """
+        params, policy = self._params, self._policy
+        self._effort_thresholds = _read_only(params, "effort_thresholds")
+        self._genesis_phase_thresholds = _read_only(params, "genesis", "phase_thresholds")
+        self._recertification_requirements = _read_only(params, "machine_recertification")
+        self._decommission_rules = _read_only(params, "machine_decommission")
+        self._evidence_expectations = _read_only(
+            params, "quality_assessment", "evidence_expectations",
+        )
+        self._complexity_multipliers = _read_only(
+            params, "quality_assessment", "complexity_multipliers",
+        )
+        self._reviewer_alignment_scores = _read_only(
+            params, "quality_assessment", "reviewer_alignment_scores",
+        )
+        self._identity_signals = _read_only(policy, "identity_signals")
+        methods = params.get("reviewer_heterogeneity", {}).get("valid_method_types")
+        self._valid_method_types = None if methods is None else frozenset(methods)
+        domains = policy.get("valid_domain_types")
+        self._valid_domain_types = None if domains is None else frozenset(domains)
+
+        # Optional configs: None here means the file was not loaded.
+        self._taxonomy_view = _read_only(self._taxonomy)
+        self._skill_lifecycle_view = _read_only(self._skill_lifecycle)
+        skill_trust = self._skill_trust or {}
+        self._inactivity_decay = _read_only(skill_trust, "inactivity_decay")
+        self._global_score_aggregation = _read_only(skill_trust, "global_score_aggregation")
+        self._skill_matching = MappingProxyType(skill_trust.get("skill_matching", {}))
+        market = self._market_policy or {}
+        if self._market_policy is not None:
+            allocation = market.get("allocation_weights", {})
+        else:
+            # Fall back to skill matching worker_allocation_weights
+            allocation = self.skill_matching_config().get(
+                "worker_allocation_weights", _DEFAULT_ALLOCATION_WEIGHTS,
+            )
+        self._allocation_weights = MappingProxyType(allocation)
+        self._listing_defaults = MappingProxyType(market.get("listing_defaults", {}))
+        self._bid_requirements = MappingProxyType(market.get("bid_requirements", {}))
+        leave = self._leave_policy or {}
+        self._leave_adjudication = MappingProxyType(leave.get("adjudication", {}))
+        if self._leave_policy is None:
+            self._leave_categories = _DEFAULT_LEAVE_CATEGORIES
+        else:
+            self._leave_categories = {
+                name: MappingProxyType(config)
+                for name, config in leave.get("leave_categories", {}).items()
+            }
+        self._leave_anti_gaming = MappingProxyType(leave.get("anti_gaming", {}))
+        self._leave_trust_freeze = MappingProxyType(leave.get("trust_freeze", {}))
+        self._leave_duration = MappingProxyType(leave.get("duration_limits", {}))
+
+    def _flatten(self) -> None:
+        """Extract the leaf values scalar and tuple accessors return.
+
+        Each accessor then reads one attribute instead of walking nested
+        config dicts. As with the views, an absent section is stored as
+        None and reported by its accessor.
+        """
+        params = self._params
+        self._trust_weights = _leaves(
+            _lookup(params, "trust_weights"), "w_Q", "w_R", "w_V", "w_E",
+        )
+        self._quality_gates = _leaves(_lookup(params, "quality_gates"), "Q_min_M", "Q_min_H")
+        floors = _lookup(params, "trust_floors")
+        # Human floor is positive but the exact value is not fixed in config.
+        # We use 0.01 as minimum positive value for humans.
+        self._trust_floors = None if floors is None else (
+            floors["T_floor_M"], 0.01 if floors["T_floor_H_positive"] else 0.0,
+        )
+        self._delta_fast = _lookup(params, "fast_elevation", "delta_fast")
+        self._eligibility = _leaves(_lookup(params, "eligibility"), "tau_vote", "tau_prop")
+        self._constitutional_voting = _leaves(
+            _lookup(params, "constitutional_voting"), "w_H_const", "w_M_const",
+        )
+        self._heterogeneity = _leaves(
+            _lookup(params, "reviewer_heterogeneity"),
+            "H_R2_MODEL_FAMILIES", "H_R2_METHOD_TYPES",
+        )
+
+        nr = _lookup(params, "normative_resolution")
+        self._normative_agreement_threshold = _lookup(nr, "NORMATIVE_AGREEMENT_THRESHOLD")
+        self._normative_panel = None if nr is None else MappingProxyType({
+            "panel_size": nr["NORMATIVE_PANEL_SIZE"],
+            "panel_regions": nr["NORMATIVE_PANEL_REGIONS"],
+            "panel_orgs": nr["NORMATIVE_PANEL_ORGS"],
+        })
+
+        g = _lookup(params, "genesis")
+        self._genesis_time_limits = None if g is None else MappingProxyType({
+            "G0_MAX_DAYS": g["G0_MAX_DAYS"],
+            "G0_EXTENSION_DAYS": g["G0_EXTENSION_DAYS"],
+            "G1_MAX_DAYS": g["G1_MAX_DAYS"],
+            "G0_RATIFICATION_WINDOW_DAYS": g["G0_RATIFICATION_WINDOW_DAYS"],
+        })
+
+        ct = _lookup(params, "commitment_tiers")
+        self._epoch_hours = _lookup(ct, "EPOCH_HOURS")
+        self._commitment_tier_thresholds = None if ct is None else MappingProxyType({
+            "C0_max_humans": ct["C0_max_humans"],
+            "C1_max_humans": ct["C1_max_humans"],
+        })
+        self._commitment_committee = _leaves(_lookup(params, "commitment_committee"), "n", "t")
+        self._key_rotation_days = _lookup(params, "key_management", "KEY_ROTATION_DAYS")
+
+        qa = _lookup(params, "quality_assessment")
+        self._quality_worker_weights = _leaves(
+            _lookup(qa, "worker_weights"), "consensus", "evidence", "complexity",
+        )
+        self._quality_reviewer_weights = _leaves(
+            _lookup(qa, "reviewer_weights"), "alignment", "calibration",
+        )
+        self._calibration_config = _leaves(
+            qa, "calibration_min_history", "calibration_window_size",
+        )
+
+        if self._skill_trust is None:
+            # Domain trust falls back to the global weights and a one-year
+            # half-life when no skill trust config is loaded.
+            self._domain_trust_weights = self._trust_weights
+            self._half_lives = (365.0, 365.0)
+        else:
+            self._domain_trust_weights = _leaves(
+                _lookup(self._skill_trust, "domain_trust_weights"),
+                "w_Q", "w_R", "w_V", "w_E",
+            )
+            half_lives = _leaves(
+                _lookup(self._skill_trust, "inactivity_decay"),
+                "half_life_days_machine", "half_life_days_human",
+            )
+            self._half_lives = None if half_lives is None else (
+                float(half_lives[0]), float(half_lives[1]),
+            )
+
+    def _compile_tier_policies(self) -> dict[RiskTier, TierPolicy]:
+        """Build every configured TierPolicy once; the config is immutable."""
+        compiled: dict[RiskTier, TierPolicy] = {}
+        for tier_str, t in self._policy.get("risk_tiers", {}).items():
+            tier = RiskTier(tier_str)
+            compiled[tier] = TierPolicy(
+                tier=tier,
+                reviewers_required=t["reviewers_required"],
+                approvals_required=t["approvals_required"],
+                human_final_gate=t["human_final_gate"],
+                min_regions=t["min_regions"],
+                min_organizations=t["min_organizations"],
+                constitutional_flow=t["constitutional_flow"],
+                min_model_families=t["min_model_families"],
+                min_method_types=t["min_method_types"],
+            )
+        return compiled
 
     # ------------------------------------------------------------------
     # Mission class → risk tier
@@ -69,33 +424,24 @@ class PolicyResolver:
 
     def resolve_tier(self, mission_class: MissionClass) -> RiskTier:
         """Map a mission class to its risk tier."""
-        mapping = self._policy["mission_class_to_tier"]
-        tier_str = mapping.get(mission_class.value)
-        if tier_str is None:
-            raise ValueError(f"Unknown mission class: {mission_class.value}")
-        return RiskTier(tier_str)
+        try:
+            return self._mission_tier_map[mission_class]
+        except KeyError:
+            raise ValueError(f"Unknown mission class: {mission_class.value}") from None
 
     # ------------------------------------------------------------------
     # Risk tier policy
     # ------------------------------------------------------------------
 
     def tier_policy(self, tier: RiskTier) -> TierPolicy:
-        """Get the full policy for a risk tier."""
-        tiers = self._policy["risk_tiers"]
-        t = tiers.get(tier.value)
-        if t is None:
-            raise ValueError(f"Unknown risk tier: {tier.value}")
-        return TierPolicy(
-            tier=tier,
-            reviewers_required=t["reviewers_required"],
-            approvals_required=t["approvals_required"],
-            human_final_gate=t["human_final_gate"],
-            min_regions=t["min_regions"],
-            min_organizations=t["min_organizations"],
-            constitutional_flow=t["constitutional_flow"],
-            min_model_families=t["min_model_families"],
-            min_method_types=t["min_method_types"],
-        )
+        """Get the full policy for a risk tier.
+
+        TierPolicy is frozen, so the instance compiled at load is shared.
+        """
+        try:
+            return self._tier_policies[tier]
+        except KeyError:
+            raise ValueError(f"Unknown risk tier: {tier.value}") from None
 
     # ------------------------------------------------------------------
     # Trust weights and gates
@@ -103,31 +449,25 @@ class PolicyResolver:
 
     def trust_weights(self) -> tuple[float, float, float, float]:
         """Return (w_Q, w_R, w_V, w_E) trust component weights."""
-        tw = self._params["trust_weights"]
-        return tw["w_Q"], tw["w_R"], tw["w_V"], tw["w_E"]
+        return _require(self._trust_weights, "trust_weights")
 
     def quality_gate(self, is_machine: bool) -> float:
         """Return the minimum quality score gate."""
-        qg = self._params["quality_gates"]
-        return qg["Q_min_M"] if is_machine else qg["Q_min_H"]
+        machine, human = _require(self._quality_gates, "quality_gates")
+        return machine if is_machine else human
 
     def trust_floor(self, is_machine: bool) -> float:
         """Return the trust floor for the actor kind."""
-        floors = self._params["trust_floors"]
-        if is_machine:
-            return floors["T_floor_M"]
-        # Human floor is positive but the exact value is not fixed in config.
-        # We return 0.01 as minimum positive value for humans.
-        return 0.01 if floors["T_floor_H_positive"] else 0.0
+        machine, human = _require(self._trust_floors, "trust_floors")
+        return machine if is_machine else human
 
     def delta_fast(self) -> float:
         """Return the fast-elevation threshold."""
-        return self._params["fast_elevation"]["delta_fast"]
+        return _require(self._delta_fast, "fast_elevation.delta_fast")
 
     def eligibility_thresholds(self) -> tuple[float, float]:
         """Return (tau_vote, tau_prop) eligibility thresholds."""
-        el = self._params["eligibility"]
-        return el["tau_vote"], el["tau_prop"]
+        return _require(self._eligibility, "eligibility")
 
     def effort_thresholds(self) -> dict[str, Any]:
         """Return effort-proportionality thresholds.
@@ -137,7 +477,7 @@ class PolicyResolver:
         - E_suspicious_low: effort below this on any mission is a signal
         - E_max_credit: maximum effort credit (caps at 1.0)
         """
-        return dict(self._params["effort_thresholds"])
+        return _to_dict(_require(self._effort_thresholds, "effort_thresholds"))
 
     # ------------------------------------------------------------------
     # Constitutional voting weights
@@ -145,8 +485,7 @@ class PolicyResolver:
 
     def constitutional_voting_weights(self) -> tuple[float, float]:
         """Return (w_H_const, w_M_const). w_M_const must be 0.0."""
-        cv = self._params["constitutional_voting"]
-        return cv["w_H_const"], cv["w_M_const"]
+        return _require(self._constitutional_voting, "constitutional_voting")
 
     # ------------------------------------------------------------------
     # Reviewer heterogeneity
@@ -154,16 +493,19 @@ class PolicyResolver:
 
     def heterogeneity_requirements(self) -> tuple[int, int]:
         """Return (min_model_families, min_method_types) for R2."""
-        het = self._params["reviewer_heterogeneity"]
-        return het["H_R2_MODEL_FAMILIES"], het["H_R2_METHOD_TYPES"]
+        return _require(self._heterogeneity, "reviewer_heterogeneity")
 
-    def valid_method_types(self) -> set[str]:
+    def valid_method_types(self) -> frozenset[str]:
         """Return the canonical set of valid reviewer method types."""
-        return set(self._params["reviewer_heterogeneity"]["valid_method_types"])
+        return _require(
+            self._valid_method_types, "reviewer_heterogeneity.valid_method_types",
+        )
 
-    def valid_domain_types(self) -> set[str]:
+    def valid_domain_types(self) -> frozenset[str]:
         """Return the canonical set of valid domain types."""
-        return set(self._policy["valid_domain_types"])
+        return _require(
+            self._valid_domain_types, "valid_domain_types", "runtime_policy.json",
+        )
 
     # ------------------------------------------------------------------
     # Normative resolution
@@ -171,16 +513,14 @@ class PolicyResolver:
 
     def normative_agreement_threshold(self) -> float:
         """Return the normative agreement threshold for escalation."""
-        return self._params["normative_resolution"]["NORMATIVE_AGREEMENT_THRESHOLD"]
+        return _require(
+            self._normative_agreement_threshold,
+            "normative_resolution.NORMATIVE_AGREEMENT_THRESHOLD",
+        )
 
     def normative_panel_requirements(self) -> dict[str, int]:
         """Return normative adjudication panel requirements."""
-        nr = self._params["normative_resolution"]
-        return {
-            "panel_size": nr["NORMATIVE_PANEL_SIZE"],
-            "panel_regions": nr["NORMATIVE_PANEL_REGIONS"],
-            "panel_orgs": nr["NORMATIVE_PANEL_ORGS"],
-        }
+        return _to_dict(_require(self._normative_panel, "normative_resolution"))
 
     # ------------------------------------------------------------------
     # Genesis protocol
@@ -188,30 +528,31 @@ class PolicyResolver:
 
     def genesis_time_limits(self) -> dict[str, int]:
         """Return genesis phase time limits in days."""
-        g = self._params["genesis"]
-        return {
-            "G0_MAX_DAYS": g["G0_MAX_DAYS"],
-            "G0_EXTENSION_DAYS": g["G0_EXTENSION_DAYS"],
-            "G1_MAX_DAYS": g["G1_MAX_DAYS"],
-            "G0_RATIFICATION_WINDOW_DAYS": g["G0_RATIFICATION_WINDOW_DAYS"],
-        }
+        return _to_dict(_require(self._genesis_time_limits, "genesis"))
 
     def genesis_phase_thresholds(self) -> dict[str, int]:
         """Return population thresholds for genesis phase transitions."""
-        return dict(self._params["genesis"]["phase_thresholds"])
-
-    def chambers_for_phase(self, phase: GenesisPhase) -> dict[ChamberKind, Chamber]:
-        """Return chamber definitions for a given governance phase."""
-        if phase == GenesisPhase.G0:
-            raise ValueError("G0 is founder stewardship — no chambers")
+        return _to_dict(_require(self._genesis_phase_thresholds, "genesis.phase_thresholds"))
 
+    def _phase_section(self, phase: GenesisPhase, name: str) -> dict[str, Any]:
+        """Return the raw config section *name* for a non-G0 phase."""
         if phase == GenesisPhase.G3:
             # Full constitution
-            raw = self._params["full_constitution"]["chambers"]
-        else:
-            key = f"{phase.value}_chambers"
-            raw = self._params["genesis"][key]
+            return self._params["full_constitution"][name]
+        return self._params["genesis"][f"{phase.value}_{name}"]
+
+    def chambers_for_phase(self, phase: GenesisPhase) -> Mapping[ChamberKind, Chamber]:
+        """Return chamber definitions for a given governance phase.
 
+        The mapping is read-only and shared between calls.
+        """
+        cached = self._chambers_by_phase.get(phase)
+        if cached is not None:
+            return cached
+        if phase == GenesisPhase.G0:
+            raise ValueError("G0 is founder stewardship — no chambers")
+
+        raw = self._phase_section(phase, "chambers")
         result: dict[ChamberKind, Chamber] = {}
         for name in ("proposal", "ratification", "challenge"):
             kind = ChamberKind(name)
@@ -221,27 +562,30 @@ class PolicyResolver:
                 size=c["size"],
                 pass_threshold=c["pass_threshold"],
             )
-        return result
+        chambers = self._chambers_by_phase[phase] = MappingProxyType(result)
+        return chambers
 
     def geo_constraints_for_phase(self, phase: GenesisPhase) -> tuple[int, float]:
         """Return (R_min, c_max) geographic constraints for a phase."""
+        cached = self._geo_by_phase.get(phase)
+        if cached is not None:
+            return cached
         if phase == GenesisPhase.G0:
             raise ValueError("G0 has no formal geo constraints")
-        if phase == GenesisPhase.G3:
-            geo = self._params["full_constitution"]["geo"]
-        else:
-            geo = self._params["genesis"][f"{phase.value}_geo"]
-        return geo["R_min"], geo["c_max"]
+        geo = self._phase_section(phase, "geo")
+        constraints = self._geo_by_phase[phase] = (geo["R_min"], geo["c_max"])
+        return constraints
 
     def fast_elevation_quorum(self, phase: GenesisPhase) -> tuple[int, int, int]:
         """Return (q_h, r_h, o_h) fast-elevation revalidation quorum."""
+        cached = self._fast_elevation_by_phase.get(phase)
+        if cached is not None:
+            return cached
         if phase == GenesisPhase.G0:
             raise ValueError("G0 has no formal fast-elevation quorum")
-        if phase == GenesisPhase.G3:
-            fe = self._params["full_constitution"]["fast_elevation"]
-        else:
-            fe = self._params["genesis"][f"{phase.value}_fast_elevation"]
-        return fe["q_h"], fe["r_h"], fe["o_h"]
+        fe = self._phase_section(phase, "fast_elevation")
+        quorum = self._fast_elevation_by_phase[phase] = (fe["q_h"], fe["r_h"], fe["o_h"])
+        return quorum
 
     # ------------------------------------------------------------------
     # Commitment tiers
@@ -249,15 +593,11 @@ class PolicyResolver:
 
     def epoch_hours(self) -> int:
         """Return the epoch duration in hours."""
-        return self._params["commitment_tiers"]["EPOCH_HOURS"]
+        return _require(self._epoch_hours, "commitment_tiers.EPOCH_HOURS")
 
     def commitment_tier_thresholds(self) -> dict[str, int]:
         """Return population thresholds for commitment tier progression."""
-        ct = self._params["commitment_tiers"]
-        return {
-            "C0_max_humans": ct["C0_max_humans"],
-            "C1_max_humans": ct["C1_max_humans"],
-        }
+        return _to_dict(_require(self._commitment_tier_thresholds, "commitment_tiers"))
 
     def l1_anchor_interval_hours(self, tier: str) -> int:
         """Return L1 anchor interval for a commitment tier."""
@@ -269,8 +609,7 @@ class PolicyResolver:
 
     def commitment_committee(self) -> tuple[int, int]:
         """Return (n, t) — committee size and threshold."""
-        cc = self._params["commitment_committee"]
-        return cc["n"], cc["t"]
+        return _require(self._commitment_committee, "commitment_committee")
 
     # ------------------------------------------------------------------
     # Machine lifecycle
@@ -278,15 +617,17 @@ class PolicyResolver:
 
     def recertification_requirements(self) -> dict[str, Any]:
         """Return machine recertification thresholds."""
-        return dict(self._params["machine_recertification"])
+        return _to_dict(_require(
+            self._recertification_requirements, "machine_recertification",
+        ))
 
     def decommission_rules(self) -> dict[str, Any]:
         """Return machine decommission rules."""
-        return dict(self._params["machine_decommission"])
+        return _to_dict(_require(self._decommission_rules, "machine_decommission"))
 
     def key_rotation_days(self) -> int:
         """Return key rotation period in days."""
-        return self._params["key_management"]["KEY_ROTATION_DAYS"]
+        return _require(self._key_rotation_days, "key_management.KEY_ROTATION_DAYS")
 
     # ------------------------------------------------------------------
     # Quality assessment
@@ -294,30 +635,36 @@ class PolicyResolver:
 
     def quality_worker_weights(self) -> tuple[float, float, float]:
         """Return (w_consensus, w_evidence, w_complexity) for worker quality."""
-        qw = self._params["quality_assessment"]["worker_weights"]
-        return qw["consensus"], qw["evidence"], qw["complexity"]
+        return _require(self._quality_worker_weights, "quality_assessment.worker_weights")
 
     def quality_reviewer_weights(self) -> tuple[float, float]:
         """Return (w_alignment, w_calibration) for reviewer quality."""
-        rw = self._params["quality_assessment"]["reviewer_weights"]
-        return rw["alignment"], rw["calibration"]
+        return _require(
+            self._quality_reviewer_weights, "quality_assessment.reviewer_weights",
+        )
 
     def evidence_expectations(self) -> dict[str, int]:
         """Return expected evidence count per risk tier."""
-        return dict(self._params["quality_assessment"]["evidence_expectations"])
+        return _to_dict(_require(
+            self._evidence_expectations, "quality_assessment.evidence_expectations",
+        ))
 
     def complexity_multipliers(self) -> dict[str, float]:
         """Return complexity factor per risk tier."""
-        return dict(self._params["quality_assessment"]["complexity_multipliers"])
+        return _to_dict(_require(
+            self._complexity_multipliers, "quality_assessment.complexity_multipliers",
+        ))
 
     def reviewer_alignment_scores(self) -> dict[str, float]:
         """Return alignment score table for reviewer quality assessment."""
-        return dict(self._params["quality_assessment"]["reviewer_alignment_scores"])
+        return _to_dict(_require(
+            self._reviewer_alignment_scores,
+            "quality_assessment.reviewer_alignment_scores",
+        ))
 
     def calibration_config(self) -> tuple[int, int]:
         """Return (min_history, window_size) for reviewer calibration."""
-        qa = self._params["quality_assessment"]
-        return qa["calibration_min_history"], qa["calibration_window_size"]
+        return _require(self._calibration_config, "quality_assessment")
 
     # ------------------------------------------------------------------
     # Identity signals
@@ -325,7 +672,9 @@ class PolicyResolver:
 
     def identity_signals(self) -> dict[str, Any]:
         """Return identity signal policy."""
-        return dict(self._policy["identity_signals"])
+        return _to_dict(_require(
+            self._identity_signals, "identity_signals", "runtime_policy.json",
+        ))
 
     # ------------------------------------------------------------------
     # Skill taxonomy (optional — pre-labour-market mode if absent)
@@ -338,11 +687,12 @@ class PolicyResolver:
     def skill_taxonomy_data(self) -> dict[str, Any]:
         """Return raw skill taxonomy data for SkillTaxonomy construction.
 
-        Returns empty dict if no taxonomy is loaded (pre-labour-market mode).
+        Returns an empty dict if no taxonomy is loaded (pre-labour-market
+        mode).
         """
-        if self._taxonomy is None:
+        if self._taxonomy_view is None:
             return {}
-        return dict(self._taxonomy)
+        return _to_dict(self._taxonomy_view)
 
     # ------------------------------------------------------------------
     # Domain-specific trust (optional — requires skill_trust_params.json)
@@ -357,10 +707,9 @@ class PolicyResolver:
 
         Falls back to global trust weights if no domain-specific config.
         """
-        if self._skill_trust is None:
-            return self.trust_weights()
-        dtw = self._skill_trust["domain_trust_weights"]
-        return dtw["w_Q"], dtw["w_R"], dtw["w_V"], dtw["w_E"]
+        return _require(
+            self._domain_trust_weights, "domain_trust_weights", "skill_trust_params.json",
+        )
 
     def inactivity_decay_config(self) -> dict[str, Any]:
         """Return inactivity decay configuration.
@@ -369,7 +718,9 @@ class PolicyResolver:
         """
         if self._skill_trust is None:
             raise ValueError("No skill trust config loaded")
-        return dict(self._skill_trust["inactivity_decay"])
+        return _to_dict(_require(
+            self._inactivity_decay, "inactivity_decay", "skill_trust_params.json",
+        ))
 
     def half_life_days(self, is_machine: bool) -> float:
         """Return the inactivity decay half-life for an actor kind.
@@ -378,18 +729,19 @@ class PolicyResolver:
         MACHINE: shorter (e.g. 90 days) — silence likely means deprecated.
         Falls back to 365 if no config loaded.
         """
-        if self._skill_trust is None:
-            return 365.0
-        decay = self._skill_trust["inactivity_decay"]
-        if is_machine:
-            return float(decay["half_life_days_machine"])
-        return float(decay["half_life_days_human"])
+        machine, human = _require(
+            self._half_lives, "inactivity_decay", "skill_trust_params.json",
+        )
+        return machine if is_machine else human
 
     def global_score_aggregation(self) -> dict[str, Any]:
         """Return global score aggregation configuration."""
         if self._skill_trust is None:
-            return {"method": "weighted_mean", "recency_weight": 0.3, "volume_weight": 0.7}
-        return dict(self._skill_trust["global_score_aggregation"])
+            return _to_dict(_DEFAULT_GLOBAL_SCORE_AGGREGATION)
+        return _to_dict(_require(
+            self._global_score_aggregation, "global_score_aggregation",
+            "skill_trust_params.json",
+        ))
 
     # ------------------------------------------------------------------
     # Skill matching (optional — requires skill_trust_params.json)
@@ -407,17 +759,8 @@ class PolicyResolver:
         Falls back to defaults if no skill trust config loaded.
         """
         if self._skill_trust is None:
-            return {
-                "min_relevance_score": 0.3,
-                "proficiency_weight": 0.60,
-                "domain_trust_weight": 0.40,
-                "worker_allocation_weights": {
-                    "relevance": 0.50,
-                    "global_trust": 0.20,
-                    "domain_trust": 0.30,
-                },
-            }
-        return dict(self._skill_trust.get("skill_matching", {}))
+            return _to_dict(_DEFAULT_SKILL_MATCHING)
+        return _to_dict(self._skill_matching)
 
     # ------------------------------------------------------------------
     # Skill lifecycle (optional — requires skill_lifecycle_params.json)
@@ -435,26 +778,9 @@ class PolicyResolver:
               endorsement: {base_boost, min_endorser_proficiency, ...},
               outcome_updates: {approval_boost, rejection_penalty, ...}
         """
-        if self._skill_lifecycle is None:
-            return {
-                "skill_half_life_days_human": 365.0,
-                "skill_half_life_days_machine": 90.0,
-                "skill_decay_floor": 0.01,
-                "skill_prune_threshold": 0.01,
-                "endorsement": {
-                    "base_boost": 0.05,
-                    "min_endorser_proficiency": 0.5,
-                    "max_endorsements_per_skill": 10,
-                },
-                "outcome_updates": {
-                    "approval_boost": 0.05,
-                    "rejection_penalty": 0.02,
-                    "complexity_multipliers": {
-                        "R0": 1.0, "R1": 1.5, "R2": 2.0, "R3": 2.5,
-                    },
-                },
-            }
-        return dict(self._skill_lifecycle)
+        if self._skill_lifecycle_view is None:
+            return _to_dict(_DEFAULT_SKILL_LIFECYCLE)
+        return _to_dict(self._skill_lifecycle_view)
 
     # ------------------------------------------------------------------
     # Market policy (optional — requires market_policy.json)
@@ -470,15 +796,7 @@ class PolicyResolver:
         Keys: relevance, global_trust, domain_trust.
         Falls back to skill_matching config if no market config.
         """
-        if self._market_policy is not None:
-            return dict(self._market_policy.get("allocation_weights", {}))
-        # Fall back to skill matching worker_allocation_weights
-        sm = self.skill_matching_config()
-        return dict(sm.get("worker_allocation_weights", {
-            "relevance": 0.50,
-            "global_trust": 0.20,
-            "domain_trust": 0.30,
-        }))
+        return _to_dict(self._allocation_weights)
 
     def market_listing_defaults(self) -> dict[str, Any]:
         """Return default listing configuration.
@@ -487,13 +805,8 @@ class PolicyResolver:
               min_skill_requirements, auto_close_on_allocation.
         """
         if self._market_policy is None:
-            return {
-                "max_bids_per_listing": 50,
-                "bid_window_hours": 48,
-                "min_skill_requirements": 0,
-                "auto_close_on_allocation": True,
-            }
-        return dict(self._market_policy.get("listing_defaults", {}))
+            return _to_dict(_DEFAULT_LISTING)
+        return _to_dict(self._listing_defaults)
 
     def market_bid_requirements(self) -> dict[str, Any]:
         """Return bid submission requirements.
@@ -502,12 +815,8 @@ class PolicyResolver:
               allow_multiple_bids_per_worker.
         """
         if self._market_policy is None:
-            return {
-                "min_trust_to_bid": 0.10,
-                "min_relevance_to_bid": 0.0,
-                "allow_multiple_bids_per_worker": False,
-            }
-        return dict(self._market_policy.get("bid_requirements", {}))
+            return _to_dict(_DEFAULT_BID_REQUIREMENTS)
+        return _to_dict(self._bid_requirements)
 
     # ------------------------------------------------------------------
     # Protected leave policy (optional)
@@ -524,18 +833,8 @@ class PolicyResolver:
               min_domain_trust, max_adjudicators, adjudicator_diversity.
         """
         if self._leave_policy is None:
-            return {
-                "min_quorum": 3,
-                "min_approve_to_grant": 2,
-                "min_adjudicator_trust": 0.40,
-                "min_domain_trust": 0.30,
-                "max_adjudicators": 5,
-                "adjudicator_diversity": {
-                    "min_organizations": 2,
-                    "min_regions": 2,
-                },
-            }
-        return dict(self._leave_policy.get("adjudication", {}))
+            return _to_dict(_DEFAULT_LEAVE_ADJUDICATION)
+        return _to_dict(self._leave_adjudication)
 
     def leave_category_config(self, category: str) -> dict[str, Any]:
         """Return config for a specific leave category.
@@ -543,19 +842,10 @@ class PolicyResolver:
         Keys: required_adjudicator_domains, max_duration_days, renewable.
         Raises ValueError for unknown categories.
         """
-        if self._leave_policy is None:
-            from genesis.models.leave import CATEGORY_REQUIRED_DOMAINS
-            if category not in CATEGORY_REQUIRED_DOMAINS:
-                raise ValueError(f"Unknown leave category: {category}")
-            return {
-                "required_adjudicator_domains": CATEGORY_REQUIRED_DOMAINS[category],
-                "max_duration_days": None,
-                "renewable": True,
-            }
-        cats = self._leave_policy.get("leave_categories", {})
-        if category not in cats:
+        config = self._leave_categories.get(category)
+        if config is None:
             raise ValueError(f"Unknown leave category: {category}")
-        return dict(cats[category])
+        return _to_dict(config)
 
     def leave_anti_gaming_config(self) -> dict[str, Any]:
         """Return anti-gaming protection parameters.
@@ -564,12 +854,8 @@ class PolicyResolver:
               adjudicator_cannot_self_approve.
         """
         if self._leave_policy is None:
-            return {
-                "cooldown_days_between_leaves": 30,
-                "max_leaves_per_year": 4,
-                "adjudicator_cannot_self_approve": True,
-            }
-        return dict(self._leave_policy.get("anti_gaming", {}))
+            return _to_dict(_DEFAULT_LEAVE_ANTI_GAMING)
+        return _to_dict(self._leave_anti_gaming)
 
     def leave_trust_freeze_config(self) -> dict[str, Any]:
         """Return trust freeze parameters.
@@ -578,13 +864,8 @@ class PolicyResolver:
               freeze_skill_decay, reset_last_active_on_return.
         """
         if self._leave_policy is None:
-            return {
-                "freeze_trust_score": True,
-                "freeze_domain_scores": True,
-                "freeze_skill_decay": True,
-                "reset_last_active_on_return": True,
-            }
-        return dict(self._leave_policy.get("trust_freeze", {}))
+            return _to_dict(_DEFAULT_LEAVE_TRUST_FREEZE)
+        return _to_dict(self._leave_trust_freeze)
 
     def leave_duration_config(self) -> dict[str, Any]:
         """Return duration limit parameters.
@@ -593,15 +874,67 @@ class PolicyResolver:
               extension_requires_new_adjudication.
         """
         if self._leave_policy is None:
-            return {
-                "default_max_days": None,
-                "category_overrides": {
-                    "pregnancy": 365,
-                    "child_care": 365,
-                },
-                "extension_requires_new_adjudication": True,
-            }
-        return dict(self._leave_policy.get("duration_limits", {}))
+            return _to_dict(_DEFAULT_LEAVE_DURATION)
+        return _to_dict(self._leave_duration)
+
+    def leave_adjudication_policy(self) -> LeaveAdjudicationPolicy:
+        """Return the leave policy compiled into a LeaveAdjudicationPolicy.
+
+        Missing keys take the same defaults the engine has always applied.
+        Compiled on first use and shared thereafter; a resolver's policy
+        never changes after construction.
+        """
+        cached = self._compiled_leave_policy
+        if cached is not None:
+            return cached
+
+        adjudication = self.leave_adjudication_config()
+        diversity = adjudication.get("adjudicator_diversity", {})
+        anti_gaming = self.leave_anti_gaming_config()
+        duration = self.leave_duration_config()
+
+        required_domains: dict[LeaveCategory, tuple[str, ...]] = {}
+        for category in LeaveCategory:
+            try:
+                cat_config = self.leave_category_config(category.value)
+            except ValueError:
+                continue  # Not configured — rejected as unknown at use
+            required_domains[category] = tuple(cat_config.get(
+                "required_adjudicator_domains", ("healthcare",),
+            ))
+
+        # Resolve each category's duration limit once; None = unlimited.
+        default_max_days = duration.get("default_max_days")
+        category_overrides = dict(duration.get("category_overrides", {}))
+        max_days_by_category: dict[LeaveCategory, Optional[int]] = {}
+        expires_delta_by_category: dict[LeaveCategory, Optional[timedelta]] = {}
+        for category in LeaveCategory:
+            max_days = category_overrides.get(category.value, default_max_days)
+            max_days_by_category[category] = max_days
+            expires_delta_by_category[category] = (
+                None if max_days is None else timedelta(days=max_days)
+            )
+
+        compiled = LeaveAdjudicationPolicy(
+            min_adjudicator_trust=adjudication.get("min_adjudicator_trust", 0.40),
+            min_domain_trust=adjudication.get("min_domain_trust", 0.30),
+            min_quorum=adjudication.get("min_quorum", 3),
+            min_approve_to_grant=adjudication.get("min_approve_to_grant", 2),
+            max_adjudicators=adjudication.get("max_adjudicators"),
+            min_organizations=diversity.get("min_organizations", 2),
+            min_regions=diversity.get("min_regions", 2),
+            cooldown_days_between_leaves=anti_gaming.get(
+                "cooldown_days_between_leaves", 30,
+            ),
+            max_leaves_per_year=anti_gaming.get("max_leaves_per_year", 4),
+            default_max_days=default_max_days,
+            category_overrides=category_overrides,
+            required_domains=MappingProxyType(required_domains),
+            max_days_by_category=MappingProxyType(max_days_by_category),
+            expires_delta_by_category=MappingProxyType(expires_delta_by_category),
+        )
+        self._compiled_leave_policy = compiled
+        return compiled
 
     @classmethod
     def from_config_dir(cls, config_dir: Path) -> PolicyResolver:
@@ -609,35 +942,24 @@ class PolicyResolver:
         params = _load_json(config_dir / "constitutional_params.json")
         policy = _load_json(config_dir / "runtime_policy.json")
 
-        # Skill taxonomy is optional — system works without it
-        taxonomy_path = config_dir / "skill_taxonomy.json"
-        taxonomy = None
-        if taxonomy_path.exists():
-            taxonomy = _load_json(taxonomy_path)
+        # One directory listing answers every optional-file check below,
+        # instead of a stat per file before opening it.
+        with os.scandir(config_dir) as entries:
+            present = {entry.name for entry in entries}
 
-        # Skill trust params are optional — system works without them
-        skill_trust_path = config_dir / "skill_trust_params.json"
-        skill_trust = None
-        if skill_trust_path.exists():
-            skill_trust = _load_json(skill_trust_path)
+        def load_optional(name: str) -> dict[str, Any] | None:
+            return _load_json(config_dir / name) if name in present else None
 
+        # Skill taxonomy is optional — system works without it
+        taxonomy = load_optional("skill_taxonomy.json")
+        # Skill trust params are optional — system works without them
+        skill_trust = load_optional("skill_trust_params.json")
         # Market policy is optional — system works without it
-        market_path = config_dir / "market_policy.json"
-        market_policy = None
-        if market_path.exists():
-            market_policy = _load_json(market_path)
-
+        market_policy = load_optional("market_policy.json")
         # Skill lifecycle params are optional — system works without them
-        lifecycle_path = config_dir / "skill_lifecycle_params.json"
-        skill_lifecycle = None
-        if lifecycle_path.exists():
-            skill_lifecycle = _load_json(lifecycle_path)
-
+        skill_lifecycle = load_optional("skill_lifecycle_params.json")
         # Leave policy is optional — system works without it
-        leave_path = config_dir / "leave_policy.json"
-        leave_policy = None
-        if leave_path.exists():
-            leave_policy = _load_json(leave_path)
+        leave_policy = load_optional("leave_policy.json")
 
         return cls(
             params, policy,
@@ -649,9 +971,75 @@ class PolicyResolver:
         )
 
 
+def _check_required(
+    config: Mapping[str, Any], source: str, paths: tuple[str, ...],
+) -> None:
+    """Raise ValueError naming the first path missing under a present section."""
+    for path in paths:
+        keys = path.split(".")
+        if keys[0] not in config:
+            continue
+        value: Any = config
+        for key in keys:
+            if not isinstance(value, Mapping) or key not in value:
+                raise ValueError(f"{source} missing {path}")
+            value = value[key]
+
+
+def _lookup(config: Optional[Mapping[str, Any]], *path: str) -> Any:
+    """Return config[path[0]][path[1]]..., or None if any level is absent."""
+    value: Any = config
+    for key in path:
+        if value is None:
+            return None
+        value = value.get(key)
+    return value
+
+
+def _leaves(section: Optional[Mapping[str, Any]], *keys: str) -> Optional[tuple]:
+    """Return the values of *keys* in *section* as a tuple, or None if absent."""
+    if section is None:
+        return None
+    return tuple(section[key] for key in keys)
+
+
+def _read_only(
+    config: Optional[Mapping[str, Any]], *path: str,
+) -> Optional[Mapping[str, Any]]:
+    """Return a read-only view of config[path[0]][path[1]]..., or None if absent."""
+    section = _lookup(config, *path)
+    return None if section is None else MappingProxyType(section)
+
+
+def _to_dict(view: Mapping[str, Any]) -> dict[str, Any]:
+    """Copy a config view into the fresh dict accessors hand out.
+
+    Shallow, like the section copies accessors have always returned;
+    nested read-only views (the built-in defaults) become dicts too, so
+    callers may mutate or serialise the result.
+    """
+    return {
+        key: _to_dict(value) if isinstance(value, MappingProxyType) else value
+        for key, value in view.items()
+    }
+
+
+def _require(
+    view: Optional[_T],
+    path: str,
+    source: str = "constitutional_params.json",
+) -> _T:
+    """Return *view*, failing loud when its config section was missing."""
+    if view is None:
+        raise ValueError(f"{source} missing {path}")
+    return view
+
+
 def _load_json(path: Path) -> dict[str, Any]:
     """Load a JSON file or raise with clear path."""
-    if not path.exists():
-        raise FileNotFoundError(f"Config file not found: {path}")
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    try:
+        # json.loads decodes UTF-8 bytes itself, skipping the text-mode
+        # file wrapper.
+        return json.loads(path.read_bytes())
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {path}") from None
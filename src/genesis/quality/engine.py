@@ -20,7 +20,7 @@ Reviewer quality:
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Sequence
 
 from genesis.models.mission import (
     DomainType,
@@ -177,6 +177,32 @@ class QualityEngine:
             domains=domains,
         )
 
+    def derive_worker_quality_batch(
+        self,
+        consensus: Sequence[float],
+        evidence: Sequence[float],
+        complexity: Sequence[float],
+    ) -> list[float]:
+        """Derive worker quality for many missions from precomputed components.
+
+        Columnar counterpart of assess_worker_quality: the three sequences
+        are parallel (one entry per mission) and the result is the clamped
+        derived_quality for each. Weights are resolved once for the whole
+        batch; assessment objects are only built by callers that need them.
+
+        Raises:
+            ValueError: If the sequences differ in length.
+        """
+        if not (len(consensus) == len(evidence) == len(complexity)):
+            raise ValueError(
+                "consensus, evidence and complexity must have equal length"
+            )
+        w_c, w_e, w_x = self._resolver.quality_worker_weights()
+        return [
+            min(1.0, max(0.0, w_c * c + w_e * e + w_x * x))
+            for c, e, x in zip(consensus, evidence, complexity)
+        ]
+
     def assess_reviewer_quality(
         self,
         reviewer_id: str,
@@ -320,11 +346,7 @@ class QualityEngine:
         scores = self._resolver.reviewer_alignment_scores()
 
         # Find this reviewer's decision
-        decision = None
-        for d in mission.review_decisions:
-            if d.reviewer_id == reviewer_id:
-                decision = d
-                break
+        decision = mission.decision_for(reviewer_id)
 
         if decision is None:
             # Reviewer assigned but no decision recorded — treat as abstain
@@ -24,6 +24,36 @@ from typing import Optional
 from genesis.models.trust import ActorKind
 
 
+class DiversityBits:
+    """Bit assignments for diversity checks, owned by one ActorRoster.
+
+    Each distinct organisation/region gets its own power of two, so a
+    set of actors can be summarised as an int mask. Masks are only
+    comparable between entries that share the same table.
+    """
+
+    def __init__(self) -> None:
+        self._organizations: dict[str, int] = {}
+        self._regions: dict[str, int] = {}
+
+    def organization(self, name: str) -> int:
+        """Return the bit for an organisation, assigning one if new."""
+        return _diversity_bit(self._organizations, name)
+
+    def region(self, name: str) -> int:
+        """Return the bit for a region, assigning one if new."""
+        return _diversity_bit(self._regions, name)
+
+
+def _diversity_bit(table: dict[str, int], key: str) -> int:
+    """Return the bit for key, assigning the next free one if new."""
+    bit = table.get(key)
+    if bit is None:
+        bit = 1 << len(table)
+        table[key] = bit
+    return bit
+
+
 class ActorStatus(str, enum.Enum):
     """Operational status of a roster actor."""
     ACTIVE = "active"
@@ -53,11 +83,28 @@ class RosterEntry:
     skill_profile: Optional[object] = None
     # Type: Optional[ActorSkillProfile] — untyped to avoid circular import.
     # Set via GenesisService.update_actor_skills().
+    # Bit table of the roster this entry is registered with; set by
+    # ActorRoster.register(). None = never registered.
+    diversity_bits: Optional[DiversityBits] = field(
+        default=None, init=False, repr=False, compare=False,
+    )
 
     def is_available(self) -> bool:
         """An actor is available if active or on probation."""
         return self.status in (ActorStatus.ACTIVE, ActorStatus.PROBATION)
 
+    @property
+    def organization_bit(self) -> int:
+        """Roster bit for the current organization; 0 if unregistered."""
+        bits = self.diversity_bits
+        return bits.organization(self.organization) if bits is not None else 0
+
+    @property
+    def region_bit(self) -> int:
+        """Roster bit for the current region; 0 if unregistered."""
+        bits = self.diversity_bits
+        return bits.region(self.region) if bits is not None else 0
+
 
 class ActorRoster:
     """Registry of all actors in the Genesis system.
@@ -68,6 +115,7 @@ class ActorRoster:
 
     def __init__(self) -> None:
         self._actors: dict[str, RosterEntry] = {}
+        self._diversity_bits = DiversityBits()
 
     def register(self, entry: RosterEntry) -> None:
         """Register a new actor or update an existing one.
@@ -84,6 +132,7 @@ class ActorRoster:
                 f"Trust score must be in [0, 1], got {entry.trust_score}"
             )
         entry.actor_id = canonical_id
+        entry.diversity_bits = self._diversity_bits
         self._actors[canonical_id] = entry
 
     def remove(self, actor_id: str) -> None:
@@ -69,7 +69,7 @@ from genesis.models.market import (
     MarketListing,
 )
 from genesis.models.trust import ActorKind, TrustDelta, TrustRecord
-from genesis.leave.engine import LeaveAdjudicationEngine
+from genesis.leave.engine import ActorLeaveIndex, LeaveAdjudicationEngine
 from genesis.market.allocator import AllocationEngine
 from genesis.market.listing_state_machine import ListingStateMachine
 from genesis.skills.decay import SkillDecayEngine
@@ -191,6 +191,10 @@ class GenesisService:
         self._event_counter = event_log.count if event_log is not None else 0
         # Leave ID counter: initialise from persisted records
         self._leave_counter = len(self._leave_records)
+        # Per-actor leave index: actor_id -> leave_ids, insertion-ordered
+        self._leave_ids_by_actor: dict[str, list[str]] = {}
+        for record in self._leave_records.values():
+            self._index_leave(record)
 
         # Persistence health flag: set to True if a StateStore write fails
         # after an audit event has been durably committed. In-memory state
@@ -198,6 +202,21 @@ class GenesisService:
         # stale and needs operator intervention or event-log replay.
         self._persistence_degraded: bool = False
 
+    def close(self) -> None:
+        """Write pending events and release the event log's file handle.
+
+        Call on shutdown. The service stays usable; a later event
+        reopens the log.
+        """
+        if self._event_log is not None:
+            self._event_log.close()
+
+    def __enter__(self) -> GenesisService:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     # ------------------------------------------------------------------
     # Actor management
     # ------------------------------------------------------------------
@@ -1640,12 +1659,9 @@ class GenesisService:
             )
 
         # Anti-gaming checks
-        existing_leaves = [
-            r for r in self._leave_records.values()
-            if r.actor_id == actor_id
-        ]
         violations = self._leave_engine.check_anti_gaming(
-            actor_id, existing_leaves,
+            actor_id,
+            ActorLeaveIndex.from_leaves(self._actor_leave_records(actor_id)),
         )
         if violations:
             return ServiceResult(success=False, errors=violations)
@@ -1664,11 +1680,13 @@ class GenesisService:
             requested_utc=now,
         )
         self._leave_records[leave_id] = record
+        self._index_leave(record)
 
         # Three-step event recording
         err = self._record_leave_event(record, "requested")
         if err:
             del self._leave_records[leave_id]
+            self._unindex_leave(record)
             self._leave_counter -= 1
             return ServiceResult(success=False, errors=[err])
 
@@ -1722,8 +1740,7 @@ class GenesisService:
                 )
 
         # Enforce max_adjudicators cap
-        adj_config = self._resolver.leave_adjudication_config()
-        max_adjudicators = adj_config.get("max_adjudicators")
+        max_adjudicators = self._resolver.leave_adjudication_policy().max_adjudicators
         if max_adjudicators is not None and len(record.adjudications) >= max_adjudicators:
             return ServiceResult(
                 success=False,
@@ -1751,7 +1768,7 @@ class GenesisService:
             adj_entry, adj_trust, record.category, record.actor_id,
         )
         if not eligibility.eligible:
-            return ServiceResult(success=False, errors=eligibility.errors)
+            return ServiceResult(success=False, errors=list(eligibility.errors))
 
         # Snapshot for rollback
         old_adjudications = list(record.adjudications)
@@ -1786,8 +1803,9 @@ class GenesisService:
                 # Diversity check: non-abstain adjudicators must meet
                 # configured org/region diversity thresholds
                 non_abstain_entries: dict[str, RosterEntry] = {}
+                abstain = AdjudicationVerdict.ABSTAIN
                 for adj in record.adjudications:
-                    if adj.verdict != AdjudicationVerdict.ABSTAIN:
+                    if adj.verdict is not abstain:
                         e = self._roster.get(adj.adjudicator_id)
                         if e is not None:
                             non_abstain_entries[adj.adjudicator_id] = e
@@ -1823,6 +1841,9 @@ class GenesisService:
                         self._undo_memorialisation(record, old_state,
                                                     old_approved_utc, old_adjudications)
                         return ServiceResult(success=False, errors=[err])
+                    # Terminal: sealed only once the event is recorded,
+                    # so the rollback above can still restore fields.
+                    record.seal()
                 else:
                     activation_data = self._activate_leave(record, now)
                     err = self._record_leave_event(record, "approved")
@@ -1840,6 +1861,7 @@ class GenesisService:
                     record.denied_utc = old_denied_utc
                     record.adjudications = old_adjudications
                     return ServiceResult(success=False, errors=[err])
+                record.seal()
 
         warning = self._safe_persist_post_audit()
         data: dict[str, Any] = {
@@ -1933,6 +1955,7 @@ class GenesisService:
                     if ds and hasattr(ds, "last_active_utc"):
                         ds.last_active_utc = old_ts
             return ServiceResult(success=False, errors=[err])
+        record.seal()
 
         warning = self._safe_persist_post_audit()
         data: dict[str, Any] = {
@@ -1986,9 +2009,8 @@ class GenesisService:
             )
         # Block duplicate death petitions — no parallel pending/active death records
         existing_death_leaves = [
-            r for r in self._leave_records.values()
-            if r.actor_id == actor_id
-            and r.category == LeaveCategory.DEATH
+            r for r in self._actor_leave_records(actor_id)
+            if r.category == LeaveCategory.DEATH
             and r.state in (LeaveState.PENDING, LeaveState.ACTIVE, LeaveState.MEMORIALISED)
         ]
         if existing_death_leaves:
@@ -2033,10 +2055,12 @@ class GenesisService:
             requested_utc=now,
         )
         self._leave_records[leave_id] = record
+        self._index_leave(record)
 
         err = self._record_leave_event(record, "requested")
         if err:
             del self._leave_records[leave_id]
+            self._unindex_leave(record)
             self._leave_counter -= 1
             return ServiceResult(success=False, errors=[err])
 
@@ -2105,9 +2129,10 @@ class GenesisService:
         """
         expired: list[dict[str, Any]] = []
         errors_found: list[str] = []
+        now = datetime.now(timezone.utc)  # One clock reading for the sweep
 
         for leave_id, record in list(self._leave_records.items()):
-            if self._leave_engine.check_leave_expiry(record):
+            if self._leave_engine.check_leave_expiry(record, now):
                 result = self.return_from_leave(leave_id)
                 if result.success:
                     expired.append({
@@ -2130,10 +2155,7 @@ class GenesisService:
 
     def get_actor_leaves(self, actor_id: str) -> list[LeaveRecord]:
         """Get all leave records for an actor."""
-        return [
-            r for r in self._leave_records.values()
-            if r.actor_id == actor_id.strip()
-        ]
+        return self._actor_leave_records(actor_id.strip())
 
     def is_actor_on_leave(self, actor_id: str) -> bool:
         """Check if an actor has an ACTIVE or MEMORIALISED leave record.
@@ -2144,8 +2166,7 @@ class GenesisService:
         """
         return any(
             r.state in (LeaveState.ACTIVE, LeaveState.MEMORIALISED)
-            for r in self._leave_records.values()
-            if r.actor_id == actor_id.strip()
+            for r in self._actor_leave_records(actor_id.strip())
         )
 
     def get_leave_status(self) -> dict[str, Any]:
@@ -2166,6 +2187,27 @@ class GenesisService:
     # Protected leave — internal helpers
     # ------------------------------------------------------------------
 
+    def _index_leave(self, record: LeaveRecord) -> None:
+        """Add a leave record to the per-actor index."""
+        self._leave_ids_by_actor.setdefault(record.actor_id, []).append(
+            record.leave_id,
+        )
+
+    def _unindex_leave(self, record: LeaveRecord) -> None:
+        """Remove a leave record from the per-actor index."""
+        leave_ids = self._leave_ids_by_actor.get(record.actor_id)
+        if leave_ids and record.leave_id in leave_ids:
+            leave_ids.remove(record.leave_id)
+
+    def _actor_leave_records(self, actor_id: str) -> list[LeaveRecord]:
+        """Return an actor's leave records without scanning every record."""
+        records = self._leave_records
+        return [
+            records[leave_id]
+            for leave_id in self._leave_ids_by_actor.get(actor_id, ())
+            if leave_id in records
+        ]
+
     def _activate_leave(
         self, record: LeaveRecord, now: datetime,
     ) -> dict[str, Any]:
@@ -2211,11 +2253,9 @@ class GenesisService:
         )
         if record.expires_utc:
             # Extract granted duration from config
-            duration_config = self._resolver.leave_duration_config()
-            overrides = duration_config.get("category_overrides", {})
-            default_max = duration_config.get("default_max_days")
-            record.granted_duration_days = overrides.get(
-                record.category.value, default_max,
+            leave_policy = self._resolver.leave_adjudication_policy()
+            record.granted_duration_days = leave_policy.max_days_by_category.get(
+                record.category,
             )
 
         # Set roster status to ON_LEAVE
@@ -2946,17 +2986,18 @@ class GenesisService:
         """
         if self._state_store is None:
             return
-        self._state_store.save_roster(self._roster)
-        self._state_store.save_trust_records(self._trust_records)
-        self._state_store.save_missions(self._missions)
-        self._state_store.save_reviewer_histories(self._reviewer_assessment_history)
-        self._state_store.save_skill_profiles(self._skill_profiles)
-        self._state_store.save_listings(self._listings, self._bids)
-        self._state_store.save_leave_records(self._leave_records)
-        self._state_store.save_epoch_state(
-            self._epoch_service.previous_hash,
-            len(self._epoch_service.committed_records),
-        )
+        with self._state_store.save_batch():
+            self._state_store.save_roster(self._roster)
+            self._state_store.save_trust_records(self._trust_records)
+            self._state_store.save_missions(self._missions)
+            self._state_store.save_reviewer_histories(self._reviewer_assessment_history)
+            self._state_store.save_skill_profiles(self._skill_profiles)
+            self._state_store.save_listings(self._listings, self._bids)
+            self._state_store.save_leave_records(self._leave_records)
+            self._state_store.save_epoch_state(
+                self._epoch_service.previous_hash,
+                len(self._epoch_service.committed_records),
+            )
 
     def _safe_persist(
         self,
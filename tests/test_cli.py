@@ -20,6 +20,11 @@ class TestCLIParsing:
         assert args.id == "alice"
         assert args.kind == "human"
 
+    def test_data_dir_option(self) -> None:
+        parser = build_parser()
+        args = parser.parse_args(["--data", "/tmp/genesis", "status"])
+        assert str(args.data) == "/tmp/genesis"
+
     def test_create_mission_command(self) -> None:
         parser = build_parser()
         args = parser.parse_args([
@@ -31,8 +36,13 @@ class TestCLIParsing:
 
 
 class TestCLIExecution:
+    @pytest.fixture(autouse=True)
+    def _data_dir(self, tmp_path) -> None:
+        """Keep CLI runs out of the repository's default data/ directory."""
+        self.data = ["--data", str(tmp_path / "data")]
+
     def test_status_runs(self) -> None:
-        exit_code = main(["status"])
+        exit_code = main([*self.data, "status"])
         assert exit_code == 0
 
     def test_check_invariants_runs(self) -> None:
@@ -45,7 +55,7 @@ class TestCLIExecution:
 
     def test_register_actor_e2e(self) -> None:
         exit_code = main([
-            "register-actor", "--id", "cli_test_actor",
+            *self.data, "register-actor", "--id", "cli_test_actor",
             "--kind", "human", "--region", "EU", "--org", "TestOrg",
         ])
         assert exit_code == 0
@@ -53,7 +63,7 @@ class TestCLIExecution:
     def test_create_mission_fails_without_epoch(self) -> None:
         """Creating a mission via CLI fails closed when no epoch is open."""
         exit_code = main([
-            "create-mission", "--id", "M-CLI-001",
+            *self.data, "create-mission", "--id", "M-CLI-001",
             "--title", "CLI test mission",
             "--class", "documentation_update",
         ])
@@ -9,6 +9,7 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from genesis.leave.engine import (
+    ActorLeaveIndex,
     AdjudicatorEligibility,
     LeaveAdjudicationEngine,
     QuorumResult,
@@ -23,7 +24,7 @@ from genesis.models.leave import (
 )
 from genesis.models.trust import ActorKind, TrustRecord
 from genesis.policy.resolver import PolicyResolver
-from genesis.review.roster import ActorStatus, RosterEntry
+from genesis.review.roster import ActorRoster, ActorStatus, RosterEntry
 
 CONFIG_DIR = Path(__file__).parent.parent / "config"
 
@@ -85,7 +86,43 @@ class TestAdjudicatorEligibility:
         )
         assert result.eligible is True
         assert result.qualifying_domain == "healthcare"
-        assert result.errors == []
+        assert result.errors == ()
+
+    def test_eligible_results_are_shared(self) -> None:
+        engine = LeaveAdjudicationEngine(_make_resolver())
+        trust = _make_trust_record(
+            domain_scores={"healthcare": _make_domain_trust("healthcare", 0.50)},
+        )
+        first = engine.check_adjudicator_eligibility(
+            _make_roster_entry(), trust, LeaveCategory.ILLNESS, "APPLICANT-001",
+        )
+        second = engine.check_adjudicator_eligibility(
+            _make_roster_entry(), trust, LeaveCategory.ILLNESS, "APPLICANT-002",
+        )
+        assert first is second
+
+    def test_check_many_preserves_candidate_order(self) -> None:
+        engine = LeaveAdjudicationEngine(_make_resolver())
+        qualified = _make_trust_record(
+            domain_scores={"healthcare": _make_domain_trust("healthcare", 0.50)},
+        )
+        candidates = [
+            (_make_roster_entry("ADJ-001"), qualified),
+            (_make_roster_entry("APPLICANT-001"), qualified),
+            (_make_roster_entry("ADJ-003", kind=ActorKind.MACHINE), qualified),
+        ]
+        for workers in (None, 4):
+            results = engine.check_many_eligibility(
+                candidates, LeaveCategory.ILLNESS, "APPLICANT-001",
+                max_workers=workers,
+            )
+            assert [r.eligible for r in results] == [True, False, False]
+            assert results == [
+                engine.check_adjudicator_eligibility(
+                    entry, trust, LeaveCategory.ILLNESS, "APPLICANT-001",
+                )
+                for entry, trust in candidates
+            ]
 
     def test_self_adjudication_blocked(self) -> None:
         engine = LeaveAdjudicationEngine(_make_resolver())
@@ -192,6 +229,40 @@ class TestAdjudicatorEligibility:
         )
         assert result.eligible is False
 
+    def test_non_domain_score_value_ineligible(self) -> None:
+        """A domain entry that is not a DomainTrustScore does not qualify."""
+        engine = LeaveAdjudicationEngine(_make_resolver())
+        entry = _make_roster_entry()
+        trust = _make_trust_record(domain_scores={"healthcare": 0.90})
+        result = engine.check_adjudicator_eligibility(
+            entry, trust, LeaveCategory.ILLNESS, "APPLICANT-001",
+        )
+        assert result.eligible is False
+
+    def test_uncompiled_category_goes_through_resolver(self) -> None:
+        resolver = _make_resolver()
+        engine = LeaveAdjudicationEngine(resolver)
+        entry = _make_roster_entry()
+        trust = _make_trust_record(
+            domain_scores={"healthcare": _make_domain_trust("healthcare", 0.50)},
+        )
+        object.__setattr__(
+            resolver.leave_adjudication_policy(), "required_domains", {},
+        )
+        asked: list[str] = []
+        original = resolver.leave_category_config
+
+        def recording(category: str) -> object:
+            asked.append(category)
+            return original(category)
+
+        resolver.leave_category_config = recording  # type: ignore[method-assign]
+        result = engine.check_adjudicator_eligibility(
+            entry, trust, LeaveCategory.ILLNESS, "APPLICANT-001",
+        )
+        assert result.eligible is True
+        assert asked == ["illness"]
+
     def test_wrong_domain(self) -> None:
         """Has domain trust but not in the required domain."""
         engine = LeaveAdjudicationEngine(_make_resolver())
@@ -444,6 +515,88 @@ class TestAntiGaming:
         assert len(violations) >= 1
         assert "Cooldown" in violations[0]
 
+    def test_index_matches_record_list(self) -> None:
+        engine = LeaveAdjudicationEngine(_make_resolver())
+        now = datetime.now(timezone.utc)
+        leaves = [
+            LeaveRecord(
+                leave_id=f"L{i}", actor_id="ACTOR-001", category=LeaveCategory.ILLNESS,
+                state=LeaveState.RETURNED,
+                requested_utc=now - timedelta(days=300 - i * 70),
+                approved_utc=now - timedelta(days=290 - i * 70),
+                returned_utc=now - timedelta(days=280 - i * 70),
+            )
+            for i in range(4)
+        ]
+        index = ActorLeaveIndex.from_leaves(leaves)
+        assert list(index.requested_times) == sorted(
+            l.requested_utc.timestamp() for l in leaves
+        )
+        assert (
+            engine.check_anti_gaming("ACTOR-001", index, now=now)
+            == engine.check_anti_gaming("ACTOR-001", leaves, now=now)
+        )
+
+    def test_batch_matches_single_actor_checks(self) -> None:
+        engine = LeaveAdjudicationEngine(_make_resolver())
+        now = datetime.now(timezone.utc)
+        recent = LeaveRecord(
+            leave_id="L1", actor_id="ACTOR-001", category=LeaveCategory.ILLNESS,
+            state=LeaveState.RETURNED,
+            approved_utc=now - timedelta(days=10),
+            returned_utc=now - timedelta(days=5),
+        )
+        histories = {"ACTOR-001": [recent], "ACTOR-002": ActorLeaveIndex()}
+        results = engine.check_anti_gaming_batch(histories, now=now)
+        assert results["ACTOR-001"] == engine.check_anti_gaming(
+            "ACTOR-001", [recent], now=now,
+        )
+        assert results["ACTOR-002"] == []
+
+    def test_index_excludes_denied_and_pending_ends(self) -> None:
+        now = datetime.now(timezone.utc)
+        index = ActorLeaveIndex.from_leaves([
+            LeaveRecord(
+                leave_id="L1", actor_id="ACTOR-001", category=LeaveCategory.ILLNESS,
+                state=LeaveState.DENIED, requested_utc=now,
+            ),
+            LeaveRecord(
+                leave_id="L2", actor_id="ACTOR-001", category=LeaveCategory.ILLNESS,
+                state=LeaveState.PENDING, requested_utc=now,
+            ),
+        ])
+        assert index.end_times == ()
+        assert index.requested_times == (now.timestamp(),)
+
+    def test_cooldown_violations_in_record_order(self) -> None:
+        engine = LeaveAdjudicationEngine(_make_resolver())
+        now = datetime.now(timezone.utc)
+        leaves = [
+            LeaveRecord(
+                leave_id=f"L{days}", actor_id="ACTOR-001",
+                category=LeaveCategory.ILLNESS, state=LeaveState.RETURNED,
+                approved_utc=now - timedelta(days=days + 5),
+                returned_utc=now - timedelta(days=days),
+            )
+            for days in (3, 20, 10)
+        ]
+        violations = engine.check_anti_gaming("ACTOR-001", leaves, now=now)
+        assert [v.split()[1] for v in violations] == ["3", "20", "10"]
+
+    def test_naive_timestamps_rejected(self) -> None:
+        engine = LeaveAdjudicationEngine(_make_resolver())
+        now = datetime.now(timezone.utc)
+        naive_leave = LeaveRecord(
+            leave_id="L1", actor_id="ACTOR-001", category=LeaveCategory.ILLNESS,
+            state=LeaveState.RETURNED,
+            approved_utc=now - timedelta(days=10),
+            returned_utc=(now - timedelta(days=5)).replace(tzinfo=None),
+        )
+        with pytest.raises(TypeError):
+            engine.check_anti_gaming("ACTOR-001", [naive_leave], now=now)
+        with pytest.raises(TypeError):
+            engine.check_anti_gaming("ACTOR-001", [], now=now.replace(tzinfo=None))
+
 
 # ===================================================================
 # Leave expiry checks
@@ -652,3 +805,111 @@ class TestAdjudicatorDiversity:
         }
         violations = engine.check_adjudicator_diversity(entries)
         assert len(violations) == 0  # 2 orgs, 2 regions — meets minimum
+
+    def test_registered_entries_use_same_rules(self) -> None:
+        """Roster-registered entries (bitmask path) give the same verdicts."""
+        engine = LeaveAdjudicationEngine(_make_resolver())
+        roster = ActorRoster()
+        for aid, region, org in (
+            ("A1", "EU", "Hospital-A"),
+            ("A2", "EU", "Hospital-B"),
+            ("A3", "EU", "Clinic-C"),
+        ):
+            roster.register(_make_roster_entry(aid, region=region, organization=org))
+        entries = {e.actor_id: e for e in roster.all_actors()}
+        violations = engine.check_adjudicator_diversity(entries)
+        assert len(violations) == 1
+        assert "1 distinct region" in violations[0]
+
+    def test_entries_from_different_rosters(self) -> None:
+        """Bits from separate rosters are not mixed into one mask."""
+        engine = LeaveAdjudicationEngine(_make_resolver())
+        entries = {}
+        for aid, region, org in (
+            ("A1", "EU", "Hospital-A"),
+            ("A2", "US", "Hospital-B"),
+        ):
+            roster = ActorRoster()
+            roster.register(_make_roster_entry(aid, region=region, organization=org))
+            entries[aid] = roster.get(aid)
+        assert entries["A1"].organization_bit == entries["A2"].organization_bit
+        assert engine.check_adjudicator_diversity(entries) == []
+
+
+class TestBuildQuorum:
+    @staticmethod
+    def _candidate(aid: str, score: float, region: str, org: str) -> tuple:
+        return (
+            _make_roster_entry(aid, region=region, organization=org),
+            _make_trust_record(
+                aid, score=score,
+                domain_scores={"healthcare": _make_domain_trust("healthcare", 0.50)},
+            ),
+        )
+
+    def test_skips_candidates_that_would_block_diversity(self) -> None:
+        """Highest-trust clones are passed over once seats run short."""
+        engine = LeaveAdjudicationEngine(_make_resolver())
+        candidates = [
+            self._candidate("A1", 0.90, "EU", "Hospital-A"),
+            self._candidate("A2", 0.85, "EU", "Hospital-A"),
+            self._candidate("A3", 0.80, "EU", "Hospital-A"),
+            self._candidate("A4", 0.50, "US", "Hospital-B"),
+        ]
+        panel = engine.build_quorum(candidates, LeaveCategory.ILLNESS, "APPLICANT-001")
+        assert [e.actor_id for e in panel] == ["A1", "A2", "A4"]
+        assert engine.check_adjudicator_diversity(
+            {e.actor_id: e for e in panel},
+        ) == []
+
+    def test_ineligible_candidates_excluded(self) -> None:
+        engine = LeaveAdjudicationEngine(_make_resolver())
+        candidates = [
+            self._candidate("APPLICANT-001", 0.95, "EU", "Hospital-A"),
+            self._candidate("A1", 0.90, "EU", "Hospital-A"),
+            self._candidate("A2", 0.85, "US", "Hospital-B"),
+            self._candidate("A3", 0.80, "APAC", "Clinic-C"),
+        ]
+        panel = engine.build_quorum(candidates, LeaveCategory.ILLNESS, "APPLICANT-001")
+        assert [e.actor_id for e in panel] == ["A1", "A2", "A3"]
+
+    def test_infeasible_pool_returns_empty(self) -> None:
+        engine = LeaveAdjudicationEngine(_make_resolver())
+        candidates = [
+            self._candidate(f"A{i}", 0.90, "EU", f"Org-{i}") for i in range(5)
+        ]
+        assert engine.build_quorum(
+            candidates, LeaveCategory.ILLNESS, "APPLICANT-001",
+        ) == []
+
+    def test_size_above_max_adjudicators_rejected(self) -> None:
+        engine = LeaveAdjudicationEngine(_make_resolver())
+        with pytest.raises(ValueError):
+            engine.build_quorum([], LeaveCategory.ILLNESS, "APPLICANT-001", size=50)
+
+
+# ===================================================================
+# Config memoization
+# ===================================================================
+
+class TestConfigMemoization:
+    def test_config_fetched_once_across_fan_out(self) -> None:
+        resolver = _make_resolver()
+        calls: list[str] = []
+        original = resolver.leave_adjudication_config
+
+        def counting() -> dict:
+            calls.append("adjudication")
+            return original()
+
+        resolver.leave_adjudication_config = counting  # type: ignore[method-assign]
+        engine = LeaveAdjudicationEngine(resolver)
+        trust = _make_trust_record(
+            domain_scores={"healthcare": _make_domain_trust("healthcare", 0.50)},
+        )
+        for i in range(5):
+            engine.check_adjudicator_eligibility(
+                _make_roster_entry(f"ADJ-{i}"), trust,
+                LeaveCategory.ILLNESS, "APPLICANT-001",
+            )
+        assert calls == ["adjudication"]
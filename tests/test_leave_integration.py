@@ -804,6 +804,29 @@ class TestPersistenceRoundTrip:
         entry = service2._roster.get(actors["applicant"])
         assert entry.status == ActorStatus.ON_LEAVE
 
+    def test_returned_record_sealed_after_round_trip(self, tmp_path: Path) -> None:
+        store_path = tmp_path / "genesis_state.json"
+        service1 = _make_service(
+            event_log=EventLog(tmp_path / "events.jsonl"),
+            state_store=StateStore(store_path),
+        )
+        actors = _setup_leave_scenario(service1)
+        leave_id = service1.request_leave(
+            actors["applicant"], LeaveCategory.ILLNESS,
+        ).data["leave_id"]
+        for doc_key in ["doc1", "doc2", "doc3"]:
+            service1.adjudicate_leave(
+                leave_id, actors[doc_key], AdjudicationVerdict.APPROVE,
+            )
+        assert service1.return_from_leave(leave_id).success is True
+        assert service1.get_leave_record(leave_id).sealed is True
+
+        service2 = _make_service(state_store=StateStore(store_path))
+        record = service2.get_leave_record(leave_id)
+        assert record.state == LeaveState.RETURNED
+        assert record.sealed is True
+        assert record.approve_count() == 3
+
     def test_leave_records_empty_on_fresh_start(self, tmp_path: Path) -> None:
         store_path = tmp_path / "genesis_state.json"
         store = StateStore(store_path)
@@ -5,6 +5,7 @@ LeaveAdjudication, LeaveRecord, and the CATEGORY_REQUIRED_DOMAINS mapping.
 """
 
 import pytest
+from dataclasses import FrozenInstanceError
 from datetime import datetime, timezone
 
 from genesis.models.leave import (
@@ -100,6 +101,11 @@ class TestCategoryRequiredDomains:
     def test_child_care_requires_social_services(self) -> None:
         assert "social_services" in CATEGORY_REQUIRED_DOMAINS["child_care"]
 
+    def test_mapping_is_read_only(self) -> None:
+        assert isinstance(CATEGORY_REQUIRED_DOMAINS["illness"], tuple)
+        with pytest.raises(TypeError):
+            CATEGORY_REQUIRED_DOMAINS["illness"] = ("law",)  # type: ignore[index]
+
 
 # ===================================================================
 # LeaveState
@@ -115,6 +121,14 @@ class TestLeaveState:
         record = LeaveRecord(leave_id="L1", actor_id="A1", category=LeaveCategory.ILLNESS)
         assert record.state == LeaveState.PENDING
 
+    def test_value_round_trips(self) -> None:
+        for state in LeaveState:
+            assert LeaveState(state.value) is state
+
+    def test_not_string_comparable(self) -> None:
+        assert not isinstance(LeaveState.ACTIVE, str)
+        assert LeaveState.ACTIVE != "active"
+
 
 # ===================================================================
 # AdjudicationVerdict
@@ -126,6 +140,14 @@ class TestAdjudicationVerdict:
         actual = {v.value for v in AdjudicationVerdict}
         assert actual == expected
 
+    def test_indices_are_dense(self) -> None:
+        assert sorted(v.idx for v in AdjudicationVerdict) == [0, 1, 2]
+
+    def test_from_string_keeps_index(self) -> None:
+        verdict = AdjudicationVerdict("deny")
+        assert verdict is AdjudicationVerdict.DENY
+        assert verdict.idx == AdjudicationVerdict.DENY.idx
+
 
 # ===================================================================
 # LeaveAdjudication
@@ -275,3 +297,41 @@ class TestLeaveRecord:
         assert record.approve_count() == 2
         assert record.deny_count() == 1
         assert record.abstain_count() == 1
+
+    def test_tally_single_pass_matches_counters(self) -> None:
+        record = self._make_record()
+        record.adjudications = [
+            LeaveAdjudication("A1", AdjudicationVerdict.APPROVE, "healthcare", 0.5),
+            LeaveAdjudication("A2", AdjudicationVerdict.DENY, "healthcare", 0.6),
+            LeaveAdjudication("A3", AdjudicationVerdict.ABSTAIN, "healthcare", 0.7),
+            LeaveAdjudication("A4", AdjudicationVerdict.APPROVE, "healthcare", 0.8),
+        ]
+        assert record._tally() == (2, 1, 1)
+
+    def test_record_uses_slots(self) -> None:
+        record = self._make_record()
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            record.unexpected_field = 1  # type: ignore[attr-defined]
+
+    def test_seal_terminal_record(self) -> None:
+        record = self._make_record(state=LeaveState.RETURNED)
+        record.adjudications = [
+            LeaveAdjudication("A1", AdjudicationVerdict.APPROVE, "healthcare", 0.5),
+        ]
+        record.seal()
+        assert record.sealed is True
+        assert isinstance(record.adjudications, tuple)
+        assert record.approve_count() == 1
+        with pytest.raises(FrozenInstanceError):
+            record.state = LeaveState.ACTIVE
+        with pytest.raises(AttributeError):
+            record.adjudications.append(  # type: ignore[attr-defined]
+                LeaveAdjudication("A2", AdjudicationVerdict.DENY, "healthcare", 0.5),
+            )
+
+    def test_seal_rejects_live_record(self) -> None:
+        record = self._make_record(state=LeaveState.ACTIVE)
+        with pytest.raises(ValueError):
+            record.seal()
+        record.state = LeaveState.RETURNED  # still mutable
@@ -3,10 +3,13 @@
 Tests PolicyResolver leave methods, config loading, and defaults.
 """
 
+import json
 import pytest
+from datetime import timedelta
 from pathlib import Path
 
-from genesis.policy.resolver import PolicyResolver
+from genesis.models.leave import LeaveCategory
+from genesis.policy.resolver import LeaveAdjudicationPolicy, PolicyResolver
 
 
 # ===================================================================
@@ -131,3 +134,65 @@ class TestLeavePolicyWithoutConfig:
         assert config["default_max_days"] is None
         assert config["category_overrides"]["pregnancy"] == 365
         assert config["category_overrides"]["child_care"] == 365
+
+    def test_defaults_not_changed_through_copies(self) -> None:
+        first = PolicyResolver(params={"version": "1.0"}, policy={"version": "1.0"})
+        second = PolicyResolver(params={"version": "1.0"}, policy={"version": "1.0"})
+        config = first.leave_duration_config()
+        pregnancy = config["category_overrides"]["pregnancy"]
+        config["category_overrides"]["pregnancy"] = 0
+        overrides = second.leave_duration_config()["category_overrides"]
+        assert overrides["pregnancy"] == pregnancy
+        json.dumps(first.leave_adjudication_config())
+
+
+# ===================================================================
+# Compiled leave adjudication policy
+# ===================================================================
+
+class TestCompiledLeavePolicy:
+    @classmethod
+    def setup_class(cls) -> None:
+        config_dir = Path(__file__).parent.parent / "config"
+        cls.resolver = PolicyResolver.from_config_dir(config_dir)
+
+    def test_thresholds_match_config(self) -> None:
+        policy = self.resolver.leave_adjudication_policy()
+        assert isinstance(policy, LeaveAdjudicationPolicy)
+        assert policy.min_quorum == 3
+        assert policy.min_approve_to_grant == 2
+        assert policy.min_adjudicator_trust == 0.40
+        assert policy.min_domain_trust == 0.30
+        assert policy.max_adjudicators == 5
+        assert policy.min_organizations == 2
+        assert policy.min_regions == 2
+        assert policy.cooldown_days_between_leaves == 30
+        assert policy.max_leaves_per_year == 4
+
+    def test_required_domains_are_tuples(self) -> None:
+        policy = self.resolver.leave_adjudication_policy()
+        assert policy.required_domains[LeaveCategory.BEREAVEMENT] == (
+            "social_services", "mental_health",
+        )
+        assert len(policy.required_domains) == len(LeaveCategory)
+        with pytest.raises(TypeError):
+            policy.required_domains[LeaveCategory.ILLNESS] = ()  # type: ignore[index]
+
+    def test_compiled_once(self) -> None:
+        assert (
+            self.resolver.leave_adjudication_policy()
+            is self.resolver.leave_adjudication_policy()
+        )
+
+    def test_defaults_without_leave_config(self) -> None:
+        resolver = PolicyResolver(params={"version": "1.0"}, policy={"version": "1.0"})
+        policy = resolver.leave_adjudication_policy()
+        assert policy.min_quorum == 3
+        assert policy.default_max_days is None
+        assert policy.category_overrides["pregnancy"] == 365
+        assert policy.max_days_by_category[LeaveCategory.PREGNANCY] == 365
+        assert policy.expires_delta_by_category[LeaveCategory.PREGNANCY] == (
+            timedelta(days=365)
+        )
+        assert policy.expires_delta_by_category[LeaveCategory.ILLNESS] is None
+        assert policy.required_domains[LeaveCategory.ILLNESS] == ("healthcare",)
@@ -1,9 +1,12 @@
 """Tests for persistence layer — proves event log and state store work correctly."""
 
+import hashlib
+import json
 import pytest
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import BinaryIO
 
 from genesis.models.mission import (
     DomainType,
@@ -16,11 +19,14 @@ from genesis.models.mission import (
     Reviewer,
     RiskTier,
 )
+from genesis.models.leave import LeaveCategory, LeaveRecord, LeaveState
+from genesis.models.quality import ReviewerQualityAssessment
 from genesis.models.trust import ActorKind, TrustRecord
 from genesis.persistence.event_log import EventLog, EventKind, EventRecord
 from genesis.persistence.state_store import StateStore
 from genesis.review.roster import ActorRoster, ActorStatus, RosterEntry
 from genesis.crypto.epoch_service import GENESIS_PREVIOUS_HASH
+from genesis.crypto.merkle import MerkleTree
 
 
 # =====================================================================
@@ -51,6 +57,73 @@ class TestEventRecord:
         e2 = EventRecord.create("E-1", EventKind.TRUST_UPDATED, "bob", {"score": 0.9}, ts)
         assert e1.event_hash != e2.event_hash
 
+    def test_default_timestamp_is_current_utc(self) -> None:
+        fmt = "%Y-%m-%dT%H:%M:%SZ"
+        before = datetime.now(timezone.utc).strftime(fmt)
+        event = EventRecord.create("E-1", EventKind.MISSION_CREATED, "alice", {})
+        after = datetime.now(timezone.utc).strftime(fmt)
+        assert before <= event.timestamp_utc <= after
+
+    def test_uses_slots(self) -> None:
+        event = EventRecord.create("E-1", EventKind.MISSION_CREATED, "alice", {})
+        assert not hasattr(event, "__dict__")
+
+    def test_payload_is_read_only(self) -> None:
+        payload = {"mission_id": "M-1"}
+        event = EventRecord.create("E-1", EventKind.MISSION_CREATED, "alice", payload)
+        with pytest.raises(TypeError):
+            event.payload["mission_id"] = "M-2"
+        with pytest.raises(TypeError):
+            event.payload.update(extra=1)
+        payload["late"] = True
+        assert event.payload == {"mission_id": "M-1"}
+        assert json.loads(json.dumps(event.payload)) == {"mission_id": "M-1"}
+
+    def test_event_survives_copy_and_pickle(self) -> None:
+        import copy
+        import pickle
+
+        event = EventRecord.create(
+            "E-1", EventKind.MISSION_CREATED, "alice", {"mission_id": "M-1", "tags": ["a"]},
+        )
+        assert copy.copy(event.payload) == event.payload
+        for clone in (copy.deepcopy(event), pickle.loads(pickle.dumps(event))):
+            assert clone == event
+            assert clone.event_hash == event.event_hash
+            with pytest.raises(TypeError):
+                clone.payload["mission_id"] = "M-2"
+
+    def test_canonical_form_is_pinned(self) -> None:
+        """Hash covers sorted-key, raw-UTF-8 JSON with default separators."""
+        ts = datetime(2026, 2, 14, 12, 0, tzinfo=timezone.utc)
+        payload = {"name": "Zoë", "b": [1, 2.5], "a": None}
+        event = EventRecord.create("E-1", EventKind.ACTOR_REGISTERED, "bob", payload, ts)
+        canonical = json.dumps(
+            {
+                "event_id": "E-1",
+                "event_kind": "actor_registered",
+                "timestamp_utc": "2026-02-14T12:00:00Z",
+                "actor_id": "bob",
+                "payload": payload,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        ).encode("utf-8")
+        assert event.event_hash == f"sha256:{hashlib.sha256(canonical).hexdigest()}"
+
+    def test_canonical_envelope_matches_sorted_dict(self) -> None:
+        """Fields needing escapes and nested payloads encode identically."""
+        from genesis.persistence.event_log import _canonical_bytes
+
+        fields = ('E-"1"\n', "mission_created", "2026-02-14T12:00:00Z", "a\u00e9\t",
+                  {"z": {"y": 1, "x": [True]}, "a": "\u2028"})
+        expected = json.dumps(
+            dict(zip(("event_id", "event_kind", "timestamp_utc", "actor_id", "payload"), fields)),
+            sort_keys=True,
+            ensure_ascii=False,
+        ).encode("utf-8")
+        assert _canonical_bytes(*fields) == expected
+
 
 # =====================================================================
 # EventLog Tests
@@ -90,6 +163,52 @@ class TestEventLog:
         hashes = log.event_hashes()
         assert len(hashes) == 2
         assert all(h.startswith("sha256:") for h in hashes)
+        assert hashes == [e.event_hash for e in log.events()]
+        hashes.clear()
+        assert len(log.event_hashes()) == 2
+
+    def test_kind_queries_use_log_order(self) -> None:
+        log = EventLog()
+        log.extend([
+            EventRecord.create("E-1", EventKind.MISSION_CREATED, "alice", {}),
+            EventRecord.create("E-2", EventKind.TRUST_UPDATED, "bob", {}),
+            EventRecord.create("E-3", EventKind.MISSION_CREATED, "charlie", {}),
+        ])
+        missions = log.events(kind=EventKind.MISSION_CREATED)
+        assert [e.event_id for e in missions] == ["E-1", "E-3"]
+        assert log.event_hashes(EventKind.MISSION_CREATED) == [
+            e.event_hash for e in missions
+        ]
+        assert log.events(kind=EventKind.EPOCH_CLOSED) == []
+        missions.clear()  # callers get copies
+        assert len(log.events(kind=EventKind.MISSION_CREATED)) == 2
+
+    def test_sealed_epoch_hashes_and_root(self, tmp_path: Path) -> None:
+        log_path = tmp_path / "events.jsonl"
+        with EventLog(storage_path=log_path) as log:
+            log.extend([
+                EventRecord.create("E-1", EventKind.MISSION_CREATED, "alice", {}),
+                EventRecord.create("C-1", EventKind.EPOCH_CLOSED, "system", {}),
+                EventRecord.create("E-2", EventKind.TRUST_UPDATED, "bob", {}),
+                EventRecord.create("E-3", EventKind.TRUST_UPDATED, "bob", {}),
+                EventRecord.create("C-2", EventKind.EPOCH_CLOSED, "system", {}),
+                EventRecord.create("E-4", EventKind.MISSION_CREATED, "carol", {}),
+            ])
+        hashes = log.event_hashes()
+        assert log.sealed_epoch_count == 2
+        assert log.sealed_epoch_hashes(0) == tuple(hashes[0:2])
+        assert log.sealed_epoch_hashes(1) == tuple(hashes[2:5])
+
+        tree = MerkleTree()
+        for h in hashes[2:5]:
+            tree.add_leaf(h)
+        assert log.sealed_epoch_root(1) == tree.compute_root()
+        assert log.sealed_epoch_root(1) is log.sealed_epoch_root(1)
+
+        reloaded = EventLog(storage_path=log_path)
+        assert reloaded.sealed_epoch_root(1) == log.sealed_epoch_root(1)
+        with pytest.raises(IndexError):
+            reloaded.sealed_epoch_hashes(2)
 
     def test_last_event(self) -> None:
         log = EventLog()
@@ -112,6 +231,307 @@ class TestEventLog:
         assert log2.events()[0].event_id == "E-1"
         assert log2.events()[1].event_id == "E-2"
 
+    def test_append_visible_before_close(self, tmp_path: Path) -> None:
+        """The persistent handle writes through on every append."""
+        log_path = tmp_path / "events.jsonl"
+        with EventLog(storage_path=log_path) as log:
+            log.append(EventRecord.create("E-1", EventKind.MISSION_CREATED, "alice", {}))
+            assert EventLog(storage_path=log_path).count == 1
+            log.close()
+            log.append(EventRecord.create("E-2", EventKind.MISSION_CREATED, "alice", {}))
+            log.flush(fsync=True)
+        assert EventLog(storage_path=log_path).count == 2
+
+    def test_write_buffer_defers_until_flush(self, tmp_path: Path) -> None:
+        log_path = tmp_path / "events.jsonl"
+        log = EventLog(storage_path=log_path, write_buffer_bytes=1 << 16)
+        for i in range(3):
+            log.append(EventRecord.create(f"E-{i}", EventKind.MISSION_CREATED, "alice", {}))
+        assert not log_path.exists() or log_path.read_bytes() == b""
+        log.flush()
+        assert EventLog(storage_path=log_path).count == 3
+        log.close()
+
+    def test_failed_write_is_retried_without_torn_lines(self, tmp_path: Path) -> None:
+        """A write that fails partway leaves the file as it was."""
+        import errno
+
+        log_path = tmp_path / "events.jsonl"
+        log = EventLog(storage_path=log_path, write_buffer_bytes=1 << 16)
+        log.append(EventRecord.create("E-0", EventKind.MISSION_CREATED, "alice", {}))
+        log.flush()
+        real = log._fh
+
+        class DiskFull:
+            """Accepts half of the first write, then reports a full disk."""
+            full = False
+
+            def write(self, data: memoryview) -> int:
+                if self.full:
+                    raise OSError(errno.ENOSPC, "No space left on device")
+                self.full = True
+                return real.write(data[:len(data) // 2])
+
+            def truncate(self, size: int) -> int:
+                return real.truncate(size)
+
+            def fileno(self) -> int:
+                return real.fileno()
+
+        for i in (1, 2):
+            log.append(EventRecord.create(f"E-{i}", EventKind.MISSION_CREATED, "alice", {}))
+        log._fh = DiskFull()
+        with pytest.raises(OSError):
+            log.flush()
+        assert EventLog(storage_path=log_path).count == 1
+
+        log._fh = real
+        log.flush()
+        reloaded = EventLog(storage_path=log_path)
+        assert [e.event_id for e in reloaded.events()] == ["E-0", "E-1", "E-2"]
+        log.close()
+
+    def test_failed_write_keeps_other_writers_lines(self, tmp_path: Path) -> None:
+        """A partial write is only cut back if nothing was appended after it."""
+        import errno
+
+        log_path = tmp_path / "events.jsonl"
+        log = EventLog(storage_path=log_path)
+        log.append(EventRecord.create("E-0", EventKind.MISSION_CREATED, "alice", {}))
+        real = log._fh
+        other_line = b'{"other": "writer"}\n'
+
+        class DiskFullThenOtherWriter:
+            """A short write, another writer's append, then a full disk."""
+            full = False
+
+            def write(self, data: memoryview) -> int:
+                if self.full:
+                    with log_path.open("ab") as other:
+                        other.write(other_line)
+                    raise OSError(errno.ENOSPC, "No space left on device")
+                self.full = True
+                return real.write(data[:len(data) // 2])
+
+            def truncate(self, size: int) -> int:
+                return real.truncate(size)
+
+            def fileno(self) -> int:
+                return real.fileno()
+
+        log._fh = DiskFullThenOtherWriter()
+        with pytest.raises(OSError):
+            log.append(EventRecord.create("E-1", EventKind.MISSION_CREATED, "alice", {}))
+        assert log_path.read_bytes().endswith(other_line)
+        real.close()
+
+    def test_write_buffer_threshold_triggers_write(self, tmp_path: Path) -> None:
+        log_path = tmp_path / "events.jsonl"
+        with EventLog(storage_path=log_path, write_buffer_bytes=1) as log:
+            log.append(EventRecord.create("E-1", EventKind.MISSION_CREATED, "alice", {}))
+            assert EventLog(storage_path=log_path).count == 1
+
+    def test_persisted_line_matches_full_encoding(self, tmp_path: Path) -> None:
+        """Lines spliced from cached canonical bytes equal a fresh encode."""
+        log_path = tmp_path / "events.jsonl"
+        log = EventLog(storage_path=log_path)
+        events = [
+            EventRecord.create("E-1", EventKind.MISSION_CREATED, 'Zoë "z"', {"k": "ü"}),
+            EventRecord.create("E-2", EventKind.TRUST_UPDATED, "", {"n": [1, 2.5]}),
+        ]
+        log.extend(events)
+        lines = log_path.read_text(encoding="utf-8").splitlines()
+        for line, event in zip(lines, events):
+            assert line == json.dumps({
+                "event_id": event.event_id,
+                "event_kind": event.event_kind.value,
+                "timestamp_utc": event.timestamp_utc,
+                "actor_id": event.actor_id,
+                "payload": event.payload,
+                "event_hash": event.event_hash,
+            }, sort_keys=True, ensure_ascii=False)
+
+    def test_extend_persists_batch(self, tmp_path: Path) -> None:
+        log_path = tmp_path / "events.jsonl"
+        log = EventLog(storage_path=log_path)
+        log.extend(
+            EventRecord.create(f"E-{i}", EventKind.MISSION_CREATED, "alice", {"i": i})
+            for i in range(3)
+        )
+        assert log.count == 3
+        reloaded = EventLog(storage_path=log_path)
+        assert [e.event_id for e in reloaded.events()] == ["E-0", "E-1", "E-2"]
+
+    def test_extend_is_all_or_nothing(self) -> None:
+        log = EventLog()
+        log.append(EventRecord.create("E-1", EventKind.MISSION_CREATED, "alice", {}))
+        batch = [
+            EventRecord.create("E-2", EventKind.MISSION_CREATED, "alice", {}),
+            EventRecord.create("E-2", EventKind.MISSION_CREATED, "alice", {}),
+        ]
+        with pytest.raises(ValueError, match="Duplicate event ID"):
+            log.extend(batch)
+        with pytest.raises(ValueError, match="Duplicate event ID"):
+            log.extend([EventRecord.create("E-1", EventKind.MISSION_CREATED, "bob", {})])
+        assert log.count == 1
+
+    def test_load_handles_crlf_and_blank_lines(self, tmp_path: Path) -> None:
+        log_path = tmp_path / "events.jsonl"
+        with EventLog(storage_path=log_path) as log:
+            log.append(EventRecord.create("E-1", EventKind.MISSION_CREATED, "Zoë", {"k": "ü"}))
+            log.append(EventRecord.create("E-2", EventKind.MISSION_CREATED, "bob", {}))
+        raw = log_path.read_bytes().replace(b"\n", b"\r\n\n")
+        log_path.write_bytes(raw)
+        reloaded = EventLog(storage_path=log_path)
+        assert [e.actor_id for e in reloaded.events()] == ["Zoë", "bob"]
+
+    def test_load_verifies_own_lines_without_reserializing(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        from genesis.persistence import event_log as event_log_module
+
+        log_path = tmp_path / "events.jsonl"
+        with EventLog(storage_path=log_path) as log:
+            log.append(EventRecord.create("E-1", EventKind.MISSION_CREATED, "alice", {"x": [1]}))
+
+        def fail(*fields: object) -> bytes:
+            raise AssertionError("canonical form re-serialized on load")
+
+        monkeypatch.setattr(event_log_module, "_canonical_bytes", fail)
+        assert EventLog(storage_path=log_path).count == 1
+
+    def test_load_accepts_reformatted_lines(self, tmp_path: Path) -> None:
+        """A valid record in a different JSON layout still verifies."""
+        log_path = tmp_path / "events.jsonl"
+        event = EventRecord.create("E-1", EventKind.MISSION_CREATED, "alice", {"x": 1})
+        log_path.write_text(json.dumps({
+            "payload": event.payload,
+            "event_hash": event.event_hash,
+            "event_id": event.event_id,
+            "timestamp_utc": event.timestamp_utc,
+            "event_kind": event.event_kind.value,
+            "actor_id": event.actor_id,
+        }, indent=None, separators=(",", ":")) + "\n")
+        assert EventLog(storage_path=log_path).events()[0].event_hash == event.event_hash
+
+    def test_parallel_recovery_matches_serial(self, tmp_path: Path) -> None:
+        log_path = tmp_path / "events.jsonl"
+        with EventLog(storage_path=log_path) as log:
+            log.extend(
+                EventRecord.create(f"E-{i}", EventKind.TRUST_UPDATED, "alice", {"i": i})
+                for i in range(25)
+            )
+        parallel = EventLog(storage_path=log_path, recovery_workers=4)
+        assert parallel.event_hashes() == log.event_hashes()
+
+        lines = log_path.read_text().splitlines()
+        tampered = json.loads(lines[17])
+        tampered["payload"] = {"i": -1}
+        lines[17] = json.dumps(tampered)
+        log_path.write_text("\n".join(lines) + "\n")
+        with pytest.raises(ValueError, match=r"line 18"):
+            EventLog(storage_path=log_path, recovery_workers=4)
+
+    def _count_rehashed(self, monkeypatch: pytest.MonkeyPatch) -> list[int]:
+        from genesis.persistence import event_log as event_log_module
+
+        counts: list[int] = []
+        real = event_log_module._event_hashes
+
+        def counting(messages: list[bytes], workers: int = 1) -> list[str]:
+            counts.append(len(messages))
+            return real(messages, workers)
+
+        monkeypatch.setattr(event_log_module, "_event_hashes", counting)
+        return counts
+
+    _KEY = b"checkpoint-test-key"
+
+    def test_sealed_epochs_not_rehashed_on_load(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        log_path = tmp_path / "events.jsonl"
+        with EventLog(
+            storage_path=log_path, write_buffer_bytes=1 << 20, checkpoint_key=self._KEY,
+        ) as log:
+            log.extend([
+                EventRecord.create("E-1", EventKind.MISSION_CREATED, "alice", {"x": 1}),
+                EventRecord.create("E-2", EventKind.EPOCH_CLOSED, "system", {}),
+                EventRecord.create("E-3", EventKind.MISSION_CREATED, "alice", {"x": 3}),
+            ])
+        assert (tmp_path / "events.root.jsonl").exists()
+
+        counts = self._count_rehashed(monkeypatch)
+        recovered = EventLog(storage_path=log_path, checkpoint_key=self._KEY)
+        assert counts == [1]  # only E-3, after the sealed epoch
+        assert recovered.event_hashes() == log.event_hashes()
+
+    def test_checkpoint_chain_extends_across_restarts(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        log_path = tmp_path / "events.jsonl"
+        with EventLog(storage_path=log_path, checkpoint_key=self._KEY) as log:
+            log.append(EventRecord.create("E-1", EventKind.MISSION_CREATED, "alice", {}))
+        with EventLog(storage_path=log_path, checkpoint_key=self._KEY) as log:
+            log.append(EventRecord.create("E-2", EventKind.EPOCH_CLOSED, "system", {}))
+
+        counts = self._count_rehashed(monkeypatch)
+        assert EventLog(storage_path=log_path, checkpoint_key=self._KEY).count == 2
+        assert counts == [0]
+
+    def test_tampered_sealed_epoch_rejected_on_load(self, tmp_path: Path) -> None:
+        """Editing a checkpointed line falls back to per-event verification."""
+        log_path = tmp_path / "events.jsonl"
+        with EventLog(storage_path=log_path, checkpoint_key=self._KEY) as log:
+            log.append(EventRecord.create("E-1", EventKind.MISSION_CREATED, "alice", {"x": 1}))
+            log.append(EventRecord.create("E-2", EventKind.EPOCH_CLOSED, "system", {}))
+        log_path.write_bytes(log_path.read_bytes().replace(b'{"x": 1}', b'{"x": 2}'))
+        with pytest.raises(ValueError, match=r"line 1"):
+            EventLog(storage_path=log_path, checkpoint_key=self._KEY)
+
+    def test_forged_checkpoint_rejected_on_load(self, tmp_path: Path) -> None:
+        """Rewriting the sidecar without the key cannot vouch for edits."""
+        log_path = tmp_path / "events.jsonl"
+        sidecar = tmp_path / "events.root.jsonl"
+        with EventLog(storage_path=log_path, checkpoint_key=self._KEY) as log:
+            log.append(EventRecord.create("E-1", EventKind.MISSION_CREATED, "alice", {"x": 1}))
+            log.append(EventRecord.create("E-2", EventKind.EPOCH_CLOSED, "system", {}))
+        data = log_path.read_bytes().replace(b'{"x": 1}', b'{"x": 2}')
+        log_path.write_bytes(data)
+        forged = {
+            "start": 0, "end": len(data),
+            "digest": "sha256:" + hashlib.sha256(data).hexdigest(),
+        }
+        sidecar.write_text(json.dumps(forged) + "\n")
+        for key in (self._KEY, None):
+            with pytest.raises(ValueError, match=r"line 1"):
+                EventLog(storage_path=log_path, checkpoint_key=key)
+
+    def test_no_checkpoints_without_key(self, tmp_path: Path) -> None:
+        log_path = tmp_path / "events.jsonl"
+        with EventLog(storage_path=log_path) as log:
+            log.append(EventRecord.create("E-1", EventKind.EPOCH_CLOSED, "system", {}))
+        assert not (tmp_path / "events.root.jsonl").exists()
+
+    def test_checkpoint_write_failure_keeps_event(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        log_path = tmp_path / "events.jsonl"
+        log = EventLog(storage_path=log_path, checkpoint_key=self._KEY)
+        (tmp_path / "events.root.jsonl").mkdir()  # sidecar cannot be opened
+        log.append(EventRecord.create("E-1", EventKind.EPOCH_CLOSED, "system", {}))
+        log.close()
+        assert log.count == 1
+        assert EventLog(storage_path=log_path, checkpoint_key=self._KEY).count == 1
+
+    def test_recovered_actor_ids_shared(self, tmp_path: Path) -> None:
+        log_path = tmp_path / "events.jsonl"
+        with EventLog(storage_path=log_path) as log:
+            for i in range(2):
+                log.append(EventRecord.create(f"E-{i}", EventKind.MISSION_CREATED, "alice", {}))
+        first, second = EventLog(storage_path=log_path).events()
+        assert first.actor_id is second.actor_id
+
     def test_tampered_hash_rejected_on_load(self, tmp_path: Path) -> None:
         """Tampered event_hash in JSONL file must be rejected on recovery."""
         import json
@@ -131,6 +551,19 @@ class TestEventLog:
         with pytest.raises(ValueError, match="Integrity check failed"):
             EventLog(storage_path=log_path)
 
+    def test_recased_hash_rejected_on_load(self, tmp_path: Path) -> None:
+        """The stored hash string is a Merkle leaf: re-cased hex must fail."""
+        log_path = tmp_path / "recased.jsonl"
+        log1 = EventLog(storage_path=log_path)
+        log1.append(EventRecord.create("E-1", EventKind.MISSION_CREATED, "alice", {"x": 1}))
+
+        record = json.loads(log_path.read_text())
+        record["event_hash"] = "sha256:" + record["event_hash"][7:].upper()
+        log_path.write_text(json.dumps(record) + "\n")
+
+        with pytest.raises(ValueError, match="Integrity check failed"):
+            EventLog(storage_path=log_path)
+
     def test_duplicate_id_rejected_on_load(self, tmp_path: Path) -> None:
         """Duplicate event IDs in JSONL file must be rejected on recovery."""
         import json
@@ -151,6 +584,23 @@ class TestEventLog:
         with pytest.raises(ValueError, match="Duplicate event ID"):
             EventLog(storage_path=log_path)
 
+    def test_first_bad_line_reported_on_load(self, tmp_path: Path) -> None:
+        """Batched verification still fails on the earliest bad line."""
+        log_path = tmp_path / "multi.jsonl"
+        log1 = EventLog(storage_path=log_path)
+        for i in range(1, 4):
+            log1.append(EventRecord.create(f"E-{i}", EventKind.MISSION_CREATED, "alice", {"i": i}))
+
+        lines = log_path.read_text().strip().split("\n")
+        tampered = json.loads(lines[1])
+        tampered["payload"] = {"i": 99}
+        lines[1] = json.dumps(tampered)
+        lines[2] = lines[0]  # duplicate of line 1
+        log_path.write_text("\n".join(lines) + "\n")
+
+        with pytest.raises(ValueError, match=r"Integrity check failed \(line 2\)"):
+            EventLog(storage_path=log_path)
+
     def test_events_since(self) -> None:
         log = EventLog()
         ts1 = datetime(2026, 2, 14, 10, 0, tzinfo=timezone.utc)
@@ -164,6 +614,21 @@ class TestEventLog:
         recent = log.events_since("2026-02-14T12:00:00Z")
         assert len(recent) == 2
 
+    def test_events_since_out_of_order_timestamps(self) -> None:
+        """Explicit earlier timestamps must not hide events from the query."""
+        log = EventLog()
+        ts_late = datetime(2026, 2, 14, 14, 0, tzinfo=timezone.utc)
+        ts_early = datetime(2026, 2, 14, 10, 0, tzinfo=timezone.utc)
+        ts_mid = datetime(2026, 2, 14, 12, 0, tzinfo=timezone.utc)
+        log.append(EventRecord.create("E-1", EventKind.MISSION_CREATED, "a", {}, ts_late))
+        log.append(EventRecord.create("E-2", EventKind.MISSION_CREATED, "b", {}, ts_early))
+        log.append(EventRecord.create("E-3", EventKind.TRUST_UPDATED, "c", {}, ts_mid))
+
+        recent = log.events_since("2026-02-14T12:00:00Z")
+        assert [e.event_id for e in recent] == ["E-1", "E-3"]
+        trust = log.events_since("2026-02-14T12:00:00Z", kind=EventKind.TRUST_UPDATED)
+        assert [e.event_id for e in trust] == ["E-3"]
+
 
 # =====================================================================
 # StateStore Tests
@@ -196,6 +661,34 @@ class TestStateStoreRoster:
         assert loaded.get("alice").trust_score == 0.75
         assert loaded.get("bot1").status == ActorStatus.QUARANTINED
 
+    def test_load_row_per_actor_roster(self, tmp_path: Path) -> None:
+        """Rosters saved before the columnar layout still load."""
+        path = tmp_path / "state.json"
+        path.write_text(json.dumps({"roster": [{
+            "actor_id": "alice", "actor_kind": "human", "trust_score": 0.75,
+            "region": "EU", "organization": "Org1",
+            "model_family": "human_reviewer", "method_type": "human_reviewer",
+            "status": "active",
+        }]}))
+        loaded = StateStore(path).load_roster()
+        assert loaded.get("alice").organization == "Org1"
+        assert loaded.get("alice").status == ActorStatus.ACTIVE
+
+    def test_loaded_categorical_fields_are_shared(self, tmp_path: Path) -> None:
+        roster = ActorRoster()
+        for actor_id in ("a1", "a2"):
+            roster.register(RosterEntry(
+                actor_id=actor_id, actor_kind=ActorKind.HUMAN, trust_score=0.5,
+                region="EU", organization="Org1",
+                model_family="human_reviewer", method_type="human_reviewer",
+            ))
+        StateStore(tmp_path / "state.json").save_roster(roster)
+
+        loaded = StateStore(tmp_path / "state.json").load_roster()
+        a1, a2 = loaded.get("a1"), loaded.get("a2")
+        assert a1.organization is a2.organization
+        assert a1.model_family is a2.method_type
+
 
 class TestStateStoreTrust:
     def test_save_and_load_trust(self, tmp_path: Path) -> None:
@@ -217,6 +710,35 @@ class TestStateStoreTrust:
         assert loaded["alice"].score == 0.8
         assert loaded["alice"].effort == 0.6
 
+    def test_columns_keep_per_actor_values(self, tmp_path: Path) -> None:
+        from genesis.models.domain_trust import DomainTrustScore
+
+        path = tmp_path / "state.json"
+        bob = TrustRecord(actor_id="bob", actor_kind=ActorKind.MACHINE, score=0.2)
+        bob.quarantined = True
+        alice = TrustRecord(
+            actor_id="alice", actor_kind=ActorKind.HUMAN, score=0.8,
+            domain_scores={"medical": DomainTrustScore(domain="medical", score=0.7)},
+        )
+        StateStore(path).save_trust_records({"alice": alice, "bob": bob})
+
+        loaded = StateStore(path).load_trust_records()
+        assert loaded["alice"].domain_scores["medical"].score == 0.7
+        assert loaded["alice"].quarantined is False
+        assert loaded["bob"].domain_scores == {}
+        assert loaded["bob"].quarantined is True
+
+    def test_load_dict_per_actor_trust_records(self, tmp_path: Path) -> None:
+        """Trust records saved before the columnar layout still load."""
+        path = tmp_path / "state.json"
+        path.write_text(json.dumps({"trust_records": {"alice": {
+            "actor_id": "alice", "actor_kind": "human", "score": 0.8,
+            "quality": 0.9, "quarantined": True,
+        }}}))
+        loaded = StateStore(path).load_trust_records()
+        assert loaded["alice"].quality == 0.9
+        assert loaded["alice"].quarantined is True
+
 
 class TestStateStoreMissions:
     def test_save_and_load_missions(self, tmp_path: Path) -> None:
@@ -264,6 +786,255 @@ class TestStateStoreMissions:
         assert len(m.review_decisions) == 1
         assert len(m.evidence) == 1
         assert m.evidence[0].artifact_hash == "sha256:" + "a" * 64
+        assert m.reviewers == missions["M-001"].reviewers
+        assert m.evidence == missions["M-001"].evidence
+        assert hash(m.reviewers[0]) == hash(missions["M-001"].reviewers[0])
+
+    def test_slots_builder_refuses_post_init(self) -> None:
+        from genesis.models.skill import SkillRequirement
+        from genesis.persistence.state_store import _slots_builder
+
+        with pytest.raises(TypeError):
+            _slots_builder(SkillRequirement)
+
+
+class TestStateStoreReviewerHistories:
+    def _assessment(self, mission_id: str) -> ReviewerQualityAssessment:
+        return ReviewerQualityAssessment(
+            reviewer_id="rev_1", mission_id=mission_id,
+            alignment_score=1.0, calibration_score=0.8, derived_quality=0.9,
+            assessment_utc=datetime(2026, 3, 4, 5, 6, 7, tzinfo=timezone.utc),
+        )
+
+    def test_save_and_load_histories(self, tmp_path: Path) -> None:
+        path = tmp_path / "state.json"
+        StateStore(path).save_reviewer_histories(
+            {"rev_1": [self._assessment("M-1"), self._assessment("M-2")]},
+        )
+        loaded = StateStore(path).load_reviewer_histories()["rev_1"]
+        assert [a.mission_id for a in loaded] == ["M-1", "M-2"]
+        assert loaded[0].assessment_utc == datetime(
+            2026, 3, 4, 5, 6, 7, tzinfo=timezone.utc,
+        )
+        assert loaded[0].assessment_utc is loaded[1].assessment_utc
+
+    def test_unchanged_assessments_reuse_entries(self, tmp_path: Path) -> None:
+        store = StateStore(tmp_path / "state.json")
+        kept = self._assessment("M-1")
+        store.save_reviewer_histories({"rev_1": [kept]})
+        first = store._state["reviewer_histories"]["rev_1"][0]
+        store.save_reviewer_histories({"rev_1": [kept, self._assessment("M-2")]})
+        rows = store._state["reviewer_histories"]["rev_1"]
+        assert rows[0] is first
+        assert rows[1]["mission_id"] == "M-2"
+
+
+class TestStateStoreLeave:
+    def test_sealed_record_serialized_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        from genesis.persistence import state_store as state_store_module
+
+        store = StateStore(tmp_path / "state.json")
+        denied = LeaveRecord(
+            leave_id="LV-1", actor_id="alice", category=LeaveCategory.ILLNESS,
+            state=LeaveState.DENIED,
+            denied_utc=datetime(2026, 2, 1, tzinfo=timezone.utc),
+        )
+        denied.seal()
+        store.save_leave_records({"LV-1": denied})
+
+        formatted: list[object] = []
+        real = state_store_module._format_utc
+
+        def recording(dt: object) -> object:
+            formatted.append(dt)
+            return real(dt)
+
+        monkeypatch.setattr(state_store_module, "_format_utc", recording)
+        store.save_leave_records({"LV-1": denied})
+        assert formatted == []
+
+        loaded = StateStore(tmp_path / "state.json").load_leave_records()
+        assert loaded["LV-1"].denied_utc == denied.denied_utc
+
+    def test_save_does_not_seal_caller_records(self, tmp_path: Path) -> None:
+        store = StateStore(tmp_path / "state.json")
+        denied = LeaveRecord(
+            leave_id="LV-1", actor_id="alice", category=LeaveCategory.ILLNESS,
+            state=LeaveState.DENIED,
+            denied_utc=datetime(2026, 2, 1, tzinfo=timezone.utc),
+        )
+        store.save_leave_records({"LV-1": denied})
+        assert not denied.sealed
+        denied.reason_summary = "edited"
+        store.save_leave_records({"LV-1": denied})
+
+        loaded = StateStore(tmp_path / "state.json").load_leave_records()
+        assert loaded["LV-1"].reason_summary == "edited"
+
+    def test_loaded_sealed_record_is_not_reserialized(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        from genesis.persistence import state_store as state_store_module
+
+        StateStore(tmp_path / "state.json").save_leave_records({
+            "LV-1": LeaveRecord(
+                leave_id="LV-1", actor_id="alice",
+                category=LeaveCategory.ILLNESS, state=LeaveState.DENIED,
+                denied_utc=datetime(2026, 2, 1, tzinfo=timezone.utc),
+            ),
+        })
+        store = StateStore(tmp_path / "state.json")
+        loaded = store.load_leave_records()
+        assert loaded["LV-1"].sealed
+
+        monkeypatch.setattr(
+            state_store_module, "_format_utc",
+            lambda dt: pytest.fail("sealed entry rebuilt"),
+        )
+        store.save_leave_records(loaded)
+        assert len((tmp_path / "state.leave.jsonl").read_bytes().splitlines()) == 1
+
+    def _pending(self, leave_id: str, reason: str = "") -> LeaveRecord:
+        return LeaveRecord(
+            leave_id=leave_id, actor_id="alice",
+            category=LeaveCategory.ILLNESS, reason_summary=reason,
+        )
+
+    def test_save_appends_only_changed_records(self, tmp_path: Path) -> None:
+        log_path = tmp_path / "state.leave.jsonl"
+        store = StateStore(tmp_path / "state.json")
+        records = {"LV-1": self._pending("LV-1"), "LV-2": self._pending("LV-2")}
+        store.save_leave_records(records)
+        assert len(log_path.read_bytes().splitlines()) == 2
+
+        store.save_leave_records(records)
+        assert len(log_path.read_bytes().splitlines()) == 2
+
+        records["LV-2"].reason_summary = "updated"
+        del records["LV-1"]
+        store.save_leave_records(records)
+        assert len(log_path.read_bytes().splitlines()) == 4
+
+        loaded = StateStore(tmp_path / "state.json").load_leave_records()
+        assert list(loaded) == ["LV-2"]
+        assert loaded["LV-2"].reason_summary == "updated"
+
+    def test_log_compacts_superseded_lines(self, tmp_path: Path) -> None:
+        log_path = tmp_path / "state.leave.jsonl"
+        store = StateStore(tmp_path / "state.json")
+        record = self._pending("LV-1")
+        for i in range(200):
+            record.reason_summary = f"rev {i}"
+            store.save_leave_records({"LV-1": record})
+        assert len(log_path.read_bytes().splitlines()) < 100
+        loaded = StateStore(tmp_path / "state.json").load_leave_records()
+        assert loaded["LV-1"].reason_summary == "rev 199"
+
+    def test_torn_final_line_ignored(self, tmp_path: Path) -> None:
+        log_path = tmp_path / "state.leave.jsonl"
+        StateStore(tmp_path / "state.json").save_leave_records(
+            {"LV-1": self._pending("LV-1")},
+        )
+        with log_path.open("ab") as f:
+            f.write(b'{"leave_id": "LV-2", "act')
+        store = StateStore(tmp_path / "state.json")
+        assert list(store.load_leave_records()) == ["LV-1"]
+        store.save_leave_records({"LV-1": self._pending("LV-1", "after crash")})
+        assert StateStore(tmp_path / "state.json").load_leave_records()[
+            "LV-1"
+        ].reason_summary == "after crash"
+
+    def test_migrates_leave_records_from_state_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "state.json"
+        path.write_text(json.dumps({"leave_records": {"LV-1": {
+            "leave_id": "LV-1", "actor_id": "alice", "category": "illness",
+            "state": "pending", "reason_summary": "legacy",
+        }}}))
+
+        store = StateStore(path)
+        assert store.load_leave_records()["LV-1"].reason_summary == "legacy"
+        store.save_leave_records(store.load_leave_records())
+        assert "leave_records" not in json.loads(path.read_bytes())
+        assert StateStore(path).load_leave_records()["LV-1"].reason_summary == "legacy"
+
+    def test_failed_state_write_does_not_advance_leave_log(self, tmp_path: Path) -> None:
+        path = tmp_path / "state.json"
+        store = StateStore(path)
+        store.save_leave_records({"LV-1": self._pending("LV-1", "before")})
+        store.save_epoch_state("sha256:" + "a" * 64, 1)
+
+        (tmp_path / "state.json.tmp").mkdir()  # the state write fails
+        with pytest.raises(OSError):
+            with store.save_batch():
+                store.save_leave_records({"LV-1": self._pending("LV-1", "after")})
+                store.save_epoch_state("sha256:" + "b" * 64, 2)
+
+        reloaded = StateStore(path)
+        assert reloaded.load_leave_records()["LV-1"].reason_summary == "before"
+        assert reloaded.load_epoch_state() == ("sha256:" + "a" * 64, 1)
+
+    def test_short_leave_log_append_is_rewritten(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        import errno
+
+        path = tmp_path / "state.json"
+        log_path = tmp_path / "state.leave.jsonl"
+        store = StateStore(path)
+        store.save_leave_records({"LV-1": self._pending("LV-1", "first")})
+
+        real_open = Path.open
+
+        class ShortWrite:
+            def __init__(self, f: BinaryIO) -> None:
+                self._f = f
+
+            def __enter__(self) -> "ShortWrite":
+                return self
+
+            def __exit__(self, *exc_info: object) -> None:
+                self._f.close()
+
+            def write(self, data: bytes) -> int:
+                self._f.write(data[:len(data) // 2])
+                raise OSError(errno.ENOSPC, "No space left on device")
+
+        def failing_open(self: Path, mode: str = "r", *args: object, **kwargs: object) -> object:
+            f = real_open(self, mode, *args, **kwargs)
+            return ShortWrite(f) if self == log_path and mode == "ab" else f
+
+        monkeypatch.setattr(Path, "open", failing_open)
+        records = {
+            "LV-1": self._pending("LV-1", "second"),
+            "LV-2": self._pending("LV-2", "new"),
+        }
+        with pytest.raises(OSError):
+            store.save_leave_records(records)
+        monkeypatch.undo()
+
+        records["LV-3"] = self._pending("LV-3", "later")
+        store.save_leave_records(records)
+        loaded = StateStore(path).load_leave_records()
+        assert {k: r.reason_summary for k, r in loaded.items()} == {
+            "LV-1": "second", "LV-2": "new", "LV-3": "later",
+        }
+
+    def test_legacy_records_kept_until_leave_log_written(self, tmp_path: Path) -> None:
+        path = tmp_path / "state.json"
+        path.write_text(json.dumps({"leave_records": {"LV-1": {
+            "leave_id": "LV-1", "actor_id": "alice", "category": "illness",
+            "state": "pending", "reason_summary": "legacy",
+        }}}))
+        store = StateStore(path)
+        log_path = tmp_path / "state.leave.jsonl"
+        log_path.mkdir()  # the leave log write fails
+        with pytest.raises(OSError):
+            store.save_leave_records(store.load_leave_records())
+        assert "leave_records" in json.loads(path.read_bytes())
+        log_path.rmdir()
+        assert StateStore(path).load_leave_records()["LV-1"].reason_summary == "legacy"
 
 
 class TestStateStoreEpoch:
@@ -276,6 +1047,15 @@ class TestStateStoreEpoch:
         assert prev_hash == "sha256:" + "f" * 64
         assert count == 42
 
+    def test_loads_indented_state_file(self, tmp_path: Path) -> None:
+        """State files written with indent=2 still load."""
+        path = tmp_path / "state.json"
+        path.write_text(json.dumps(
+            {"epoch": {"previous_hash": "sha256:" + "e" * 64, "committed_count": 7}},
+            indent=2,
+        ))
+        assert StateStore(path).load_epoch_state() == ("sha256:" + "e" * 64, 7)
+
     def test_default_epoch_state(self, tmp_path: Path) -> None:
         store = StateStore(tmp_path / "empty_state.json")
         prev_hash, count = store.load_epoch_state()
@@ -283,6 +1063,329 @@ class TestStateStoreEpoch:
         assert count == 0
 
 
+class TestStateStoreBatch:
+    def test_batch_writes_once_on_exit(self, tmp_path: Path) -> None:
+        path = tmp_path / "state.json"
+        store = StateStore(path)
+        with store.save_batch():
+            store.save_epoch_state("sha256:" + "a" * 64, 1)
+            with store.save_batch():
+                store.save_roster(ActorRoster())
+            assert not path.exists()
+        assert StateStore(path).load_epoch_state() == ("sha256:" + "a" * 64, 1)
+
+    def test_batch_skips_write_when_block_raises(self, tmp_path: Path) -> None:
+        path = tmp_path / "state.json"
+        store = StateStore(path)
+        with pytest.raises(RuntimeError):
+            with store.save_batch():
+                store.save_epoch_state("sha256:" + "a" * 64, 1)
+                raise RuntimeError("boom")
+        assert not path.exists()
+        store.flush()
+        assert StateStore(path).load_epoch_state()[1] == 1
+
+
+class TestStateStoreAtomicWrite:
+    def test_failed_write_keeps_previous_state(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        import os
+
+        path = tmp_path / "state.json"
+        store = StateStore(path)
+        store.save_epoch_state("sha256:" + "a" * 64, 1)
+
+        def fail(src: object, dst: object) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", fail)
+        with pytest.raises(OSError):
+            store.save_epoch_state("sha256:" + "b" * 64, 2)
+        assert StateStore(path).load_epoch_state()[1] == 1
+
+    def test_fsync_flush_leaves_no_temp_file(self, tmp_path: Path) -> None:
+        store = StateStore(tmp_path / "state.json")
+        with store.save_batch():
+            store.save_epoch_state("sha256:" + "a" * 64, 1)
+        store.flush(fsync=True)
+        assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+
+    def test_unchanged_save_is_not_rewritten(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        import os
+
+        path = tmp_path / "state.json"
+        first = StateStore(path)
+        first.save_roster(ActorRoster())
+        first.save_epoch_state("sha256:" + "a" * 64, 1)
+
+        replaced: list[object] = []
+        real_replace = os.replace
+
+        def recording(src: object, dst: object) -> None:
+            replaced.append(dst)
+            real_replace(src, dst)
+
+        monkeypatch.setattr(os, "replace", recording)
+        store = StateStore(path)
+        store.save_epoch_state("sha256:" + "a" * 64, 1)
+        assert replaced == []
+        store.save_epoch_state("sha256:" + "b" * 64, 2)
+        assert replaced == [path]
+        assert StateStore(path).load_epoch_state()[1] == 2
+
+    def test_retry_after_failed_write_writes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        import os
+
+        path = tmp_path / "state.json"
+        store = StateStore(path)
+        store.save_epoch_state("sha256:" + "a" * 64, 1)
+        real_replace = os.replace
+
+        def fail(src: object, dst: object) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", fail)
+        with pytest.raises(OSError):
+            store.save_epoch_state("sha256:" + "b" * 64, 2)
+        monkeypatch.setattr(os, "replace", real_replace)
+        store.save_epoch_state("sha256:" + "b" * 64, 2)
+        assert StateStore(path).load_epoch_state()[1] == 2
+
+
+class TestStateStoreWriteAheadLog:
+    @pytest.fixture(autouse=True)
+    def _always_log(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from genesis.persistence import state_store as state_store_module
+
+        monkeypatch.setattr(state_store_module, "_WAL_MIN_STATE_BYTES", 0)
+
+    def _store(self, path: Path) -> StateStore:
+        store = StateStore(path)
+        with store.save_batch():
+            store.save_roster(ActorRoster())
+            store.save_missions({})
+            store.save_epoch_state("sha256:" + "a" * 64, 1)
+        return store
+
+    def test_changed_section_is_appended_not_rewritten(self, tmp_path: Path) -> None:
+        path = tmp_path / "state.json"
+        store = self._store(path)
+        before = path.read_bytes()
+
+        store.save_epoch_state("sha256:" + "b" * 64, 2)
+        assert path.read_bytes() == before
+        wal = (tmp_path / "state.wal.jsonl").read_text(encoding="utf-8")
+        assert wal.splitlines()[1].startswith('["epoch", ')
+        assert StateStore(path).load_epoch_state()[1] == 2
+
+    def test_log_is_folded_in_once_it_outgrows_the_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "state.json"
+        store = self._store(path)
+        wal_path = tmp_path / "state.wal.jsonl"
+        for i in range(2, 40):
+            store.save_epoch_state("sha256:" + "b" * 64, i)
+            assert not wal_path.exists() or (
+                wal_path.stat().st_size <= path.stat().st_size
+            )
+        assert StateStore(path).load_epoch_state()[1] == 39
+
+    def test_stale_log_is_ignored(self, tmp_path: Path) -> None:
+        path = tmp_path / "state.json"
+        wal_path = tmp_path / "state.wal.jsonl"
+        store = self._store(path)
+        store.save_epoch_state("sha256:" + "b" * 64, 2)
+        stale = wal_path.read_bytes()
+
+        store.flush(fsync=True)
+        assert not wal_path.exists()
+        store.save_epoch_state("sha256:" + "c" * 64, 3)
+        store.flush(fsync=True)
+        # A crash between the rewrite and the unlink leaves the old log.
+        wal_path.write_bytes(stale)
+        assert StateStore(path).load_epoch_state()[1] == 3
+
+    def test_torn_final_line_is_ignored(self, tmp_path: Path) -> None:
+        path = tmp_path / "state.json"
+        wal_path = tmp_path / "state.wal.jsonl"
+        store = self._store(path)
+        store.save_epoch_state("sha256:" + "b" * 64, 2)
+        with wal_path.open("ab") as f:
+            f.write(b'["epoch", {"committed_count": 3')
+
+        reloaded = StateStore(path)
+        assert reloaded.load_epoch_state()[1] == 2
+        reloaded.save_epoch_state("sha256:" + "d" * 64, 4)
+        assert not wal_path.exists()
+        assert StateStore(path).load_epoch_state()[1] == 4
+
+
+class TestStateStoreCompression:
+    def test_gz_path_round_trips_compressed(self, tmp_path: Path) -> None:
+        import gzip
+
+        path = tmp_path / "state.json.gz"
+        StateStore(path).save_epoch_state("sha256:" + "c" * 64, 5)
+        assert json.loads(gzip.decompress(path.read_bytes()))["epoch"]["committed_count"] == 5
+        assert StateStore(path).load_epoch_state() == ("sha256:" + "c" * 64, 5)
+
+    def test_compressed_state_loads_from_any_name(self, tmp_path: Path) -> None:
+        import gzip
+
+        path = tmp_path / "state.json"
+        path.write_bytes(gzip.compress(json.dumps(
+            {"epoch": {"previous_hash": "sha256:" + "d" * 64, "committed_count": 2}},
+        ).encode()))
+        assert StateStore(path).load_epoch_state()[1] == 2
+
+
+class TestStateStoreSections:
+    def test_file_has_one_section_per_line(self, tmp_path: Path) -> None:
+        path = tmp_path / "state.json"
+        store = StateStore(path)
+        store.save_epoch_state("sha256:" + "a" * 64, 3)
+        store.save_listings({}, {"L-1": []})
+        state = json.loads(path.read_bytes())
+        expected = ",\n".join(
+            f"{json.dumps(k)}: {json.dumps(v, ensure_ascii=False)}"
+            for k, v in sorted(state.items())
+        )
+        assert path.read_text(encoding="utf-8") == "{" + expected + "}"
+
+    def test_missions_are_encoded_per_mission(self, tmp_path: Path) -> None:
+        path = tmp_path / "state.json"
+        store = StateStore(path)
+        missions = {
+            mid: Mission(
+                mission_id=mid,
+                mission_title="Streamed",
+                mission_class=MissionClass.DOCUMENTATION_UPDATE,
+                risk_tier=RiskTier.R0,
+                domain_type=DomainType.OBJECTIVE,
+            )
+            for mid in ("M-2", "M-1", "M-10")
+        }
+        store.save_missions(missions)
+        assert "missions" not in store._state
+
+        text = path.read_text(encoding="utf-8")
+        section = json.loads(text)["missions"]
+        assert text == "{" + f'"missions": {json.dumps(section)}' + "}"
+        assert list(section) == ["M-1", "M-10", "M-2"]
+        assert set(store.load_missions()) == set(missions)
+
+    def test_output_independent_of_insertion_order(self, tmp_path: Path) -> None:
+        records = {
+            actor_id: TrustRecord(
+                actor_id=actor_id, actor_kind=ActorKind.HUMAN, score=0.5,
+            )
+            for actor_id in ("bob", "alice")
+        }
+        a, b = tmp_path / "a.json", tmp_path / "b.json"
+        StateStore(a).save_trust_records(records)
+        StateStore(b).save_trust_records(dict(reversed(records.items())))
+        assert a.read_bytes() == b.read_bytes()
+
+    def test_load_parses_only_requested_sections(self, tmp_path: Path) -> None:
+        path = tmp_path / "state.json"
+        store = StateStore(path)
+        store.save_roster(ActorRoster())
+        store.save_missions({})
+        store.save_epoch_state("sha256:" + "a" * 64, 1)
+        before = path.read_text(encoding="utf-8").split("\n")
+
+        store2 = StateStore(path)
+        assert store2.load_epoch_state()[1] == 1
+        store2.save_epoch_state("sha256:" + "b" * 64, 2)
+        assert set(store2._unparsed) == {"missions", "roster"}
+
+        after = path.read_text(encoding="utf-8").split("\n")
+        assert after[1:] == before[1:]
+        assert StateStore(path).load_epoch_state()[1] == 2
+
+    def test_save_reencodes_only_changed_section(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        from genesis.persistence import state_store as state_store_module
+
+        store = StateStore(tmp_path / "state.json")
+        store.save_roster(ActorRoster())
+        store.save_epoch_state("sha256:" + "a" * 64, 1)
+
+        encoded: list[object] = []
+        real = state_store_module._STATE_ENCODER
+
+        class Recording:
+            def encode(self, value: object) -> str:
+                encoded.append(value)
+                return real.encode(value)
+
+        monkeypatch.setattr(state_store_module, "_STATE_ENCODER", Recording())
+        store.save_epoch_state("sha256:" + "b" * 64, 2)
+        sections = [v for v in encoded if not isinstance(v, str)]
+        assert len(sections) == 1
+        assert sections[0]["committed_count"] == 2
+
+
+class TestStateStoreTimestamps:
+    def test_format_matches_strftime(self) -> None:
+        from genesis.persistence.state_store import _format_utc
+
+        ts = datetime(2026, 3, 4, 5, 6, 7, 890123, tzinfo=timezone.utc)
+        assert _format_utc(ts) == ts.strftime("%Y-%m-%dT%H:%M:%SZ")
+        assert _format_utc(ts.replace(tzinfo=None)) == "2026-03-04T05:06:07Z"
+        assert _format_utc(None) is None
+
+    def test_parse_round_trips_format(self) -> None:
+        from genesis.persistence.state_store import _format_utc, _parse_utc
+
+        ts = datetime(2026, 3, 4, 5, 6, 7, tzinfo=timezone.utc)
+        assert _parse_utc(_format_utc(ts)) == ts
+        assert _parse_utc(_format_utc(ts)).tzinfo is timezone.utc
+        assert _parse_utc(None) is None
+        assert _parse_utc("") is None
+        with pytest.raises(ValueError):
+            _parse_utc("2026-03-04T05:06:07+05:00")
+
+
+class TestStateStoreEnums:
+    def test_unknown_enum_value_still_raises_value_error(self, tmp_path: Path) -> None:
+        path = tmp_path / "state.json"
+        path.write_text(json.dumps({"bids": {"L-1": [{
+            "bid_id": "B-1", "listing_id": "L-1", "worker_id": "w",
+            "state": "no_such_state",
+        }]}}))
+        with pytest.raises(ValueError):
+            StateStore(path).load_listings()
+
+
+class TestStateStoreDefaults:
+    def test_default_fields_are_omitted_and_restored(self, tmp_path: Path) -> None:
+        path = tmp_path / "state.json"
+        store = StateStore(path)
+        record = TrustRecord(
+            actor_id="bob", actor_kind=ActorKind.MACHINE, score=0.4,
+        )
+        store.save_trust_records({"bob": record})
+
+        columns = json.loads(path.read_text())["trust_records"]
+        assert columns["actor_id"] == ["bob"]
+        assert "quality" not in columns
+        assert "last_active_utc" not in columns
+        assert "domain_scores" not in columns
+
+        loaded = StateStore(path).load_trust_records()["bob"]
+        assert loaded.score == 0.4
+        assert loaded.quality == 0.0
+        assert loaded.quarantined is False
+        assert loaded.last_active_utc is None
+        assert loaded.domain_scores == {}
+
+
 class TestStateStoreEmpty:
     def test_empty_store(self, tmp_path: Path) -> None:
         store = StateStore(tmp_path / "nonexistent.json")
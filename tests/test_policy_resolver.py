@@ -1,5 +1,6 @@
 """Tests for the policy resolver — proves it loads and resolves all config correctly."""
 
+import json
 import pytest
 from pathlib import Path
 
@@ -29,6 +30,17 @@ class TestMissionClassToTier:
     def test_constitutional_maps_to_r3(self, resolver: PolicyResolver) -> None:
         assert resolver.resolve_tier(MissionClass.CONSTITUTIONAL_CHANGE) == RiskTier.R3
 
+    def test_unmapped_class_raises(self, resolver: PolicyResolver) -> None:
+        with pytest.raises(ValueError, match="leave_adjudication"):
+            resolver.resolve_tier(MissionClass.LEAVE_ADJUDICATION)
+
+    def test_unknown_tier_in_config_fails_at_load(self) -> None:
+        with pytest.raises(ValueError):
+            PolicyResolver(
+                params={"version": "1.0"},
+                policy={"version": "1.0", "mission_class_to_tier": {"documentation_update": "R9"}},
+            )
+
 
 class TestTierPolicy:
     def test_r0_basic(self, resolver: PolicyResolver) -> None:
@@ -53,6 +65,14 @@ class TestTierPolicy:
         assert p.constitutional_flow is True
         assert p.human_final_gate is True
 
+    def test_compiled_once(self, resolver: PolicyResolver) -> None:
+        assert resolver.tier_policy(RiskTier.R1) is resolver.tier_policy(RiskTier.R1)
+
+    def test_unconfigured_tier_raises(self) -> None:
+        bare = PolicyResolver(params={"version": "1.0"}, policy={"version": "1.0"})
+        with pytest.raises(ValueError, match="R0"):
+            bare.tier_policy(RiskTier.R0)
+
 
 class TestTrustWeights:
     def test_weights_sum_to_one(self, resolver: PolicyResolver) -> None:
@@ -72,6 +92,17 @@ class TestTrustWeights:
         assert w_e <= 0.10
         assert w_e >= 0.0
 
+    def test_flattened_at_load(self, resolver: PolicyResolver) -> None:
+        tw = resolver._params["trust_weights"]
+        assert resolver.trust_weights() == (tw["w_Q"], tw["w_R"], tw["w_V"], tw["w_E"])
+        assert resolver.trust_weights() is resolver.trust_weights()
+
+    def test_bare_resolver(self) -> None:
+        bare = PolicyResolver(params={"version": "1.0"}, policy={"version": "1.0"})
+        with pytest.raises(ValueError, match="trust_weights"):
+            bare.trust_weights()
+        assert bare.half_life_days(is_machine=True) == 365.0
+
 
 class TestConstitutionalVoting:
     def test_machine_weight_zero(self, resolver: PolicyResolver) -> None:
@@ -91,6 +122,16 @@ class TestEligibility:
         assert 0.0 < tau_prop < 1.0
 
 
+class TestValidTypes:
+    def test_method_types_frozen_and_shared(self, resolver: PolicyResolver) -> None:
+        methods = resolver.valid_method_types()
+        assert isinstance(methods, frozenset)
+        assert resolver.valid_method_types() is methods
+
+    def test_domain_types_match_config(self, resolver: PolicyResolver) -> None:
+        assert resolver.valid_domain_types() == frozenset(resolver._policy["valid_domain_types"])
+
+
 class TestGenesisChambers:
     def test_g1_chambers_exist(self, resolver: PolicyResolver) -> None:
         chambers = resolver.chambers_for_phase(GenesisPhase.G1)
@@ -120,6 +161,12 @@ class TestGenesisChambers:
         with pytest.raises(ValueError, match="G0"):
             resolver.chambers_for_phase(GenesisPhase.G0)
 
+    def test_chambers_shared_and_read_only(self, resolver: PolicyResolver) -> None:
+        chambers = resolver.chambers_for_phase(GenesisPhase.G2)
+        assert resolver.chambers_for_phase(GenesisPhase.G2) is chambers
+        with pytest.raises(TypeError):
+            chambers[ChamberKind.PROPOSAL] = chambers[ChamberKind.CHALLENGE]
+
 
 class TestGeoConstraints:
     def test_constraints_get_stricter(self, resolver: PolicyResolver) -> None:
@@ -161,6 +208,19 @@ class TestEffortThresholds:
         et = resolver.effort_thresholds()
         assert et["E_suspicious_low"] < et["E_min_per_tier"]["R0"]
 
+    def test_returns_fresh_dict(self, resolver: PolicyResolver) -> None:
+        et = resolver.effort_thresholds()
+        assert type(et) is dict
+        et["E_max_credit"] = 2.0
+        assert resolver.effort_thresholds() is not et
+        assert resolver.effort_thresholds()["E_max_credit"] != 2.0
+        json.dumps(et)
+
+    def test_missing_section_fails_loud(self) -> None:
+        bare = PolicyResolver(params={"version": "1.0"}, policy={"version": "1.0"})
+        with pytest.raises(ValueError, match="effort_thresholds"):
+            bare.effort_thresholds()
+
 
 class TestCommitmentTiers:
     def test_epoch_positive(self, resolver: PolicyResolver) -> None:
@@ -175,3 +235,30 @@ class TestCommitmentTiers:
         n, t = resolver.commitment_committee()
         assert t > n // 2
         assert t <= n
+
+
+class TestFromConfigDir:
+    def test_optional_files_absent(self, tmp_path: Path) -> None:
+        for name in ("constitutional_params.json", "runtime_policy.json"):
+            (tmp_path / name).write_text((CONFIG_DIR / name).read_text())
+        resolver = PolicyResolver.from_config_dir(tmp_path)
+        assert not resolver.has_skill_taxonomy()
+        assert not resolver.has_skill_trust_config()
+        assert not resolver.has_market_config()
+        assert not resolver.has_skill_lifecycle_config()
+        assert not resolver.has_leave_config()
+
+    def test_optional_files_present(self, resolver: PolicyResolver) -> None:
+        assert resolver.has_skill_taxonomy()
+        assert resolver.has_leave_config()
+
+    def test_truncated_section_fails_at_load(self, resolver: PolicyResolver) -> None:
+        params = dict(resolver._params)
+        params["quality_assessment"] = dict(params["quality_assessment"])
+        params["quality_assessment"]["worker_weights"] = {"consensus": 1.0}
+        with pytest.raises(ValueError, match="quality_assessment.worker_weights.evidence"):
+            PolicyResolver(params, resolver._policy)
+
+    def test_missing_required_file(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError, match="constitutional_params.json"):
+            PolicyResolver.from_config_dir(tmp_path)
@@ -347,6 +347,29 @@ class TestWorkerQuality:
         assert details["weights"]["consensus"] == pytest.approx(0.60)
         assert details["mission_state"] == "approved"
 
+    def test_batch_matches_single_assessment(self, engine: QualityEngine) -> None:
+        """Batch derivation agrees with per-mission assessment."""
+        missions = [
+            _approved_mission(tier=RiskTier.R2, evidence_count=3),
+            _rejected_mission(tier=RiskTier.R1, evidence_count=2),
+            _approved_mission(tier=RiskTier.R3, evidence_count=3),
+        ]
+        records = _default_trust_records()
+        singles = [
+            engine.assess_mission(m, records).worker_assessment
+            for m in missions
+        ]
+        batch = engine.derive_worker_quality_batch(
+            [a.consensus_score for a in singles],
+            [a.evidence_score for a in singles],
+            [a.complexity_factor for a in singles],
+        )
+        assert batch == pytest.approx([a.derived_quality for a in singles])
+
+    def test_batch_rejects_ragged_input(self, engine: QualityEngine) -> None:
+        with pytest.raises(ValueError):
+            engine.derive_worker_quality_batch([1.0], [1.0, 0.5], [1.0])
+
 
 # ===================================================================
 # Reviewer alignment
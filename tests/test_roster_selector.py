@@ -113,6 +113,33 @@ class TestRosterRegistration:
         roster.remove("alice")
         assert roster.get("alice") is None
 
+    def test_diversity_bits_assigned(self) -> None:
+        roster = ActorRoster()
+        roster.register(_entry("alice", region="EU", org="OrgA"))
+        roster.register(_entry("bob", region="EU", org="OrgB"))
+        alice, bob = roster.get("alice"), roster.get("bob")
+        assert alice.region_bit == bob.region_bit != 0
+        assert alice.organization_bit != bob.organization_bit
+        assert bin(alice.organization_bit).count("1") == 1
+
+    def test_diversity_bits_per_roster(self) -> None:
+        first, second = ActorRoster(), ActorRoster()
+        first.register(_entry("alice", region="EU", org="OrgA"))
+        second.register(_entry("bob", region="US", org="OrgB"))
+        assert first.get("alice").organization_bit == 1
+        assert second.get("bob").organization_bit == 1
+        assert first.get("alice").diversity_bits is not second.get("bob").diversity_bits
+
+    def test_diversity_bits_follow_field_changes(self) -> None:
+        roster = ActorRoster()
+        roster.register(_entry("alice", region="EU", org="OrgA"))
+        roster.register(_entry("bob", region="US", org="OrgB"))
+        alice, bob = roster.get("alice"), roster.get("bob")
+        alice.organization = "OrgB"
+        alice.region = "US"
+        assert alice.organization_bit == bob.organization_bit
+        assert alice.region_bit == bob.region_bit
+
 
 class TestRosterFiltering:
     def test_excludes_quarantined(self) -> None:
@@ -389,6 +389,21 @@ class TestPersistenceWiring:
         assert svc2.get_mission("M-P") is not None
         assert svc2.get_trust("alice") is not None
 
+    def test_close_releases_event_log(self, resolver: PolicyResolver, tmp_path: Path) -> None:
+        """Closing the service writes buffered events and closes the file."""
+        event_log = EventLog(
+            storage_path=tmp_path / "events.jsonl", write_buffer_bytes=1 << 20,
+        )
+        with GenesisService(resolver, event_log=event_log) as svc:
+            svc.open_epoch("close-epoch")
+            svc.create_mission(
+                mission_id="M-CLOSE", title="Close test",
+                mission_class=MissionClass.DOCUMENTATION_UPDATE,
+                domain_type=DomainType.OBJECTIVE,
+            )
+        assert event_log._fh is None
+        assert EventLog(storage_path=tmp_path / "events.jsonl").count == event_log.count > 0
+
     def test_event_log_records_durably(self, resolver: PolicyResolver, tmp_path: Path) -> None:
         """Events written to durable log file."""
         event_log = EventLog(storage_path=tmp_path / "events.jsonl")
@@ -208,6 +208,28 @@ class TestMissionSkillRequirementPersistence:
         assert r1.minimum_proficiency == pytest.approx(0.3)
         assert r1.required is False
 
+    def test_repeated_skill_ids_share_one_instance(self, tmp_path: Path) -> None:
+        """The same canonical skill string parses to a shared SkillId."""
+        req = SkillRequirement(skill_id=SkillId("software_engineering", "python"))
+        missions = {
+            mid: Mission(
+                mission_id=mid,
+                mission_title="Shared Skill",
+                mission_class=MissionClass.DOCUMENTATION_UPDATE,
+                risk_tier=RiskTier.R0,
+                domain_type=DomainType.OBJECTIVE,
+                skill_requirements=[req],
+            )
+            for mid in ("M-1", "M-2")
+        }
+        StateStore(tmp_path / "state.json").save_missions(missions)
+
+        loaded = StateStore(tmp_path / "state.json").load_missions()
+        a = loaded["M-1"].skill_requirements[0].skill_id
+        b = loaded["M-2"].skill_requirements[0].skill_id
+        assert a == SkillId("software_engineering", "python")
+        assert a is b
+
 
 # ===================================================================
 # Service-level skill management integration
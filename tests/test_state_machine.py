@@ -190,3 +190,54 @@ class TestHumanGate:
         mission.state = MissionState.REVIEW_COMPLETE
         errors = sm.transition(mission, MissionState.APPROVED)
         assert errors == []
+
+
+class TestMissionLookups:
+    def test_reviewer_lookup(self) -> None:
+        m = _make_r0_mission()
+        m.reviewers = [_make_reviewer("r1"), _make_reviewer("r2")]
+        assert m.reviewer("r2").id == "r2"
+        assert m.reviewer("missing") is None
+
+    def test_first_decision_wins(self) -> None:
+        m = _make_r0_mission()
+        first = ReviewDecision(reviewer_id="r1", decision=ReviewDecisionVerdict.APPROVE)
+        m.review_decisions.append(first)
+        m.review_decisions.append(
+            ReviewDecision(reviewer_id="r1", decision=ReviewDecisionVerdict.REJECT)
+        )
+        assert m.decision_for("r1") is first
+
+    def test_index_tracks_pop_and_append(self) -> None:
+        m = _make_r0_mission()
+        m.review_decisions.append(
+            ReviewDecision(reviewer_id="r1", decision=ReviewDecisionVerdict.APPROVE)
+        )
+        assert m.decision_for("r1") is not None
+        m.review_decisions.pop()
+        m.review_decisions.append(
+            ReviewDecision(reviewer_id="r2", decision=ReviewDecisionVerdict.APPROVE)
+        )
+        assert m.decision_for("r1") is None
+        assert m.decision_for("r2") is not None
+
+    def test_index_tracks_in_place_replacement(self) -> None:
+        m = _make_r0_mission()
+        m.reviewers = [_make_reviewer("r1"), _make_reviewer("r2"), _make_reviewer("r3")]
+        assert m.reviewer("r2").id == "r2"
+        replacement = _make_reviewer("r2")
+        m.reviewers[1] = replacement
+        assert m.reviewer("r2") is replacement
+        m.reviewers[1] = _make_reviewer("r4")
+        assert m.reviewer("r2") is None
+        assert m.reviewer("r4").id == "r4"
+
+    def test_index_tracks_remove_and_insert(self) -> None:
+        m = _make_r0_mission()
+        m.reviewers = [_make_reviewer("r1"), _make_reviewer("r2"), _make_reviewer("r3")]
+        assert m.reviewer("r1").id == "r1"
+        m.reviewers.remove(m.reviewers[0])
+        m.reviewers.insert(1, _make_reviewer("r5"))
+        assert m.reviewer("r1") is None
+        assert m.reviewer("r5") is m.reviewers[1]
+        assert m.reviewer("r3") is m.reviewers[2]